@@ -0,0 +1,57 @@
+"""Benchmark binary stats format against json
+
+Serialize every champion of the test match after parsing it `N_COPIES` times.
+
+    pip install -e . && python benchmarks/bench_binary.py
+"""
+import json
+import timeit
+import tft_parse
+from tft_parse import binary
+
+N_COPIES = 100
+NUMBER = 50
+
+
+def json_dumps(champions):
+    return json.dumps([champion.to_dict() for champion in champions])
+
+
+def json_loads(data):
+    output = []
+    for champion_dict in json.loads(data):
+        champion = tft_parse.Champion(champion_dict['championId'], 4)
+        champion.from_dict(champion_dict)
+        output.append(champion)
+    return output
+
+
+def report(name, stmt):
+    seconds = timeit.timeit(stmt, number=NUMBER)
+    print(f"{name:<24} {seconds / NUMBER * 1e3:>10.3f} ms")
+
+
+if __name__ == '__main__':
+    with open('tests/data/tft_api/match.json', 'r') as f:
+        data = json.load(f)
+    # Vary item combinations so counters have more keys
+    matches = []
+    for i in range(N_COPIES):
+        match = tft_parse.MatchDto(data)
+        for unit in match.info.players_units():
+            unit.items = sorted([(item + i) % 60 + 1 for item in unit.items])
+        matches.append(match)
+    champion_ids = {unit.character_id for unit in matches[0].info.players_units()}
+    champions = [tft_parse.Champion(championId, 4) for championId in champion_ids]
+    tft_parse.stream.feed(matches, champions)
+
+    json_data = json_dumps(champions)
+    binary_data = binary.dumps(champions)
+    print(f"{len(champions)} champions")
+    print(f"{'json size':<24} {len(json_data.encode()):>10,} bytes")
+    print(f"{'binary size':<24} {len(binary_data):>10,} bytes")
+    report('json dumps', lambda: json_dumps(champions))
+    report('binary dumps', lambda: binary.dumps(champions))
+    report('json loads', lambda: json_loads(json_data))
+    report('binary loads', lambda: binary.loads(binary_data))
+    report('binary view (no copy)', lambda: binary.StatsView(binary_data).arrays('item_comb'))
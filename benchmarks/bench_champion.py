@@ -0,0 +1,24 @@
+"""Benchmark Champion.parse_unit throughput
+
+    pip install -e . && python benchmarks/bench_champion.py
+"""
+import json
+import timeit
+import tft_parse
+
+NUMBER = 200
+
+
+if __name__ == '__main__':
+    with open('tests/data/tft_api/match.json', 'r') as f:
+        match = tft_parse.MatchDto(json.load(f))
+    units = match.info.players_units()
+    champions = {unit.character_id: tft_parse.Champion(unit.character_id, 4) for unit in units}
+
+    def parse():
+        for unit in units:
+            champions[unit.character_id].parse_unit(unit)
+
+    seconds = timeit.timeit(parse, number=NUMBER)
+    n_units = len(units) * NUMBER
+    print(f"Champion.parse_unit {n_units / seconds:>12,.0f} units/s ({seconds / n_units * 1e6:.2f} us/unit)")
@@ -0,0 +1,104 @@
+"""Benchmark header-only parsing throughput (MetadataDto and InfoDto with lazy participants)
+
+Compare the previous per-call regex / dict construction with the precompiled patterns, cached
+game_version -> patch and constant lookup tables.
+
+    pip install -e . && python benchmarks/bench_header.py
+"""
+import json
+import re
+import time
+import tft_parse
+from tft_parse.tft_api_class import parse_patch
+
+N_MATCHES = 100000
+N_PATCHES = 20
+
+
+def previous_get_region(match_id):
+    region_regex = re.findall(r'(.*?)_', match_id)
+    if len(region_regex) > 0:
+        return region_regex[0]
+    else:
+        raise ValueError(f"Unable to regex match {match_id}")
+
+
+def previous_route_region(region):
+    region = region.upper()
+    if region in ['NA1', 'BR1', 'LA1', 'LA2', 'OC1']:
+        return 'AMERICAS'
+    elif region in ['KR', 'JP1']:
+        return 'ASIA'
+    elif region in ['EUN1', 'EUW1', 'TR1', 'RU']:
+        return 'EUROPE'
+    else:
+        raise ValueError(f"{region} is not defined")
+
+
+def previous_get_patch(game_version):
+    patch_regex = re.findall(r'<Releases/(.*?)>', game_version)
+    if len(patch_regex) > 0:
+        return patch_regex[0]
+    else:
+        raise ValueError(f"Unable to regex match {game_version}")
+
+
+def previous_get_queue(queue_id):
+    queue_id = int(queue_id)
+    queue_dict = {
+        1090: 'Normal',
+        1100: 'Rank',
+        1111: 'Test',
+        1110: 'Tutorial'
+    }
+    return queue_dict[queue_id]
+
+
+def previous_header(match):
+    """Previous header parsing cost, without building the DTOs"""
+    region = previous_get_region(match['metadata']['match_id'])
+    return region, previous_route_region(region), previous_get_patch(match['info']['game_version']), \
+        previous_get_queue(match['info']['queue_id'])
+
+
+def header(match):
+    """Header parsing cost, without building the DTOs"""
+    metadata = tft_parse.MetadataDto.__new__(tft_parse.MetadataDto)
+    metadata.match_id = match['metadata']['match_id']
+    region = metadata.get_region()
+    return region, tft_parse.route_region(region), parse_patch(match['info']['game_version']), \
+        tft_parse.tft_api_class.queues[int(match['info']['queue_id'])]
+
+
+def generate(match, n):
+    """Matches from a few regions, patches and queues"""
+    output = []
+    game_version = match['info']['game_version']
+    for i in range(n):
+        record = {
+            'metadata': dict(match['metadata'], match_id=f"{tft_parse.regions[i % len(tft_parse.regions)]}_{i}"),
+            'info': dict(match['info'], game_version=game_version.replace('10.20', f"10.{i % N_PATCHES + 1}"),
+                         queue_id=[1090, 1100][i % 2]),
+        }
+        output.append(record)
+    return output
+
+
+def report(name, function, matches):
+    start = time.perf_counter()
+    for match in matches:
+        function(match)
+    seconds = time.perf_counter() - start
+    print(f"{name:<30} {len(matches) / seconds:>12,.0f} matches/s")
+
+
+if __name__ == '__main__':
+    with open('tests/data/tft_api/match.json') as f:
+        match = json.load(f)
+    matches = generate(match, N_MATCHES)
+    assert all(previous_header(match) == header(match) for match in matches[:1000])
+    print(f"{N_MATCHES} matches, {N_PATCHES} distinct game_version")
+    report('Before (header fields)', previous_header, matches)
+    report('After (header fields)', header, matches)
+    report('MatchDto(lazy=True)', lambda match: tft_parse.MatchDto(match, keep_data=False, lazy=True), matches)
+    print(parse_patch.cache_info())
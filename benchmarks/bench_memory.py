@@ -0,0 +1,30 @@
+"""Benchmark memory used per parsed MatchDto
+
+Parse 10k matches and report traced bytes per match kept in memory, with and without the raw data.
+
+    pip install -e . && python benchmarks/bench_memory.py
+"""
+import gc
+import json
+import tracemalloc
+import tft_parse
+
+N_MATCHES = 10000
+
+
+def measure(raw: str, keep_data: bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    matches = [tft_parse.MatchDto(json.loads(raw), keep_data=keep_data) for _ in range(N_MATCHES)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del matches
+    return current / N_MATCHES
+
+
+if __name__ == '__main__':
+    with open('tests/data/tft_api/match.json', 'r') as f:
+        raw = f.read()
+    print(f"{N_MATCHES} matches")
+    print(f"keep_data=True  {measure(raw, True):>10,.0f} bytes/match")
+    print(f"keep_data=False {measure(raw, False):>10,.0f} bytes/match")
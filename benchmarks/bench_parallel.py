@@ -0,0 +1,61 @@
+"""Benchmark parse_many() and reduce_many() throughput with several workers
+
+The parent of parse_many() unpickles and rebuilds every MatchDto, so its cost per match bounds the speedup
+whatever the number of workers. reduce_many() only receives accumulators and should keep scaling.
+
+    pip install -e . && python benchmarks/bench_parallel.py
+    python benchmarks/bench_parallel.py --matches 20000 --workers 2 4 8
+"""
+import argparse
+import json
+import os
+import pickle
+import time
+from functools import partial
+import tft_parse
+from tft_parse.parallel import pack, unpack, parse_many, reduce_many
+from tft_parse.synthetic import generate_matches
+
+
+def report(name: str, n: int, seconds: float, baseline: float = None):
+    speedup = f" {baseline / seconds:>7.2f}x" if baseline else ''
+    print(f"{name:<32} {n / seconds:>12,.0f} matches/s {seconds / n * 1e6:>9.1f} us/match{speedup}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--matches', type=int, default=5000)
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({2, 4, os.cpu_count()}))
+    parser.add_argument('--set', default='4.5')
+    args = parser.parse_args()
+    raw = [json.dumps(data).encode() for data in generate_matches(args.matches, args.set)]
+    n = len(raw)
+    print(f"{n:,} matches, {os.cpu_count()} CPUs")
+
+    # Per match cost of a worker and of the parent of parse_many()
+    start = time.perf_counter()
+    matches = [tft_parse.MatchDto.from_bytes(record, keep_data=False) for record in raw]
+    serial = time.perf_counter() - start
+    report('worker: decode + parse', n, serial)
+    payload = pickle.dumps(pack(matches))
+    start = time.perf_counter()
+    unpack(pickle.loads(payload))
+    report('parent: unpickle + unpack', n, time.perf_counter() - start)
+
+    factory = partial(tft_parse.MetaAggregator, args.set)
+    start = time.perf_counter()
+    reduce_many(raw, factory, backend='serial')
+    reduce_serial = time.perf_counter() - start
+    report('reduce_many serial', n, reduce_serial)
+    for workers in args.workers:
+        start = time.perf_counter()
+        for _ in parse_many(raw, workers=workers, ordered=False):
+            pass
+        report(f'parse_many {workers} workers', n, time.perf_counter() - start, serial)
+        start = time.perf_counter()
+        reduce_many(raw, factory, workers=workers)
+        report(f'reduce_many {workers} workers', n, time.perf_counter() - start, reduce_serial)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark Champion / Item / Traits construction cost
+
+Compare loading the json file per object (previous behaviour) with the StaticData registry.
+
+    pip install -e . && python benchmarks/bench_static_data.py
+"""
+import json
+import timeit
+import pkg_resources
+from pathlib import Path
+import tft_parse
+
+NUMBER = 1000
+
+
+def champion_from_file(championId, tft_set_number):
+    """Previous Champion.__init__ lookup"""
+    champion_json = Path(pkg_resources.resource_filename('tft_parse', f'data/{tft_set_number}/champions.json'))
+    with open(champion_json) as f:
+        champions = json.load(f)
+    return [champion for champion in champions if champion.get('championId') == championId][0]
+
+
+def item_from_file(id, tft_set_number):
+    """Previous Item.__init__ lookup"""
+    items_json = Path(pkg_resources.resource_filename('tft_parse', f'data/{tft_set_number}/items.json'))
+    with open(items_json, 'r') as f:
+        items = json.loads(f.read())
+    return [item for item in items if item.get('id') == id][0]
+
+
+def traits_from_file(tft_set_number):
+    """Previous Traits.__init__ lookup"""
+    data_path = Path(pkg_resources.resource_filename('tft_parse', f'data/{tft_set_number}'))
+    with open(data_path.joinpath('traits.json')) as f:
+        return json.load(f)
+
+
+def report(name, stmt):
+    seconds = timeit.timeit(stmt, number=NUMBER)
+    print(f"{name:<20} {seconds / NUMBER * 1e6:>10.2f} us/object")
+
+
+if __name__ == '__main__':
+    print('Before (json load per object)')
+    report('Champion', lambda: champion_from_file('TFT4_Aatrox', 4))
+    report('Item', lambda: item_from_file(11, 4))
+    report('Traits', lambda: traits_from_file(4))
+    print('After (StaticData registry)')
+    report('Champion', lambda: tft_parse.Champion('TFT4_Aatrox', 4))
+    report('Item', lambda: tft_parse.Item(11, 4))
+    report('Traits', lambda: tft_parse.Traits(4))
@@ -0,0 +1,152 @@
+"""Benchmark suite over synthetic matches
+
+Runs each case at each scale (number of matches) in its own forked process and reports throughput and peak
+memory. Inputs cycle through a pool of distinct synthetic matches (tft_parse.synthetic), so large scales do
+not need to be held in memory. Save results with --output and compare runs to catch regressions.
+
+    pip install -e . && python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --scales 1000 100000 --cases match champion --output results.json
+    python benchmarks/bench_suite.py --scales 1000 100000 --baseline results.json
+"""
+import argparse
+import json
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+import tft_parse
+from tft_parse.synthetic import generate_matches
+
+SCALES = [1000, 100000, 1000000]
+POOL_SIZE = 1000
+# Set by main() before forking
+pool = {}
+
+
+def case_match(n: int) -> int:
+    """MatchDto parsing from json bytes"""
+    raw = pool['raw']
+    for i in range(n):
+        tft_parse.MatchDto.from_bytes(raw[i % len(raw)], keep_data=False)
+    return n
+
+
+def case_champion(n: int) -> int:
+    """Champion.parse_unit() of every unit"""
+    matches = pool['matches']
+    champions = {championId: tft_parse.Champion(championId, pool['set']) for championId in pool['champion_ids']}
+    units = 0
+    for i in range(n):
+        for unit in matches[i % len(matches)].info.players_units():
+            champions[unit.character_id].parse_unit(unit)
+            units += 1
+    return units
+
+
+def case_item(n: int) -> int:
+    """Item.parse_unit() of every item held by every unit"""
+    matches = pool['matches']
+    items = {id: tft_parse.Item(id, pool['set']) for id in pool['item_ids']}
+    units = 0
+    for i in range(n):
+        for unit in matches[i % len(matches)].info.players_units():
+            for id in set(unit.items):
+                items[id].parse_unit(unit)
+            units += 1
+    return units
+
+
+def case_trait(n: int) -> int:
+    """TraitDto construction, which resolves the trait tier name"""
+    data = pool['data']
+    tft_set_number = pool['set']
+    traits = 0
+    for i in range(n):
+        for participant in data[i % len(data)]['info']['participants']:
+            for trait in participant['traits']:
+                tft_parse.TraitDto(trait, tft_set_number)
+                traits += 1
+    return traits
+
+
+def case_serialize(n: int) -> int:
+    """MatchDto.to_dict() encoded to json"""
+    matches = pool['matches']
+    size = 0
+    for i in range(n):
+        size += len(json.dumps(matches[i % len(matches)].to_dict()))
+    return size
+
+
+cases = {
+    'match': (case_match, 'matches'),
+    'champion': (case_champion, 'units'),
+    'item': (case_item, 'units'),
+    'trait': (case_trait, 'traits'),
+    'serialize': (case_serialize, 'bytes'),
+}
+
+
+def peak_rss() -> int:
+    """Peak resident memory of this process in bytes (Linux reports KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run(name: str, n: int) -> dict:
+    """Run one case, called in a forked process"""
+    function, unit = cases[name]
+    start_rss = peak_rss()
+    start = time.perf_counter()
+    count = function(n)
+    seconds = time.perf_counter() - start
+    return {
+        'case': name, 'matches': n, 'seconds': seconds, 'matches_per_s': n / seconds,
+        'unit': unit, 'per_s': count / seconds, 'peak_mb': (peak_rss() - start_rss) / 2 ** 20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES)
+    parser.add_argument('--cases', nargs='+', choices=list(cases), default=list(cases))
+    parser.add_argument('--set', default=tft_parse.current_tft_set)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Write results as json')
+    parser.add_argument('--baseline', help='Results json of a previous run to compare throughput with')
+    args = parser.parse_args()
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = {(result['case'], result['matches']): result for result in json.load(f)['results']}
+
+    # Input pool, inherited by the forked processes
+    pool['set'] = args.set
+    pool['data'] = list(generate_matches(POOL_SIZE, args.set, args.seed))
+    pool['raw'] = [json.dumps(data).encode() for data in pool['data']]
+    pool['matches'] = [tft_parse.MatchDto(json.loads(raw)) for raw in pool['raw']]
+    static_data = tft_parse.StaticData.get(args.set)
+    pool['champion_ids'] = list(static_data.champions)
+    pool['item_ids'] = list(static_data.items)
+
+    results = []
+    print(f"{'case':<10} {'matches':>10} {'seconds':>9} {'matches/s':>12} {'throughput':>22} {'peak MB':>9}"
+          f"{' vs baseline' if baseline else ''}")
+    for name in args.cases:
+        for n in args.scales:
+            # Fresh process per case so peak memory is not shared
+            with ProcessPoolExecutor(1, mp_context=get_context('fork')) as executor:
+                result = executor.submit(run, name, n).result()
+            results.append(result)
+            throughput = f"{result['per_s']:,.0f} {result['unit']}/s"
+            previous = baseline.get((name, n))
+            ratio = f" {result['per_s'] / previous['per_s']:>11.2f}x" if previous else ''
+            print(f"{name:<10} {n:>10,} {result['seconds']:>9.2f} {result['matches_per_s']:>12,.0f} "
+                  f"{throughput:>22} {result['peak_mb']:>9.1f}{ratio}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'set': args.set, 'seed': args.seed, 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
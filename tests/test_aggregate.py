@@ -0,0 +1,87 @@
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from tft_parse import aggregate, stream
+
+
+class TestAggregate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            cls.data = json.load(f)
+        cls.champion_ids = ['TFT4_Jax', 'TFT4_Fiora']
+        cls.item_ids = [15, 25]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        # 5 files with 1 to 5 matches
+        for i in range(1, 6):
+            self.path.joinpath(f'{i}.jsonl').write_text((json.dumps(self.data) + '\n') * i)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_shard_files(self):
+        """Test shards are balanced by file size"""
+        files = list(stream.iter_files(self.path))
+        shards = aggregate.shard_files(files, 2)
+        self.assertEqual(len(shards), 2)
+        self.assertEqual(sorted(file.name for shard in shards for file in shard), [f'{i}.jsonl' for i in range(1, 6)])
+        self.assertEqual(sorted(len(shard) for shard in shards), [2, 3])
+        # Do not return empty shards
+        self.assertEqual(len(aggregate.shard_files(files[:1], 4)), 1)
+
+    def test_aggregate(self):
+        """Test parallel result is the same as serial"""
+        champions, items = aggregate.aggregate(self.path, self.champion_ids, self.item_ids, 4, workers=2)
+        expected_champions, expected_items = aggregate.aggregate_shard(
+            list(stream.iter_files(self.path)), self.champion_ids, self.item_ids, 4)
+        for championId in self.champion_ids:
+            self.assertEqual(champions[championId].to_dict(), expected_champions[championId].to_dict())
+        for id in self.item_ids:
+            self.assertEqual(items[id].to_dict(), expected_items[id].to_dict())
+        self.assertGreater(champions['TFT4_Jax'].champion_occurrence, 0)
+
+    def assert_same(self, source, **kwargs):
+        """Test parallel result of source is the same as serial"""
+        champions, items = aggregate.aggregate(source, self.champion_ids, self.item_ids, 4, **kwargs)
+        expected_champions, expected_items = aggregate.aggregate_shard(
+            list(stream.iter_files(source)), self.champion_ids, self.item_ids, 4)
+        for championId in self.champion_ids:
+            self.assertEqual(champions[championId].to_dict(), expected_champions[championId].to_dict())
+        for id in self.item_ids:
+            self.assertEqual(items[id].to_dict(), expected_items[id].to_dict())
+
+    def test_single_file(self):
+        """Test one large jsonl file is split into record level tasks"""
+        path = self.path.joinpath('day.jsonl')
+        path.write_text((json.dumps(self.data) + '\n') * 20)
+        tasks = list(aggregate.tasks([path], workers=2))
+        self.assertEqual(len(tasks), 8)
+        self.assertTrue(all(task[0] == aggregate.RANGE for task in tasks))
+        self.assertEqual(sum(len(list(stream.iter_range(*task[1:]))) for task in tasks), 20)
+        self.assert_same(path, workers=2)
+
+    def test_gzip(self):
+        """Test gzip'd line files are sent to workers in batches of lines"""
+        path = self.path.joinpath('day.jsonl.gz')
+        with gzip.open(path, 'wt') as f:
+            f.write((json.dumps(self.data) + '\n') * 5)
+        tasks = list(aggregate.tasks([path], workers=2, batch_size=2))
+        self.assertEqual([task[0] for task in tasks], [aggregate.LINES] * 3)
+        self.assertEqual([len(task[1]) for task in tasks], [2, 2, 1])
+        self.assert_same(path, workers=2, batch_size=2)
+
+    def test_mixed(self):
+        """Test plain, gzip'd and single match files together"""
+        with gzip.open(self.path.joinpath('6.jsonl.gz'), 'wt') as f:
+            f.write((json.dumps(self.data) + '\n') * 3)
+        self.path.joinpath('7.json').write_text(json.dumps(self.data))
+        self.assert_same(self.path, workers=3, batch_size=2)
+
+    def test_incorrect_input(self):
+        with self.assertRaises(ValueError):
+            aggregate.aggregate('-', self.champion_ids, self.item_ids, 4)
@@ -0,0 +1,92 @@
+import json
+import unittest
+from collections import Counter
+import tft_parse
+
+try:
+    import numpy
+    from tft_parse.batch import MatchBatch
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestMatchBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            cls.data = json.load(f)
+        cls.match = tft_parse.MatchDto(cls.data)
+        cls.batch = MatchBatch([cls.match, tft_parse.MatchDto(cls.data)])
+        cls.units = [
+            (unit, participant.placement)
+            for participant in cls.match.info.participants for unit in participant.units
+        ]
+
+    def test_tables(self):
+        """Test unit and trait tables"""
+        n_units = len(self.units)
+        self.assertEqual(len(self.batch), 2)
+        self.assertEqual(len(self.batch.unit_character_id), n_units * 2)
+        self.assertEqual(self.batch.unit_items.shape, (n_units * 2, 3))
+        self.assertEqual(self.batch.patches, ['10.20'])
+        # First unit
+        unit, placement = self.units[0]
+        self.assertEqual(self.batch.champions[self.batch.unit_character_id[0]], unit.character_id)
+        self.assertEqual(self.batch.unit_tier[0], unit.tier)
+        self.assertEqual(self.batch.unit_placement[0], placement)
+        self.assertEqual([i for i in self.batch.unit_items[0] if i >= 0], unit.items)
+        # Traits
+        n_traits = sum(len(participant.traits) for participant in self.match.info.participants)
+        self.assertEqual(len(self.batch.trait_key), n_traits * 2)
+        trait = self.match.info.participants[0].traits[0]
+        self.assertEqual(self.batch.trait_tier_current[0], trait.tier_current)
+        self.assertEqual(self.batch.trait_tier_total[0], trait.tier_total)
+        self.assertEqual(self.batch.n_participants, 16)
+
+    def test_code(self):
+        """Test vocabulary codes"""
+        unit, _ = self.units[0]
+        self.assertEqual(self.batch.code('champions', unit.character_id), self.batch.unit_character_id[0])
+        self.assertEqual(self.batch.code('patches', '10.20'), 0)
+        self.assertEqual(self.batch.code('regions', self.match.metadata.region), self.batch.match_region[0])
+        self.assertIsNone(self.batch.code('queues', 'something weired'))
+        with self.assertRaises(ValueError):
+            self.batch.code('something weired', 'OC1')
+
+    def test_champion_counts(self):
+        """Test champion_counts() and champion_placement()"""
+        expected = Counter(unit.character_id for unit, _ in self.units)
+        self.assertEqual(self.batch.champion_counts(), {k: v * 2 for k, v in expected.items()})
+        self.assertEqual(self.batch.champion_counts(patch='11.1'), {})
+        placement = self.batch.champion_placement()
+        for champion in expected:
+            placements = [p for unit, p in self.units if unit.character_id == champion]
+            self.assertAlmostEqual(placement[champion], sum(placements) / len(placements))
+
+    def test_item_counts(self):
+        """Test item_counts(), item_placement() and champion_item_counts()"""
+        expected = Counter(item for unit, _ in self.units for item in unit.items)
+        self.assertEqual(self.batch.item_counts(), {k: v * 2 for k, v in expected.items()})
+        placement = self.batch.item_placement()
+        for item in expected:
+            placements = [p for unit, p in self.units for i in unit.items if i == item]
+            self.assertAlmostEqual(placement[item], sum(placements) / len(placements))
+        champion_items = self.batch.champion_item_counts(patch='10.20')
+        jax = Counter(item for unit, _ in self.units if unit.character_id == 'TFT4_Jax' for item in unit.items)
+        self.assertEqual(champion_items['TFT4_Jax'], {k: v * 2 for k, v in jax.items()})
+
+    def test_trait_counts(self):
+        """Test trait_counts()"""
+        expected = Counter(
+            trait.name for participant in self.match.info.participants for trait in participant.traits
+            if trait.style >= 1
+        )
+        self.assertEqual(self.batch.trait_counts(), {k: v * 2 for k, v in expected.items()})
+
+    def test_empty(self):
+        """Test empty batch"""
+        batch = MatchBatch([])
+        self.assertEqual(batch.champion_counts(), {})
+        self.assertEqual(batch.item_counts(), {})
+        self.assertEqual(batch.champion_item_counts(), {})
@@ -0,0 +1,83 @@
+import json
+import struct
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+import tft_parse
+from tft_parse import binary
+
+
+class TestBinary(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            match = tft_parse.MatchDto(json.load(f))
+        units = match.info.players_units()
+        cls.champions = [tft_parse.Champion(championId, 4) for championId in {unit.character_id for unit in units}]
+        cls.items = [tft_parse.Item(id, 4) for id in {item for unit in units for item in unit.items}]
+        tft_parse.stream.feed([match], cls.champions, cls.items)
+
+    def test_champion_round_trip(self):
+        """Test Champion round trip is lossless"""
+        output = binary.loads(binary.dumps(self.champions))
+        self.assertEqual([obj.to_dict() for obj in output], [obj.to_dict() for obj in self.champions])
+        # Key types are kept
+        jax = [obj for obj in output if obj.championId == 'TFT4_Jax'][0]
+        self.assertTrue(all(type(key) is tuple for key in jax.item_comb))
+        self.assertTrue(all(type(key) is int for key in jax.item))
+
+    def test_item_round_trip(self):
+        """Test Item round trip is lossless"""
+        output = binary.loads(binary.dumps(self.items))
+        self.assertEqual([obj.to_dict() for obj in output], [obj.to_dict() for obj in self.items])
+
+    def test_byte_order(self):
+        """Test arrays are little endian, also when byte swapped on big endian hosts"""
+        data = binary.dumps(self.items)
+        ids = [obj.item for obj in self.items]
+        self.assertEqual(binary.StatsView(data)._ids.tobytes(), struct.pack(f'<{len(ids)}q', *ids))
+        with mock.patch.object(binary, 'little', False):
+            swapped = binary.dumps(self.items)
+            output = binary.loads(swapped)
+        self.assertEqual([obj.to_dict() for obj in output], [obj.to_dict() for obj in self.items])
+
+    def test_open_stats(self):
+        """Test memory mapped view"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath('champions.tfts')
+            path.write_bytes(binary.dumps(self.champions))
+            with binary.open_stats(path) as view:
+                self.assertEqual(len(view), len(self.champions))
+                self.assertEqual(view.ids, [obj.championId for obj in self.champions])
+                self.assertEqual(view.tft_set_number, 4)
+                offsets, keys, counts = view.arrays('item')
+                self.assertEqual(sum(counts), sum(sum(obj.item.values()) for obj in self.champions))
+                self.assertEqual(view.counter(0, 'item_comb'), self.champions[0].item_comb)
+            # Released, the file can be replaced
+            with self.assertRaises(ValueError):
+                counts[0]
+            self.assertIsNone(view._mmap)
+            path.write_bytes(binary.dumps(self.items))
+            # Not a stats file
+            path.write_bytes(b'JSON' + binary.dumps(self.items)[4:])
+            with self.assertRaises(ValueError):
+                binary.open_stats(path)
+
+    def test_set_number(self):
+        """Test set number type is kept"""
+        items = [tft_parse.Item(id, '4.5') for id in (15, 25)]
+        self.assertEqual(binary.loads(binary.dumps(items))[0].tft_set_number, '4.5')
+        self.assertEqual(binary.loads(binary.dumps(self.items))[0].tft_set_number, 4)
+
+    def test_empty(self):
+        """Test empty list"""
+        self.assertEqual(binary.loads(binary.dumps([])), [])
+
+    def test_incorrect_input(self):
+        with self.assertRaises(ValueError):
+            binary.dumps(self.champions + self.items)
+        with self.assertRaises(ValueError):
+            binary.dumps([tft_parse.Champion('TFT4_Aatrox', 4), tft_parse.Champion('TFT4_AurelionSol', '4.5')])
+        with self.assertRaises(ValueError):
+            binary.loads(b'JSON' + binary.dumps(self.items)[4:])
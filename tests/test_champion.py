@@ -20,8 +20,8 @@ class TestChampion(unittest.TestCase):
         self.assertEqual(self.champion.item, {23: 1, 11: 1})
         self.assertEqual(self.champion.item_1, {23: 1, 11: 1})
         # Combination
-        self.assertEqual(self.champion.item_comb, {'[11, 23]': 1})
-        self.assertEqual(self.champion.item_comb_1, {'[11, 23]': 1})
+        self.assertEqual(self.champion.item_comb, {(11, 23): 1})
+        self.assertEqual(self.champion.item_comb_1, {(11, 23): 1})
         # Occurance
         self.assertEqual(self.champion.champion_occurrence, 1)
         self.assertEqual(self.champion.tier, {1: 1})
@@ -34,8 +34,8 @@ class TestChampion(unittest.TestCase):
         self.assertEqual(self.champion.item, {11: 1, 22: 1, 23: 2, 79: 1})
         self.assertEqual(self.champion.item_3, {22: 1, 23: 1, 79: 1})
         # Combination
-        self.assertEqual(self.champion.item_comb, {'[11, 23]': 1, '[22, 23, 79]': 1})
-        self.assertEqual(self.champion.item_comb_3, {'[22, 23, 79]': 1})
+        self.assertEqual(self.champion.item_comb, {(11, 23): 1, (22, 23, 79): 1})
+        self.assertEqual(self.champion.item_comb_3, {(22, 23, 79): 1})
         # Occurance
         self.assertEqual(self.champion.champion_occurrence, 2)
         self.assertEqual(self.champion.tier, {1: 1, 3: 1})
@@ -49,8 +49,8 @@ class TestChampion(unittest.TestCase):
         self.assertEqual(self.champion.item, {11: 1, 22: 2, 23: 3, 79: 2})
         self.assertEqual(self.champion.item_3, {22: 2, 23: 2, 79: 2})
         # Combination
-        self.assertEqual(self.champion.item_comb, {'[11, 23]': 1, '[22, 23, 79]': 2})
-        self.assertEqual(self.champion.item_comb_3, {'[22, 23, 79]': 2})
+        self.assertEqual(self.champion.item_comb, {(11, 23): 1, (22, 23, 79): 2})
+        self.assertEqual(self.champion.item_comb_3, {(22, 23, 79): 2})
         # Occurance
         self.assertEqual(self.champion.champion_occurrence, 3)
         self.assertEqual(self.champion.tier, {1: 1, 3: 2})
@@ -72,7 +72,8 @@ class TestChampion(unittest.TestCase):
         output_dict = self.champion.to_dict()
         # Sanity check for to_dict()
         self.assertEqual(output_dict['championId'], self.data['units'][0]['character_id'])
-        self.assertEqual(self.champion.item_comb, {'[11, 23]': 1, '[22, 23, 79]': 2})
+        self.assertEqual(self.champion.item_comb, {(11, 23): 1, (22, 23, 79): 2})
+        self.assertEqual(output_dict['item_comb'], {'[11, 23]': 1, '[22, 23, 79]': 2})
         self.assertEqual(self.champion.champion_occurrence, 3)
 
         # ==== Parse from generated output ==== #
@@ -87,10 +88,50 @@ class TestChampion(unittest.TestCase):
         self.assertEqual(champion.item, {11: 2, 22: 2, 23: 4, 79: 2})
         self.assertEqual(champion.item_1, {23: 2, 11: 2})
         # Combination
-        self.assertEqual(champion.item_comb, {'[11, 23]': 2, '[22, 23, 79]': 2})
-        self.assertEqual(champion.item_comb_1, {'[11, 23]': 2})
+        self.assertEqual(champion.item_comb, {(11, 23): 2, (22, 23, 79): 2})
+        self.assertEqual(champion.item_comb_1, {(11, 23): 2})
         # Occurance
         self.assertEqual(champion.champion_occurrence, 4)
         self.assertEqual(champion.tier, {1: 2, 3: 2})
         # Chosen
         self.assertEqual(champion.chosen, {'Set4_Shade': 2})
+
+    def test_merge(self):
+        """Merge two partially parsed champions"""
+        self.champion.parse_unit(tft_parse.UnitDto(self.data['units'][0]))
+        self.champion.parse_unit(tft_parse.UnitDto(self.data['units'][1]))
+        other = tft_parse.Champion(self.data['character_id'], 4)
+        other.parse_unit(tft_parse.UnitDto(self.data['units'][1]))
+        # Expected: all units parsed by one champion
+        expected = tft_parse.Champion(self.data['character_id'], 4)
+        for i in [0, 1, 1]:
+            expected.parse_unit(tft_parse.UnitDto(self.data['units'][i]))
+
+        # __add__ does not change inputs
+        output = self.champion + other
+        self.assertEqual(output.to_dict(), expected.to_dict())
+        self.assertEqual(self.champion.champion_occurrence, 2)
+        # merge() is in-place
+        self.champion.merge(other)
+        self.assertEqual(self.champion.to_dict(), expected.to_dict())
+        self.assertEqual(other.champion_occurrence, 1)
+
+    def test_merge_incorrect_input(self):
+        with self.assertRaises(ValueError):
+            self.champion.merge(tft_parse.Champion('TFT4_Aatrox', 4))
+
+    def test_tier_counters(self):
+        """Test tier level counters are updated after from_dict() and no other attribute is created"""
+        champion = tft_parse.Champion(self.data['character_id'], 4)
+        champion.from_dict({**self.champion.to_dict(), 'item_comb_3': {'[22, 23, 79]': 1}})
+        attributes = set(vars(champion))
+        champion.parse_unit(tft_parse.UnitDto(self.data['units'][1]))
+        self.assertEqual(set(vars(champion)), attributes)
+        self.assertEqual(champion.item_comb_3, {(22, 23, 79): 2})
+        self.assertIs(champion.item_comb_3, champion.item_comb_tier[3])
+        self.assertEqual(champion.to_dict()['item_comb_3'], {'[22, 23, 79]': 2})
+
+    def test_incorrect_tier(self):
+        unit = tft_parse.UnitDto({**self.data['units'][0], 'tier': 4})
+        with self.assertRaises(ValueError):
+            self.champion.parse_unit(unit)
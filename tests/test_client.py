@@ -0,0 +1,152 @@
+import json
+import asyncio
+import unittest
+from unittest import mock
+import tft_parse
+from tft_parse.client import TftClient, TokenBucket, APIError
+
+
+class StubServer:
+    """Local HTTP/1.1 keep-alive server serving tests/data/tft_api/match.json"""
+
+    def __init__(self, match: dict):
+        self.match = json.dumps(match).encode()
+        self.match_id = match['metadata']['match_id']
+        self.requests = []
+        self.connections = 0
+        self.rate_limited = 0  # Number of 429 to return before a 200
+        self.retry_after = b'0'
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        while True:
+            try:
+                request = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError):
+                break
+            lines = request.decode().split('\r\n')
+            path = lines[0].split()[1]
+            headers = dict(line.split(': ', 1) for line in lines[1:] if line)
+            self.requests.append((path, headers))
+            if self.rate_limited > 0:
+                self.rate_limited -= 1
+                writer.write(b'HTTP/1.1 429 Too Many Requests\r\nRetry-After: %s\r\nContent-Length: 0\r\n\r\n'
+                             % self.retry_after)
+            elif path == f'/tft/match/v1/matches/{self.match_id}':
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n' % len(self.match) + self.match)
+            elif path.startswith('/tft/match/v1/matches/by-puuid/'):
+                # Chunked response
+                body = json.dumps([self.match_id]).encode()
+                writer.write(b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n')
+                writer.write(b'%x\r\n%s\r\n0\r\n\r\n' % (len(body), body))
+            else:
+                writer.write(b'HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n')
+            await writer.drain()
+        writer.close()
+
+    def close(self):
+        self.server.close()
+
+
+class TestClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            cls.data = json.load(f)
+
+    def run_client(self, test, rate_limited=0, retry_after=b'0', **kwargs):
+        """Run `test(client, server)` against a stub server"""
+        async def run():
+            server = StubServer(self.data)
+            server.rate_limited = rate_limited
+            server.retry_after = retry_after
+            await server.start()
+            try:
+                async with TftClient('key', base_url=f'http://127.0.0.1:{server.port}', **kwargs) as client:
+                    return await test(client, server)
+            finally:
+                server.close()
+
+        return asyncio.run(run())
+
+    def test_get_match(self):
+        """Test get_match() return MatchDto and send api key"""
+        async def test(client, server):
+            match = await client.get_match('OC1_351079452')
+            self.assertIs(type(match), tft_parse.MatchDto)
+            self.assertEqual(match.metadata.match_id, 'OC1_351079452')
+            self.assertEqual(server.requests[0][1]['X-Riot-Token'], 'key')
+
+        self.run_client(test)
+
+    def test_get_match_ids(self):
+        """Test get_match_ids() with chunked response"""
+        async def test(client, server):
+            match_ids = await client.get_match_ids('puuid', 'americas', count=5)
+            self.assertEqual(match_ids, ['OC1_351079452'])
+            self.assertEqual(server.requests[0][0], '/tft/match/v1/matches/by-puuid/puuid/ids?count=5')
+
+        self.run_client(test)
+
+    def test_connection_pool(self):
+        """Test connections are reused"""
+        async def test(client, server):
+            for _ in range(3):
+                await client.get_match('OC1_351079452')
+            matches = await client.get_matches(['OC1_351079452'] * 4)
+            self.assertEqual(len(matches), 4)
+            self.assertEqual(len(server.requests), 7)
+            self.assertLessEqual(server.connections, 2)
+
+        self.run_client(test, pool_size=2)
+
+    def test_retry_after(self):
+        """Test 429 is retried"""
+        async def test(client, server):
+            await client.get_match('OC1_351079452')
+            self.assertEqual(len(server.requests), 3)
+
+        self.run_client(test, rate_limited=2)
+
+    def test_retry_after_date(self):
+        """Test 429 with Retry-After as an HTTP-date fall back to the backoff"""
+        async def test(client, server):
+            await client.get_match('OC1_351079452')
+            self.assertEqual(len(server.requests), 2)
+
+        self.run_client(test, rate_limited=1, retry_after=b'Wed, 21 Oct 2015 07:28:00 GMT')
+
+    def test_error(self):
+        """Test non successful response raise APIError"""
+        async def test(client, server):
+            with self.assertRaises(APIError) as error:
+                await client.get_match('OC1_351079452')
+            self.assertEqual(error.exception.status, 429)
+            with self.assertRaises(APIError) as error:
+                await client.get_match('OC1_1')
+            self.assertEqual(error.exception.status, 404)
+
+        self.run_client(test, rate_limited=1, max_retries=0)
+
+    def test_token_bucket(self):
+        """Test token bucket wait once tokens are used"""
+        now = [0.0]
+
+        async def sleep(seconds):
+            now[0] += seconds
+
+        async def test():
+            bucket = TokenBucket(2, 1, clock=lambda: now[0])
+            for _ in range(4):
+                await bucket.acquire()
+            self.assertAlmostEqual(now[0], 1.0)
+            bucket.pause(5)
+            await bucket.acquire()
+            self.assertAlmostEqual(now[0], 6.0)
+
+        with mock.patch('asyncio.sleep', sleep):
+            asyncio.run(test())
@@ -0,0 +1,61 @@
+import json
+import unittest
+import tft_parse
+
+try:
+    import numpy
+    from tft_parse.comp import CompAnalysis
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestCompAnalysis(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            cls.match = tft_parse.MatchDto(json.load(f))
+
+    def test_identical_boards(self):
+        """Test identical boards are in the same comp"""
+        comps = CompAnalysis()
+        comps.add_matches([self.match] * 3)
+        self.assertEqual(len(comps), 24)
+        labels = comps.cluster()
+        for i in range(8):
+            with self.subTest(i):
+                self.assertEqual(labels[i], labels[i + 8])
+                self.assertEqual(labels[i], labels[i + 16])
+        report = comps.report()
+        self.assertEqual(sum(comp['size'] for comp in report), 24)
+        for comp in report:
+            self.assertEqual(comp['size'] % 3, 0)
+            self.assertTrue(1 <= comp['avg_placement'] <= 8)
+
+    def test_report(self):
+        """Test placement stats and features of separated comps"""
+        comps = CompAnalysis(chunk_size=3)
+        cultist = ['Cultist_3', 'TFT4_Aatrox', 'TFT4_Elise', 'TFT4_Kalista', 'TFT4_Pyke']
+        mage = ['Set4_Mage_3', 'TFT4_Ahri', 'TFT4_Annie', 'TFT4_Lulu', 'TFT4_Veigar']
+        for placement in [1, 2, 5]:
+            comps.add_board(cultist, placement)
+        comps.add_board(cultist[:-1] + ['TFT4_Zed'], 3)
+        comps.add_board(mage, 8)
+        comps.add_board(mage, 4)
+        comps.add_board([], 6)
+        report = comps.report()
+        self.assertEqual([comp['size'] for comp in report[:2]], [3, 2])
+        self.assertEqual(report[0]['features'], sorted(cultist))
+        self.assertAlmostEqual(report[0]['avg_placement'], 8 / 3)
+        self.assertAlmostEqual(report[0]['top4_rate'], 2 / 3)
+        self.assertAlmostEqual(report[0]['win_rate'], 1 / 3)
+        self.assertEqual(report[1]['features'], sorted(mage))
+        self.assertAlmostEqual(report[1]['top4_rate'], 0.5)
+        self.assertEqual(len(comps.report(min_size=2)), 2)
+
+    def test_empty(self):
+        self.assertEqual(CompAnalysis().report(), [])
+
+    def test_incorrect_input(self):
+        with self.assertRaises(ValueError):
+            CompAnalysis(n_hashes=10, bands=4)
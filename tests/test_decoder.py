@@ -0,0 +1,50 @@
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import tft_parse
+from tft_parse import decoder
+
+
+class TestDecoder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'rb') as f:
+            cls.raw = f.read()
+        cls.data = json.loads(cls.raw)
+
+    def tearDown(self):
+        decoder.set_backend(self.backend)
+
+    def setUp(self):
+        self.backend = decoder.backend
+
+    def test_backends(self):
+        """Test every installed backend gives the same result"""
+        for backend in decoder.backends:
+            with self.subTest(backend):
+                decoder.set_backend(backend)
+                self.assertEqual(decoder.loads(self.raw), self.data)
+                self.assertEqual(decoder.loads(self.raw.decode()), self.data)
+
+    def test_incorrect_input(self):
+        with self.assertRaises(ValueError):
+            decoder.set_backend('something weired')
+        with self.assertRaises(ValueError):
+            decoder.loads(b'not json')
+
+    def test_from_bytes(self):
+        """Test MatchDto.from_bytes()"""
+        match = tft_parse.MatchDto.from_bytes(self.raw, keep_data=False)
+        self.assertEqual(match.metadata.match_id, 'OC1_351079452')
+        self.assertIsNone(match.data)
+
+    def test_from_file(self):
+        """Test MatchDto.from_file() with plain and gzip'd file"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp).joinpath('match.json.gz')
+            with gzip.open(path, 'wb') as f:
+                f.write(self.raw)
+            self.assertEqual(tft_parse.MatchDto.from_file(path).data, self.data)
+        self.assertEqual(tft_parse.MatchDto.from_file('tests/data/tft_api/match.json').data, self.data)
@@ -0,0 +1,99 @@
+import copy
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import tft_parse
+
+
+class TestIncrementalAggregator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            data = json.load(f)
+        # Three matches played one hour apart
+        cls.data = []
+        for i in range(3):
+            match = copy.deepcopy(data)
+            match['metadata']['match_id'] = f'OC1_{i}'
+            match['info']['game_datetime'] += i * 3600000
+            cls.data.append(match)
+        cls.champion_ids = ['TFT4_Jax', 'TFT4_Fiora']
+        cls.item_ids = [15, 25]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name).joinpath('checkpoint.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def aggregator(self, **kwargs):
+        return tft_parse.IncrementalAggregator(self.path, self.champion_ids, self.item_ids, 4, **kwargs)
+
+    def matches(self, *index):
+        return [tft_parse.MatchDto(self.data[i]) for i in index]
+
+    def test_restart(self):
+        """Test result after checkpoint and restart is the same as one run"""
+        aggregator = self.aggregator()
+        self.assertEqual(aggregator.update(self.matches(0, 1)), 2)
+        aggregator.checkpoint()
+        # Restart
+        aggregator = self.aggregator()
+        self.assertEqual(set(aggregator.match_ids), {'OC1_0', 'OC1_1'})
+        self.assertEqual(aggregator.update(self.matches(0, 1, 2)), 1)
+        # Expected: one run over all matches
+        expected = tft_parse.IncrementalAggregator(
+            Path(self.tmp.name).joinpath('other.json'), self.champion_ids, self.item_ids, 4)
+        expected.update(self.matches(0, 1, 2))
+        self.assertEqual(aggregator.to_dict(), expected.to_dict())
+        self.assertEqual(aggregator.since, self.data[0]['info']['game_datetime'])
+        self.assertEqual(aggregator.until, self.data[2]['info']['game_datetime'])
+        self.assertEqual(aggregator.champions['TFT4_Jax'].item, expected.champions['TFT4_Jax'].item)
+
+    def test_atomic_checkpoint(self):
+        """Test failed checkpoint keep the previous file"""
+        aggregator = self.aggregator()
+        aggregator.update(self.matches(0))
+        aggregator.checkpoint()
+        aggregator.match_ids['bad'] = object()
+        with self.assertRaises(TypeError):
+            aggregator.checkpoint()
+        self.assertEqual(set(self.aggregator().match_ids), {'OC1_0'})
+        self.assertEqual(list(Path(self.tmp.name).iterdir()), [self.path])
+
+    def test_retention(self):
+        """Test match_id outside of the retention window are forgotten and skipped"""
+        aggregator = self.aggregator(retention=3600000)
+        aggregator.update(self.matches(0, 2))
+        self.assertEqual(set(aggregator.match_ids), {'OC1_2'})
+        # Older than retention window
+        self.assertEqual(aggregator.update(self.matches(0)), 0)
+        self.assertEqual(aggregator.update(self.matches(1)), 1)
+
+    def test_update_from_store(self):
+        """Test only new matches from MatchStore are parsed"""
+        with tft_parse.MatchStore() as store:
+            store.add_many(self.data[:2])
+            aggregator = self.aggregator(retention=3600000)
+            self.assertEqual(aggregator.update_from_store(store), 2)
+            store.add(self.data[2])
+            self.assertEqual(aggregator.update_from_store(store), 1)
+            self.assertEqual(aggregator.update_from_store(store), 0)
+
+    def test_store_rowid(self):
+        """Test rows read before a restart are not read again without retention"""
+        with tft_parse.MatchStore() as store:
+            store.add_many(self.data[:2])
+            aggregator = self.aggregator()
+            self.assertEqual(aggregator.update_from_store(store), 2)
+            self.assertEqual(aggregator.rowid, 2)
+            aggregator.checkpoint()
+            store.add(self.data[2])
+            aggregator = self.aggregator()
+            self.assertEqual(aggregator.rowid, 2)
+            self.assertEqual([data['metadata']['match_id'] for _, data in store.iter_rows(aggregator.rowid)],
+                             ['OC1_2'])
+            self.assertEqual(aggregator.update_from_store(store), 1)
+            self.assertEqual(aggregator.rowid, 3)
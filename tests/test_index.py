@@ -0,0 +1,81 @@
+import copy
+import json
+import unittest
+import tft_parse
+
+try:
+    import numpy
+    from tft_parse.index import MatchIndex, intersect
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestMatchIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            data = json.load(f)
+        # Second match from another region, patch and queue
+        data_2 = copy.deepcopy(data)
+        data_2['metadata']['match_id'] = 'KR_1'
+        data_2['info']['game_version'] = data_2['info']['game_version'].replace('10.20', '10.21')
+        data_2['info']['queue_id'] = 1090
+        cls.matches = [tft_parse.MatchDto(data), tft_parse.MatchDto(data_2)]
+        cls.index = MatchIndex.from_matches(cls.matches)
+        # Flat list of units for brute force
+        cls.units = [
+            (match, unit) for match in cls.matches
+            for participant in match.info.participants for unit in participant.units
+        ]
+
+    def brute_force(self, patch=None, region=None, queue=None, champion=None, items=(), tier=None):
+        return [
+            row for row, (match, unit) in enumerate(self.units)
+            if (patch is None or match.info.patch == patch)
+            and (region is None or match.metadata.region == region)
+            and (queue is None or match.info.queue == queue)
+            and (champion is None or unit.character_id == champion)
+            and (tier is None or unit.tier == tier)
+            and all(item in unit.items for item in items)
+        ]
+
+    def test_query(self):
+        """Test queries against brute force"""
+        queries = [
+            {},
+            {'champion': 'TFT4_Jax'},
+            {'champion': 'TFT4_Jax', 'region': 'KR'},
+            {'patch': '10.20', 'queue': 'Rank'},
+            {'item': 15},
+            {'item': [15, 25], 'champion': 'TFT4_Jax'},
+            {'tier': 2, 'patch': '10.21', 'region': 'KR', 'queue': 'Normal'},
+            {'region': 'OC1', 'queue': 'Normal'},
+            {'patch': '10.21'},
+            {'region': 'KR', 'queue': 'Rank'},
+            {'patch': '9.1', 'champion': 'TFT4_Jax'},
+            {'champion': 'something weired'},
+            {'item': 9999, 'tier': 9},
+        ]
+        for query in queries:
+            with self.subTest(str(query)):
+                items = query.get('item', [])
+                items = [items] if isinstance(items, int) else items
+                expected = self.brute_force(**{k: v for k, v in query.items() if k != 'item'}, items=items)
+                self.assertEqual(self.index.query(**query).tolist(), expected)
+                self.assertEqual(self.index.count(**query), len(expected))
+        self.assertGreater(self.index.count(champion='TFT4_Jax', region='KR'), 0)
+        # numpy integers, e.g. from MatchBatch.unit_items
+        self.assertEqual(self.index.count(item=numpy.int64(15)), self.index.count(item=15))
+        self.assertEqual(self.index.count(item=numpy.array([15, 25])), self.index.count(item=[15, 25]))
+
+    def test_participants_matches(self):
+        """Test mapping rows back to participants and matches"""
+        rows = self.index.query(champion='TFT4_Jax')
+        self.assertEqual(self.index.match_ids(rows), ['OC1_351079452', 'KR_1'])
+        self.assertEqual(self.index.match_ids(self.index.query(region='KR')), ['KR_1'])
+        self.assertTrue(all(0 <= row < 16 for row in self.index.participants(rows)))
+
+    def test_intersect(self):
+        self.assertEqual(intersect([numpy.array([1, 3, 5, 7]), numpy.array([3, 4, 7]), numpy.array([7])]).tolist(), [7])
+        self.assertEqual(intersect([numpy.array([1, 3]), numpy.array([], dtype=int)]).tolist(), [])
@@ -17,7 +17,7 @@ class TestItem(unittest.TestCase):
         # ==== First parse ==== #
         self.item.parse_unit(tft_parse.UnitDto(self.data['units'][0]))
         # Item
-        self.assertEqual(self.item.item_combination, {'[23]': 1})
+        self.assertEqual(self.item.item_combination, {(23,): 1})
         self.assertEqual(self.item.item_other, {23: 1})
         # Champion
         self.assertEqual(self.item.champion, {'TFT4_Zed': 1})
@@ -25,7 +25,7 @@ class TestItem(unittest.TestCase):
         # ==== Second parse ==== #
         self.item.parse_unit(tft_parse.UnitDto(self.data['units'][1]))
         # Item
-        self.assertEqual(self.item.item_combination, {'[23]': 1, '[36, 46]': 1})
+        self.assertEqual(self.item.item_combination, {(23,): 1, (36, 46): 1})
         self.assertEqual(self.item.item_other, {23: 1, 36: 1, 46: 1})
         # Champion
         self.assertEqual(self.item.champion, {'TFT4_Zed': 1, 'TFT4_XinZhao': 1})
@@ -33,7 +33,7 @@ class TestItem(unittest.TestCase):
         # ==== Third parse ==== #
         self.item.parse_unit(tft_parse.UnitDto(self.data['units'][0]))
         # Item
-        self.assertEqual(self.item.item_combination, {'[23]': 2, '[36, 46]': 1})
+        self.assertEqual(self.item.item_combination, {(23,): 2, (36, 46): 1})
         self.assertEqual(self.item.item_other, {23: 2, 36: 1, 46: 1})
         # Champion
         self.assertEqual(self.item.champion, {'TFT4_Zed': 2, 'TFT4_XinZhao': 1})
@@ -67,6 +67,29 @@ class TestItem(unittest.TestCase):
         # Champion
         self.assertEqual(item.champion, {'TFT4_Zed': 2, 'TFT4_XinZhao': 2})
         # Item combination
-        self.assertEqual(item.item_combination, {'[23]': 2, '[36, 46]': 2})
+        self.assertEqual(item.item_combination, {(23,): 2, (36, 46): 2})
         # Item other
         self.assertEqual(item.item_other, {23: 2, 36: 2, 46: 2})
+
+    def test_merge(self):
+        """Merge two partially parsed items"""
+        self.item.parse_unit(tft_parse.UnitDto(self.data['units'][0]))
+        other = tft_parse.Item(11, 4)
+        other.parse_unit(tft_parse.UnitDto(self.data['units'][1]))
+        other.parse_unit(tft_parse.UnitDto(self.data['units'][0]))
+        # Expected: all units parsed by one item
+        expected = tft_parse.Item(11, 4)
+        for i in [0, 1, 0]:
+            expected.parse_unit(tft_parse.UnitDto(self.data['units'][i]))
+
+        # __add__ does not change inputs
+        output = self.item + other
+        self.assertEqual(output.to_dict(), expected.to_dict())
+        self.assertEqual(self.item.champion, {'TFT4_Zed': 1})
+        # merge() is in-place
+        self.item.merge(other)
+        self.assertEqual(self.item.to_dict(), expected.to_dict())
+
+    def test_merge_incorrect_input(self):
+        with self.assertRaises(ValueError):
+            self.item.merge(tft_parse.Item(23, 4))
@@ -0,0 +1,81 @@
+import copy
+import json
+import unittest
+import tft_parse
+
+try:
+    import numpy
+    from tft_parse.item_matrix import ItemMatrix
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestItemMatrix(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            cls.match = tft_parse.MatchDto(json.load(f))
+        cls.tft_set_number = cls.match.info.tft_set_number
+        cls.meta = tft_parse.MetaAggregator(cls.tft_set_number)
+        cls.meta.update([cls.match, cls.match])
+
+    def test_same_as_item(self):
+        """Test views are the same as Item.to_dict()"""
+        for buffer_size in [1, 2 ** 20]:
+            with self.subTest(buffer_size):
+                matrix = ItemMatrix(self.tft_set_number, buffer_size=buffer_size)
+                self.assertEqual(matrix.update([self.match, self.match]), 2)
+                self.assertEqual(matrix.to_dict(), self.meta.to_dict()['items'])
+                self.assertEqual(matrix.to_dict(min_occurrence=1), self.meta.to_dict(min_occurrence=1)['items'])
+
+    def test_unknown(self):
+        """Test champions and items not in the set data are counted like Item.parse_unit()"""
+        data = copy.deepcopy(self.match.data)
+        units = data['info']['participants'][0]['units']
+        units[0]['character_id'] = 'TFT4_Unknown'
+        units[0]['items'] = [15, 9999]
+        match = tft_parse.MatchDto(data)
+        for buffer_size in [1, 2 ** 20]:
+            with self.subTest(buffer_size):
+                meta = tft_parse.MetaAggregator(self.tft_set_number)
+                meta.update([match])
+                matrix = ItemMatrix(self.tft_set_number, buffer_size=buffer_size)
+                matrix.update([match])
+                self.assertIn('TFT4_Unknown', matrix.champion_ids)
+                self.assertNotIn(9999, matrix.to_dict())
+                self.assertEqual(matrix.to_dict(), meta.to_dict()['items'])
+                self.assertEqual(matrix.to_dict()[15]['champion']['TFT4_Unknown'], 1)
+                self.assertEqual(matrix.to_dict()[15]['item_other'][9999], 1)
+                # Merged into a matrix without the unknown champion / item
+                other = ItemMatrix(self.tft_set_number)
+                other.update([self.match])
+                other.merge(matrix)
+                meta.update([self.match])
+                self.assertEqual(other.to_dict(), meta.to_dict()['items'])
+
+    def test_matrices(self):
+        matrix = ItemMatrix(self.tft_set_number)
+        matrix.update([self.match])
+        n_items, n_champions = len(matrix.item_ids), len(matrix.champion_ids)
+        self.assertEqual(matrix.co_occurrence.shape, (n_items, n_items))
+        self.assertEqual(matrix.champion.shape, (n_items, n_champions))
+        # Units holding an item
+        item_15 = sum(15 in unit.items for unit in self.match.info.players_units())
+        self.assertEqual(matrix.champion[matrix.item_ids.index(15)].sum(), item_15)
+
+    def test_merge(self):
+        matrix = ItemMatrix(self.tft_set_number)
+        matrix.update([self.match])
+        other = ItemMatrix(self.tft_set_number)
+        other.update([self.match])
+        matrix.merge(other)
+        self.assertEqual(matrix.matches, 2)
+        self.assertEqual(matrix.to_dict(), self.meta.to_dict()['items'])
+        with self.assertRaises(ValueError):
+            matrix.merge(ItemMatrix('4.5'))
+
+    def test_other_set(self):
+        matrix = ItemMatrix('4.5')
+        self.assertEqual(matrix.update([self.match]), 0)
+        self.assertEqual(matrix.co_occurrence.sum(), 0)
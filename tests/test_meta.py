@@ -0,0 +1,60 @@
+import json
+import unittest
+import tft_parse
+
+
+class TestMetaAggregator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            data = json.load(f)
+        cls.match = tft_parse.MatchDto(data)
+        cls.tft_set_number = cls.match.info.tft_set_number
+
+    def test_preallocated(self):
+        """Test every champion and item of the set is created"""
+        meta = tft_parse.MetaAggregator(self.tft_set_number)
+        static_data = tft_parse.StaticData.get(self.tft_set_number)
+        self.assertEqual(list(meta.champions), list(static_data.champions))
+        self.assertEqual(list(meta.items), list(static_data.items))
+
+    def test_same_as_feed(self):
+        """Test counters are the same as Champion / Item parse_unit()"""
+        meta = tft_parse.MetaAggregator(self.tft_set_number)
+        self.assertEqual(meta.update([self.match, self.match]), 2)
+        champions = {championId: tft_parse.Champion(championId, self.tft_set_number) for championId in meta.champions}
+        items = {id: tft_parse.Item(id, self.tft_set_number) for id in meta.items}
+        tft_parse.stream.feed([self.match, self.match], champions.values(), items.values())
+        output = meta.to_dict()
+        self.assertEqual(output['matches'], 2)
+        self.assertEqual(
+            output['champions'], {championId: champion.to_dict() for championId, champion in champions.items()})
+        self.assertEqual(output['items'], {id: item.to_dict() for id, item in items.items()})
+        self.assertGreater(output['champions']['TFT4_Jax']['champion_occurrence'], 0)
+
+    def test_other_set(self):
+        """Test matches of other sets are skipped"""
+        meta = tft_parse.MetaAggregator('4.5')
+        self.assertEqual(meta.update([self.match]), 0)
+        self.assertEqual(meta.matches, 0)
+        self.assertEqual(meta.to_dict(min_occurrence=1)['champions'], {})
+
+    def test_merge(self):
+        meta = tft_parse.MetaAggregator(self.tft_set_number)
+        meta.update([self.match])
+        merged = meta + meta
+        expected = tft_parse.MetaAggregator(self.tft_set_number)
+        expected.update([self.match, self.match])
+        self.assertEqual(merged.to_dict(), expected.to_dict())
+        self.assertEqual(meta.matches, 1)
+        with self.assertRaises(ValueError):
+            meta.merge(tft_parse.MetaAggregator('4.5'))
+
+    def test_min_occurrence(self):
+        meta = tft_parse.MetaAggregator(self.tft_set_number)
+        meta.update([self.match])
+        output = meta.to_dict(min_occurrence=1)
+        self.assertIn('TFT4_Jax', output['champions'])
+        self.assertLess(len(output['champions']), len(meta.champions))
+        self.assertTrue(all(champion['champion_occurrence'] >= 1 for champion in output['champions'].values()))
+        self.assertIn(15, output['items'])
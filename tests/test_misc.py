@@ -22,6 +22,22 @@ class TestDictAdd(unittest.TestCase):
         self.assertEqual(output, {'0': 1, '1': 2})
 
 
+class TestItemComb(unittest.TestCase):
+    def test_item_comb_key(self):
+        """Test item_comb_key() is sorted tuple"""
+        self.assertEqual(tft_parse.item_comb_key([23, 11]), (11, 23))
+        self.assertEqual(tft_parse.item_comb_key([]), ())
+
+    def test_item_comb_str(self):
+        """Test str round trip is the same format as str(list)"""
+        for items in [[], [23], [11, 23], [22, 23, 79]]:
+            with self.subTest(f"{items}"):
+                key = tft_parse.item_comb_key(items)
+                self.assertEqual(tft_parse.item_comb_to_str(key), str(items))
+                self.assertEqual(tft_parse.item_comb_from_str(str(items)), key)
+                self.assertEqual(tft_parse.item_comb_from_str(key), key)
+
+
 class TestRouteRegions(unittest.TestCase):
     def test_route_americas(self):
         regions = ['NA1', 'BR1', 'LA1', 'LA2', 'OC1']
@@ -41,6 +57,15 @@ class TestRouteRegions(unittest.TestCase):
             with self.subTest(f"{region}"):
                 self.assertEqual(tft_parse.route_region(region), 'EUROPE')
 
+    def test_lower_case(self):
+        self.assertEqual(tft_parse.route_region('euw1'), 'EUROPE')
+
+    def test_all_regions(self):
+        """Test every region in regions is routed"""
+        for region in tft_parse.regions:
+            with self.subTest(f"{region}"):
+                self.assertIn(tft_parse.route_region(region), ['AMERICAS', 'ASIA', 'EUROPE'])
+
     def test_incorrect_input(self):
         with self.assertRaises(ValueError):
             tft_parse.route_region('something weired')
@@ -0,0 +1,92 @@
+import copy
+import json
+import unittest
+from functools import partial
+import tft_parse
+from tft_parse.parallel import pack, unpack, reduce_many
+from tft_parse.synthetic import generate_matches
+
+
+class TestParseMany(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            data = json.load(f)
+        cls.records = []
+        for i in range(10):
+            record = copy.deepcopy(data)
+            record['metadata']['match_id'] = f"OC1_{i}"
+            cls.records.append(record)
+
+    def summary(self, match):
+        """Parsed values of a match"""
+        return (
+            match.metadata.match_id, match.metadata.region, match.info.patch, match.info.tft_set_number,
+            match.info.placements(), match.info.players_traits(),
+            [(unit.character_id, unit.items, unit.tier) for unit in match.info.players_units()],
+        )
+
+    def test_pack(self):
+        """Test unpack(pack()) gives the same matches without the raw dicts"""
+        matches = [tft_parse.MatchDto(data) for data in generate_matches(5, '4.5')]
+        output = unpack(pack(matches))
+        self.assertEqual([self.summary(match) for match in output], [self.summary(match) for match in matches])
+        self.assertIsNone(output[0].data)
+        self.assertIsNone(output[0].info.participants[0].data)
+        self.assertEqual(unpack(pack([])), [])
+
+    def test_backends(self):
+        """Test every backend parses the same matches in order"""
+        expected = [self.summary(tft_parse.MatchDto(record)) for record in self.records]
+        for backend in tft_parse.parallel.backends:
+            with self.subTest(backend):
+                matches = tft_parse.MatchDto.parse_many(self.records, workers=2, backend=backend, chunksize=3)
+                self.assertEqual([self.summary(match) for match in matches], expected)
+
+    def test_unordered(self):
+        matches = tft_parse.MatchDto.parse_many(self.records, workers=2, chunksize=2, ordered=False)
+        self.assertEqual(
+            sorted(match.metadata.match_id for match in matches),
+            sorted(record['metadata']['match_id'] for record in self.records)
+        )
+
+    def test_json(self):
+        """Test json str / bytes records and MatchDto kwargs"""
+        records = [json.dumps(record).encode() for record in self.records[:3]]
+        for backend in tft_parse.parallel.backends:
+            with self.subTest(backend):
+                matches = list(tft_parse.MatchDto.parse_many(records, workers=2, backend=backend, keep_data=False))
+                self.assertEqual([match.metadata.match_id for match in matches], ['OC1_0', 'OC1_1', 'OC1_2'])
+                self.assertIsNone(matches[0].data)
+                self.assertIsNone(matches[0].info.participants[0].data)
+
+    def test_reduce_many(self):
+        """Test accumulators reduced in the workers are the same as one serial pass"""
+        records = list(generate_matches(20, '4.5'))
+        factory = partial(tft_parse.MetaAggregator, '4.5')
+        expected = factory()
+        expected.update(tft_parse.MatchDto(record) for record in records)
+        for backend in tft_parse.parallel.backends:
+            with self.subTest(backend):
+                output = reduce_many(records, factory, workers=2, backend=backend, chunksize=3)
+                self.assertEqual(output.matches, 20)
+                self.assertEqual(output.to_dict(), expected.to_dict())
+
+    def test_memoryview(self):
+        """Test memoryview records with every json backend"""
+        raw = json.dumps(self.records[0]).encode()
+        previous = tft_parse.decoder.backend
+        try:
+            for backend in tft_parse.decoder.backends:
+                with self.subTest(backend):
+                    tft_parse.decoder.set_backend(backend)
+                    match = tft_parse.parallel._parse(memoryview(raw), {})
+                    self.assertEqual(match.metadata.match_id, 'OC1_0')
+        finally:
+            tft_parse.decoder.set_backend(previous)
+
+    def test_incorrect_backend(self):
+        with self.assertRaises(ValueError):
+            list(tft_parse.MatchDto.parse_many(self.records, backend='something weired'))
+        with self.assertRaises(ValueError):
+            reduce_many(self.records, tft_parse.MetaAggregator, backend='something weired')
@@ -0,0 +1,89 @@
+import json
+import statistics
+import unittest
+import tft_parse
+
+try:
+    import numpy
+    from tft_parse.placement import PlacementStats, PlacementAccumulator, z_score
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestPlacementAccumulator(unittest.TestCase):
+    def test_finalize(self):
+        """Test stats against statistics module"""
+        accumulator = PlacementAccumulator()
+        placements = [1, 2, 2, 5, 8]
+        for placement in placements:
+            accumulator.add('a', placement)
+        accumulator.add('b', 3, n=2)
+        stats = accumulator.to_dict()
+        self.assertEqual(stats['a']['count'], 5)
+        self.assertAlmostEqual(stats['a']['avg_placement'], statistics.mean(placements))
+        self.assertAlmostEqual(stats['a']['std'], statistics.stdev(placements))
+        self.assertAlmostEqual(stats['a']['top4_rate'], 3 / 5)
+        self.assertAlmostEqual(stats['a']['win_rate'], 1 / 5)
+        margin = 1.959964 * statistics.stdev(placements) / 5 ** 0.5
+        self.assertAlmostEqual(stats['a']['ci_low'], statistics.mean(placements) - margin, places=4)
+        self.assertAlmostEqual(stats['b']['avg_placement'], 3)
+        self.assertAlmostEqual(stats['b']['std'], 0)
+
+    def test_z_score(self):
+        """Test normal quantiles without statistics.NormalDist"""
+        self.assertAlmostEqual(z_score(0.95), 1.959964, places=6)
+        self.assertAlmostEqual(z_score(0.99), 2.575829, places=6)
+        self.assertAlmostEqual(z_score(0), 0)
+        with self.assertRaises(ValueError):
+            z_score(1)
+
+    def test_merge(self):
+        """Test merge gives the same result as one accumulator"""
+        left, right, expected = PlacementAccumulator(), PlacementAccumulator(), PlacementAccumulator()
+        for i, placement in enumerate([1, 4, 6, 8, 2]):
+            (left if i % 2 else right).add('a', placement)
+            expected.add('a', placement)
+        right.add('b', 7)
+        expected.add('b', 7)
+        self.assertEqual(left.merge(right).to_dict(), expected.to_dict())
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestPlacementStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            cls.match = tft_parse.MatchDto(json.load(f))
+        cls.stats = PlacementStats()
+        cls.stats.update([cls.match, cls.match])
+
+    def test_champion(self):
+        """Test champion and champion_tier stats"""
+        jax = [
+            (participant.placement, unit.tier) for participant in self.match.info.participants
+            for unit in participant.units if unit.character_id == 'TFT4_Jax'
+        ]
+        stats = self.stats.to_dict()
+        self.assertEqual(stats['champion']['TFT4_Jax']['count'], len(jax) * 2)
+        self.assertAlmostEqual(stats['champion']['TFT4_Jax']['avg_placement'], statistics.mean(p for p, _ in jax))
+        tier_count = sum(stats['champion_tier'][key]['count'] for key in stats['champion_tier'] if key[0] == 'TFT4_Jax')
+        self.assertEqual(tier_count, len(jax) * 2)
+        self.assertEqual(self.stats.matches, 2)
+
+    def test_item(self):
+        """Test item and champion_item stats"""
+        holders = [
+            (participant.placement, unit.character_id) for participant in self.match.info.participants
+            for unit in participant.units if 15 in unit.items
+        ]
+        stats = self.stats.finalize('item')
+        row = stats['keys'].index(15)
+        self.assertEqual(stats['count'][row], len(holders) * 2)
+        self.assertAlmostEqual(stats['avg_placement'][row], statistics.mean(p for p, _ in holders))
+        champion_item = self.stats.to_dict()['champion_item']
+        self.assertEqual(sum(v['count'] for k, v in champion_item.items() if k[1] == 15), len(holders) * 2)
+
+    def test_incorrect_input(self):
+        with self.assertRaises(ValueError):
+            self.stats.finalize('something weired')
@@ -0,0 +1,106 @@
+import copy
+import json
+import unittest
+import tft_parse
+from tft_parse.rolling import HOUR, DAY
+
+
+class TestRollingStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            data = json.load(f)
+        cls.start = data['info']['game_datetime'] // HOUR * HOUR
+        # One match per hour
+        cls.matches = []
+        for i in range(6):
+            match = copy.deepcopy(data)
+            match['metadata']['match_id'] = f'OC1_{i}'
+            match['info']['game_datetime'] = cls.start + i * HOUR
+            cls.matches.append(tft_parse.MatchDto(match))
+        # Counters of one match
+        cls.champions = {}
+        cls.items = {}
+        for unit in cls.matches[0].info.players_units():
+            tft_parse.dict_add_count(cls.champions, unit.character_id)
+            for item in set(unit.items):
+                tft_parse.dict_add_count(cls.items, item)
+        cls.traits = {}
+        for traits in cls.matches[0].info.players_traits().values():
+            for trait in traits:
+                tft_parse.dict_add_count(cls.traits, trait)
+
+    def times(self, counter: dict, n: int) -> dict:
+        return {key: value * n for key, value in counter.items()}
+
+    def test_window(self):
+        """Test windows sum the buckets"""
+        rolling = tft_parse.RollingStats(HOUR, n_buckets=4)
+        self.assertEqual(rolling.update(self.matches), 6)
+        output = rolling.window(2 * HOUR)
+        self.assertEqual(output['matches'], 2)
+        self.assertEqual(output['since'], self.start + 4 * HOUR)
+        self.assertEqual(output['until'], self.start + 6 * HOUR)
+        self.assertEqual(output['champions'], self.times(self.champions, 2))
+        self.assertEqual(output['items'], self.times(self.items, 2))
+        self.assertEqual(output['traits'], self.times(self.traits, 2))
+        # Rounded up to whole buckets
+        self.assertEqual(rolling.window(HOUR + 1)['matches'], 2)
+        # Window ending earlier
+        output = rolling.window(HOUR, until=self.start + 3 * HOUR + 10)
+        self.assertEqual(output['matches'], 1)
+        self.assertEqual(output['since'], self.start + 3 * HOUR)
+        # Window ending after the latest bucket
+        output = rolling.window(4 * HOUR, until=self.start + 8 * HOUR)
+        self.assertEqual(output['matches'], 1)
+        self.assertEqual((output['since'], output['until']), (self.start + 5 * HOUR, self.start + 6 * HOUR))
+        output = rolling.window(HOUR, until=self.start + 20 * HOUR)
+        self.assertEqual(output['matches'], 0)
+        self.assertEqual(output['since'], output['until'])
+
+    def test_evicted_window(self):
+        """Test windows starting before the ring buffer raise"""
+        rolling = tft_parse.RollingStats(HOUR, n_buckets=4)
+        rolling.update(self.matches)
+        with self.assertRaises(ValueError):
+            rolling.window(2 * HOUR, until=self.start + HOUR)
+        with self.assertRaises(ValueError):
+            rolling.window(4 * HOUR, until=self.start + 4 * HOUR)
+        # Oldest bucket kept
+        self.assertEqual(rolling.window(HOUR, until=self.start + 2 * HOUR)['matches'], 1)
+
+    def test_eviction(self):
+        """Test old buckets are evicted and older matches dropped"""
+        rolling = tft_parse.RollingStats(HOUR, n_buckets=4)
+        rolling.update(self.matches)
+        self.assertEqual(rolling.window(4 * HOUR)['matches'], 4)
+        self.assertEqual(sorted(bucket.index for bucket in rolling.buckets), [
+            (self.start + i * HOUR) // HOUR for i in range(2, 6)])
+        # Too old
+        self.assertFalse(rolling.add(self.matches[0]))
+        self.assertEqual(rolling.dropped, 1)
+        # Late match within the buffer
+        self.assertTrue(rolling.add(self.matches[3]))
+        self.assertEqual(rolling.window(4 * HOUR)['matches'], 5)
+        # Jump further than the buffer
+        match = copy.deepcopy(self.matches[0].data)
+        match['info']['game_datetime'] = self.start + DAY
+        rolling.add(tft_parse.MatchDto(match))
+        self.assertEqual(rolling.window(4 * HOUR)['matches'], 1)
+        self.assertEqual(sum(bucket is not None for bucket in rolling.buckets), 1)
+
+    def test_out_of_order(self):
+        """Test the same counts regardless of match order"""
+        rolling = tft_parse.RollingStats(HOUR, n_buckets=6)
+        rolling.update(reversed(self.matches))
+        self.assertEqual(rolling.window(6 * HOUR)['champions'], self.times(self.champions, 6))
+
+    def test_incorrect_input(self):
+        rolling = tft_parse.RollingStats(HOUR, n_buckets=4)
+        self.assertEqual(rolling.window(HOUR)['matches'], 0)
+        with self.assertRaises(ValueError):
+            rolling.window(5 * HOUR)
+        with self.assertRaises(ValueError):
+            rolling.window(0)
+        with self.assertRaises(ValueError):
+            tft_parse.RollingStats(0)
@@ -0,0 +1,78 @@
+import unittest
+import tft_parse
+from tft_parse.static_data import patch_version, resolve_set
+
+
+class TestStaticData(unittest.TestCase):
+    def test_registry(self):
+        """Test StaticData is loaded once per set"""
+        self.assertIs(tft_parse.StaticData.get(4), tft_parse.StaticData.get('4'))
+        self.assertIsNot(tft_parse.StaticData.get(4), tft_parse.StaticData.get('4.5'))
+
+    def test_indexes(self):
+        """Test champion, item and trait indexes"""
+        static_data = tft_parse.StaticData.get(4)
+        self.assertEqual(static_data.champion('TFT4_Aatrox')['name'], 'Aatrox')
+        self.assertEqual(static_data.item(1)['name'], 'B.F. Sword')
+        self.assertEqual(static_data.trait('Set4_Adept')['name'], 'Adept')
+        self.assertEqual(len(static_data.champions), len(static_data.champion_list))
+
+    def test_incorrect_input(self):
+        static_data = tft_parse.StaticData.get(4)
+        with self.assertRaises(ValueError):
+            static_data.champion('something weired')
+        with self.assertRaises(ValueError):
+            static_data.item(-1)
+        with self.assertRaises(ValueError):
+            static_data.trait('something weired')
+        with self.assertRaises(ValueError):
+            tft_parse.StaticData.get('something weired')
+
+    def test_champion_item(self):
+        """Test Champion and Item use the registry"""
+        champion = tft_parse.Champion('TFT4_Aatrox', 4)
+        self.assertIs(champion.champion, tft_parse.StaticData.get(4).champions['TFT4_Aatrox'])
+        with self.assertRaises(ValueError):
+            tft_parse.Item(-1, 4)
+
+    def test_trait_tiers(self):
+        """Test trait tier lookup matches Trait.get_trait_style()"""
+        for tft_set_number in [4, '4.5']:
+            static_data = tft_parse.StaticData.get(tft_set_number)
+            traits = tft_parse.Traits(tft_set_number)
+            for (key, style), tier_name in static_data.trait_tiers.items():
+                with self.subTest(f"{tft_set_number} {key} {style}"):
+                    self.assertEqual(tier_name, traits.get_trait_style(key, style))
+        with self.assertRaises(ValueError):
+            tft_parse.StaticData.get(4).trait_tier('something weired', 1)
+
+    def test_preload(self):
+        """Test every set under data/ is loaded into the registry"""
+        self.assertEqual(tft_parse.StaticData.available_sets(), ['4', '4.5'])
+        static_data = tft_parse.StaticData.preload()
+        self.assertEqual(list(static_data), ['4', '4.5'])
+        self.assertIs(static_data['4.5'], tft_parse.StaticData.get('4.5'))
+
+
+class TestResolveSet(unittest.TestCase):
+    def test_patch_version(self):
+        self.assertEqual(patch_version('11.10'), (11, 10))
+        self.assertEqual(patch_version('10.20'), (10, 20))
+        self.assertGreater(patch_version('11.10'), patch_version('11.2'))
+        with self.assertRaises(ValueError):
+            patch_version('something weired')
+
+    def test_resolve_set(self):
+        """Test patches are compared as versions, not str"""
+        cases = [
+            (4, '10.20', 4),
+            (4, '11.1', 4),
+            (4, '11.2', '4.5'),
+            (4, '11.10', '4.5'),
+            (4, '9.24', 4),
+            (3, '11.10', 3),
+        ]
+        for set_number, patch, expected in cases:
+            with self.subTest(f"{set_number} {patch}"):
+                self.assertEqual(resolve_set(set_number, patch), expected)
+                self.assertEqual(tft_parse.InfoDto.check_set_number(set_number, patch), expected)
@@ -0,0 +1,70 @@
+import copy
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import tft_parse
+
+
+class TestMatchStore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            cls.data = json.load(f)
+        # Second match, played later
+        cls.data_2 = copy.deepcopy(cls.data)
+        cls.data_2['metadata']['match_id'] = 'OC1_1'
+        cls.data_2['info']['game_datetime'] += 1000
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name).joinpath('matches.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_add(self):
+        """Test duplicated match_id are not added"""
+        with tft_parse.MatchStore(self.path) as store:
+            self.assertTrue(store.add(self.data))
+            self.assertFalse(store.add(tft_parse.MatchDto(self.data)))
+            self.assertEqual(store.add_many([self.data, self.data_2, self.data_2]), 1)
+            self.assertEqual(len(store), 2)
+            self.assertIn('OC1_1', store)
+            self.assertNotIn('OC1_2', store)
+            self.assertEqual(store.get('OC1_351079452'), self.data)
+
+    def test_persist(self):
+        """Test matches are kept after reopening"""
+        with tft_parse.MatchStore(self.path) as store:
+            store.add_many([self.data_2, self.data])
+        with tft_parse.MatchStore(self.path) as store:
+            # Compressed
+            size = store.connection.execute("SELECT length(data) FROM matches").fetchone()[0]
+            self.assertLess(size, len(json.dumps(self.data)) / 2)
+            self.assertIn('OC1_351079452', store)
+            self.assertFalse(store.add(self.data))
+            # Ordered by game_datetime
+            match_ids = [match.metadata.match_id for match in store.iter_matches()]
+            self.assertEqual(match_ids, ['OC1_351079452', 'OC1_1'])
+            # Time window
+            since = self.data_2['info']['game_datetime']
+            self.assertEqual([match['metadata']['match_id'] for match in store.iter_raw(since=since)], ['OC1_1'])
+            self.assertEqual(len(list(store.iter_raw(until=since))), 1)
+
+    def test_incorrect_input(self):
+        with tft_parse.MatchStore() as store:
+            with self.assertRaises(ValueError):
+                store.get('OC1_1')
+            with self.assertRaises(ValueError):
+                store.add(tft_parse.MatchDto(self.data, keep_data=False))
+
+    def test_rollback(self):
+        """Test match_id of a failed add_many are not kept"""
+        with tft_parse.MatchStore() as store:
+            with self.assertRaises(KeyError):
+                store.add_many([self.data, {'metadata': {'match_id': 'OC1_2'}}])
+            self.assertEqual(store.connection.execute("SELECT COUNT(*) FROM matches").fetchone()[0], 0)
+            self.assertNotIn('OC1_351079452', store)
+            self.assertEqual(len(store), 0)
+            self.assertTrue(store.add(self.data))
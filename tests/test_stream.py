@@ -0,0 +1,92 @@
+import io
+import sys
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import tft_parse
+from tft_parse import stream
+
+
+class TestStream(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            cls.data = json.load(f)
+        cls.line = json.dumps(cls.data) + '\n'
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_jsonl(self):
+        """Test newline-delimited file, blank lines are skipped"""
+        path = self.path.joinpath('matches.jsonl')
+        path.write_text(self.line * 2 + '\n')
+        matches = list(stream.iter_matches(path))
+        self.assertEqual(len(matches), 2)
+        self.assertIs(type(matches[0]), tft_parse.MatchDto)
+        self.assertEqual(matches[0].metadata.match_id, 'OC1_351079452')
+
+    def test_gzip(self):
+        """Test gzip'd newline-delimited file"""
+        path = self.path.joinpath('matches.jsonl.gz')
+        with gzip.open(path, 'wt') as f:
+            f.write(self.line * 3)
+        self.assertEqual(len(list(stream.iter_matches(str(path)))), 3)
+
+    def test_directory(self):
+        """Test directory with mixed files, unsupported files are ignored"""
+        self.path.joinpath('a.json').write_text(json.dumps(self.data, indent=2))
+        self.path.joinpath('sub').mkdir()
+        self.path.joinpath('sub', 'b.jsonl').write_text(self.line * 2)
+        self.path.joinpath('README.md').write_text('not a match')
+        files = list(stream.iter_files(self.path))
+        self.assertEqual([file.name for file in files], ['a.json', 'b.jsonl'])
+        self.assertEqual(len(list(stream.iter_matches(self.path))), 3)
+
+    def test_stdin(self):
+        """Test reading from stdin"""
+        stdin = mock.Mock(buffer=io.BytesIO((self.line * 2).encode()))
+        with mock.patch.object(sys, 'stdin', stdin):
+            self.assertEqual(len(list(stream.iter_matches('-'))), 2)
+
+    def test_lazy(self):
+        """Test matches are read lazily"""
+        path = self.path.joinpath('matches.jsonl')
+        path.write_text(self.line + 'not json\n')
+        matches = stream.iter_matches(path)
+        self.assertIs(type(next(matches)), tft_parse.MatchDto)
+        with self.assertRaises(ValueError):
+            next(matches)
+
+    def test_incorrect_input(self):
+        with self.assertRaises(ValueError):
+            list(stream.iter_matches(self.path.joinpath('something weired')))
+
+    def test_batched(self):
+        """Test batched()"""
+        self.assertEqual(list(stream.batched(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_feed(self):
+        """Test feed() gives the same result as parsing units one by one"""
+        match = tft_parse.MatchDto(self.data)
+        champion = tft_parse.Champion('TFT4_Jax', 4)
+        item = tft_parse.Item(15, 4)
+        expected_champion = tft_parse.Champion('TFT4_Jax', 4)
+        expected_item = tft_parse.Item(15, 4)
+        for unit in match.info.players_units():
+            if unit.character_id == 'TFT4_Jax':
+                expected_champion.parse_unit(unit)
+            if 15 in unit.items:
+                expected_item.parse_unit(unit)
+
+        self.assertEqual(stream.feed([match], [champion], [item]), 1)
+        self.assertEqual(champion.to_dict(), expected_champion.to_dict())
+        self.assertEqual(item.to_dict(), expected_item.to_dict())
+        self.assertGreater(champion.champion_occurrence, 0)
@@ -0,0 +1,48 @@
+import unittest
+import tft_parse
+from tft_parse.synthetic import MatchGenerator, generate_matches
+
+
+class TestSynthetic(unittest.TestCase):
+    def test_deterministic(self):
+        """Test the same seed gives the same matches"""
+        self.assertEqual(list(generate_matches(3, '4.5', seed=1)), list(generate_matches(3, '4.5', seed=1)))
+        self.assertNotEqual(list(generate_matches(3, '4.5', seed=1)), list(generate_matches(3, '4.5', seed=2)))
+        generator = MatchGenerator('4.5', seed=1)
+        self.assertEqual(generator.match(2), list(generator.matches(1, start=2))[0])
+
+    def test_parse(self):
+        """Test matches parse to MatchDto of the right set"""
+        for tft_set_number in ['4', '4.5']:
+            static_data = tft_parse.StaticData.get(tft_set_number)
+            for data in generate_matches(20, tft_set_number):
+                match = tft_parse.MatchDto(data)
+                with self.subTest(f"{tft_set_number} {match.metadata.match_id}"):
+                    self.assertEqual(str(match.info.tft_set_number), tft_set_number)
+                    self.assertEqual(sorted(match.info.placements()), list(range(1, 9)))
+                    self.assertEqual(len(set(match.metadata.participants)), 8)
+                    for participant in match.info.participants:
+                        self.assertEqual(len(participant.units), participant.level)
+                        self.assertEqual(sum(unit.is_chosen() for unit in participant.units), 1)
+                        for unit in participant.units:
+                            self.assertIn(unit.character_id, static_data.champions)
+                            self.assertLessEqual(len(unit.items), 3)
+                            self.assertTrue(all(item in static_data.items for item in unit.items))
+
+    def test_traits(self):
+        """Test traits num_units and tier are consistent with the set data"""
+        for data in generate_matches(5, '4.5'):
+            match = tft_parse.MatchDto(data)
+            for participant in match.info.participants:
+                for trait in participant.traits:
+                    sets = tft_parse.StaticData.get('4.5').trait(trait.name)['sets']
+                    self.assertEqual(trait.tier_total, len(sets))
+                    self.assertEqual(trait.tier_current, sum(trait.num_units >= s['min'] for s in sets))
+                    if trait.tier_current:
+                        self.assertEqual(trait.tier_name, f"{trait.name}_{sets[trait.tier_current - 1]['min']}")
+                    else:
+                        self.assertIsNone(trait.tier_name)
+
+    def test_incorrect_input(self):
+        with self.assertRaises(ValueError):
+            MatchGenerator('something weired')
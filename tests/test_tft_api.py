@@ -1,4 +1,5 @@
 import tft_parse
+from tft_parse.tft_api_class import parse_patch
 import datetime
 import unittest
 import json
@@ -23,6 +24,42 @@ class TestMatch(unittest.TestCase):
         self.assertEqual(self.match.info.patch, output['patch'])
         self.assertEqual(self.match.info.queue, output['queue'])
 
+    def test_slots(self):
+        """Test DTO classes do not have __dict__"""
+        participant = self.match.info.participants[0]
+        for dto in [self.match, self.match.metadata, self.match.info, participant, participant.traits[0],
+                    participant.units[0]]:
+            with self.subTest(type(dto).__name__):
+                self.assertFalse(hasattr(dto, '__dict__'))
+
+    def test_drop_data(self):
+        """Test keep_data=False"""
+        match = tft_parse.MatchDto(self.data, keep_data=False)
+        self.assertIsNone(match.data)
+        self.assertIsNone(match.info.participants[0].data)
+        self.assertEqual(match.info.placements(), self.match.info.placements())
+        with self.assertRaises(ValueError):
+            match.to_dict()
+
+    def test_lazy(self):
+        """Test lazy=True only parse participants when accessed"""
+        match = tft_parse.MatchDto(self.data, lazy=True)
+        self.assertEqual(match.metadata.match_id, self.match.metadata.match_id)
+        self.assertEqual(match.info.patch, self.match.info.patch)
+        self.assertIsNone(match.info._participants)
+        # Participants
+        participants = match.info.participants
+        self.assertIs(match.info.participants, participants)
+        self.assertIsNone(participants[0]._units)
+        self.assertIsNone(participants[0]._traits)
+        self.assertEqual(match.info.placements(), self.match.info.placements())
+        # Units and traits
+        self.assertEqual(
+            [unit.character_id for unit in match.info.players_units()],
+            [unit.character_id for unit in self.match.info.players_units()]
+        )
+        self.assertEqual(match.info.players_traits(), self.match.info.players_traits())
+
 
 class TestMetadata(unittest.TestCase):
     @classmethod
@@ -43,6 +80,11 @@ class TestMetadata(unittest.TestCase):
         """Test route_region()"""
         self.assertEqual(self.metadata.get_route_region(), 'AMERICAS')
 
+    def test_incorrect_match_id(self):
+        data = {'data_version': '5', 'match_id': 'something weired', 'participants': []}
+        with self.assertRaises(ValueError):
+            tft_parse.MetadataDto(data)
+
 
 class TestInfo(unittest.TestCase):
     @classmethod
@@ -59,6 +101,15 @@ class TestInfo(unittest.TestCase):
         """Test get_patch()"""
         self.assertEqual(self.info.get_patch(), '10.20')
 
+    def test_parse_patch(self):
+        """Test game_version -> patch is cached"""
+        parse_patch.cache_clear()
+        self.assertEqual(parse_patch(self.info.game_version), '10.20')
+        self.assertEqual(parse_patch(self.info.game_version), '10.20')
+        self.assertEqual(parse_patch.cache_info().hits, 1)
+        with self.assertRaises(ValueError):
+            parse_patch('something weired')
+
     def test_get_queue(self):
         """Test get_queue()"""
         self.assertEqual(self.info.get_queue(), 'Rank')
@@ -0,0 +1,95 @@
+import copy
+import json
+import unittest
+import tft_parse
+
+try:
+    import numpy
+    from tft_parse.batch import MatchBatch
+    from tft_parse.trait_stats import TraitStats
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestTraitStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open('tests/data/tft_api/match.json', 'r') as f:
+            cls.match = tft_parse.MatchDto(json.load(f))
+        cls.tft_set_number = cls.match.info.tft_set_number
+        cls.traits = [
+            (trait, participant.placement)
+            for participant in cls.match.info.participants for trait in participant.traits
+        ]
+
+    def test_tier_ids(self):
+        """Test tier ids and names match the set data"""
+        stats = TraitStats(self.tft_set_number)
+        for trait, _ in self.traits:
+            with self.subTest(trait.name):
+                tier_id = stats.tier_id(trait.name, trait.tier_current)
+                self.assertEqual(stats.tier_keys[tier_id], (trait.name, trait.tier_current))
+                self.assertEqual(stats.tier_names[tier_id], trait.tier_name)
+        with self.assertRaises(ValueError):
+            stats.tier_id('something weired', 1)
+        with self.assertRaises(ValueError):
+            stats.tier_id('Cultist', 9)
+
+    def test_update(self):
+        """Test counters against brute force"""
+        stats = TraitStats(self.tft_set_number)
+        self.assertEqual(stats.update([self.match, self.match]), 2)
+        self.assertEqual(stats.participants, 16)
+        output = stats.to_dict()
+        for trait, placement in self.traits:
+            with self.subTest(f"{trait.name} {trait.tier_current}"):
+                same = [
+                    (other, other_placement) for other, other_placement in self.traits
+                    if (other.name, other.tier_current) == (trait.name, trait.tier_current)
+                ]
+                tier = output[trait.name]['tiers'][trait.tier_current]
+                self.assertEqual(output[trait.name]['tier_total'], trait.tier_total)
+                self.assertEqual(tier['count'], 2 * len(same))
+                self.assertAlmostEqual(tier['frequency'], len(same) / 8)
+                self.assertAlmostEqual(tier['avg_placement'], sum(p for _, p in same) / len(same))
+                self.assertAlmostEqual(tier['win_rate'], sum(p == 1 for _, p in same) / len(same))
+                self.assertEqual(sum(tier['num_units'].values()), 2 * len(same))
+                self.assertGreater(tier['num_units'][trait.num_units], 0)
+
+    def test_batches(self):
+        """Test update() in batches is the same as one MatchBatch"""
+        expected = TraitStats(self.tft_set_number)
+        expected.update_batch(MatchBatch([self.match] * 3))
+        stats = TraitStats(self.tft_set_number)
+        self.assertEqual(stats.update(iter([self.match] * 3), batch_size=2), 3)
+        self.assertEqual(stats.to_dict(), expected.to_dict())
+        self.assertEqual(stats.matches, 3)
+
+    def test_invalid_tier(self):
+        """Test traits with tier_current out of range are skipped and counted"""
+        data = copy.deepcopy(self.match.data)
+        data['info']['participants'][0]['traits'][0]['tier_current'] = 99
+        stats = TraitStats(self.tft_set_number)
+        self.assertEqual(stats.update([tft_parse.MatchDto(data), self.match]), 2)
+        self.assertEqual(stats.invalid, 1)
+        self.assertEqual(stats.count.sum(), 2 * len(self.traits) - 1)
+
+    def test_merge(self):
+        stats = TraitStats(self.tft_set_number)
+        stats.update_batch(MatchBatch([self.match]))
+        other = TraitStats(self.tft_set_number)
+        other.update([self.match, self.match])
+        stats.merge(other)
+        expected = TraitStats(self.tft_set_number)
+        expected.update([self.match] * 3)
+        self.assertEqual(stats.to_dict(), expected.to_dict())
+        self.assertEqual(stats.matches, 3)
+        with self.assertRaises(ValueError):
+            stats.merge(TraitStats('4.5'))
+
+    def test_other_set(self):
+        stats = TraitStats('4.5')
+        self.assertEqual(stats.update([self.match]), 0)
+        self.assertEqual(stats.count.sum(), 0)
+        self.assertEqual(stats.to_dict()['Cultist']['tiers'], {})
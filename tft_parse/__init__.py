@@ -2,7 +2,15 @@ __version__ = '0.1.0'
 current_tft_set = '4.5'
 
 from .tft_api_class import MatchDto, InfoDto, MetadataDto, UnitDto, ParticipantDto, TraitDto
-from .misc import dict_add_count, route_region, regions
+from .misc import dict_add_count, dict_merge_count, route_region, regions
+from .misc import item_comb_key, item_comb_to_str, item_comb_from_str
 from .champion import Champion
 from .item import Item
 from .trait import Traits
+from .static_data import StaticData
+from . import stream, aggregate, parallel
+from .client import TftClient
+from .store import MatchStore
+from .incremental import IncrementalAggregator
+from .meta import MetaAggregator
+from .rolling import RollingStats
@@ -0,0 +1,145 @@
+"""Aggregate Champion / Item stats over many match files in parallel
+
+Inputs are split into tasks at record level, so a single large dump still uses every core:
+
+    plain *.jsonl / *.ndjson: byte ranges aligned to line starts, read by the workers themselves
+    gzip'd line files:        lines read by the parent and sent to workers in batches
+    *.json (one match):       files grouped into shards of roughly equal size
+
+Each task is parsed in a process of the pool and the partial Champion / Item results are merged back
+together as tasks complete.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from .champion import Champion
+from .item import Item
+from .stream import iter_files, iter_matches, iter_range, split_lines, batched, feed, line_suffixes, _suffix, _open
+from .tft_api_class import MatchDto
+from . import decoder
+from . import current_tft_set
+
+# Task kinds
+FILES = 'files'
+RANGE = 'range'
+LINES = 'lines'
+
+
+def shard_files(files: list, shards: int) -> list:
+    """Split files into shards with roughly the same total file size"""
+    output = [[] for _ in range(shards)]
+    sizes = [0] * shards
+    # Largest file first, always add to the smallest shard
+    for file in sorted(files, key=lambda file: os.path.getsize(file), reverse=True):
+        index = sizes.index(min(sizes))
+        output[index].append(file)
+        sizes[index] += os.path.getsize(file)
+
+    return [shard for shard in output if shard]
+
+
+def _accumulators(champion_ids, item_ids, tft_set_number) -> tuple:
+    champions = {championId: Champion(championId, tft_set_number) for championId in champion_ids}
+    items = {id: Item(id, tft_set_number) for id in item_ids}
+    return champions, items
+
+
+def aggregate_shard(files: list, champion_ids=(), item_ids=(), tft_set_number=current_tft_set):
+    """Aggregate one shard of files
+
+    Return:
+        Tuple of (dict of championId -> Champion, dict of item id -> Item)
+    """
+    champions, items = _accumulators(champion_ids, item_ids, tft_set_number)
+    feed(iter_matches(files), champions.values(), items.values())
+
+    return champions, items
+
+
+def aggregate_task(task: tuple, champion_ids=(), item_ids=(), tft_set_number=current_tft_set):
+    """Aggregate one task from tasks()
+
+    Return:
+        Tuple of (dict of championId -> Champion, dict of item id -> Item)
+    """
+    kind = task[0]
+    if kind == FILES:
+        return aggregate_shard(task[1], champion_ids, item_ids, tft_set_number)
+    if kind == RANGE:
+        records = iter_range(*task[1:])
+    elif kind == LINES:
+        records = (decoder.loads(line) for line in task[1])
+    else:
+        raise ValueError(f"{kind} is not a valid task")
+    champions, items = _accumulators(champion_ids, item_ids, tft_set_number)
+    feed((MatchDto(record) for record in records), champions.values(), items.values())
+
+    return champions, items
+
+
+def tasks(files: list, workers: int, batch_size: int = 1000):
+    """Yield record level tasks of files
+
+    Plain line files are split into about 4 byte ranges per worker in total, so workers finishing early
+    can take more work. gzip'd line files can not be split without decompressing them, their lines are
+    read here and yielded in batches of `batch_size`.
+    """
+    plain = [file for file in files if file.suffix != '.gz' and _suffix(file) in line_suffixes]
+    compressed = [file for file in files if file.suffix == '.gz' and _suffix(file) in line_suffixes]
+    single = [file for file in files if _suffix(file) not in line_suffixes]
+    # Byte ranges, sized from the total so small files are not split
+    total = sum(os.path.getsize(file) for file in plain)
+    for file in plain:
+        pieces = max(round(4 * workers * os.path.getsize(file) / max(total, 1)), 1)
+        for start, end in split_lines(file, pieces):
+            yield (RANGE, file, start, end)
+    for shard in shard_files(single, workers):
+        yield (FILES, shard)
+    for file in compressed:
+        with _open(file) as f:
+            for lines in batched((line for line in f if line.strip()), batch_size):
+                yield (LINES, lines)
+
+
+def aggregate(source, champion_ids=(), item_ids=(), tft_set_number=current_tft_set, workers: int = None,
+              batch_size: int = 1000):
+    """Aggregate Champion / Item stats with a process pool
+
+    Args:
+        source: Path, directory or list of them, see tft_parse.stream
+        champion_ids: championId to aggregate
+        item_ids: Item id to aggregate
+        tft_set_number: Set number for Champion / Item
+        workers: Number of processes, default to number of CPUs
+        batch_size: Number of lines per task of gzip'd line files
+
+    Return:
+        Tuple of (dict of championId -> Champion, dict of item id -> Item)
+    """
+    files = list(iter_files(source))
+    if '-' in files:
+        raise ValueError("Unable to shard stdin")
+    workers = workers or os.cpu_count()
+    champions, items = _accumulators(champion_ids, item_ids, tft_set_number)
+
+    def reduce(futures):
+        for future in futures:
+            shard_champions, shard_items = future.result()
+            for championId, champion in shard_champions.items():
+                champions[championId].merge(champion)
+            for id, item in shard_items.items():
+                items[id].merge(item)
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = set()
+        for task in tasks(files, workers, batch_size):
+            pending.add(executor.submit(aggregate_task, task, list(champions), list(items), tft_set_number))
+            # Bound the number of tasks in flight, batches of gzip'd lines are held in memory
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                reduce(done)
+        # Reduce partial results as they are done
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            reduce(done)
+
+    return champions, items
@@ -0,0 +1,226 @@
+"""Columnar tables of units and traits for a batch of matches
+
+Requires numpy (`pip install tft_parse[numpy]`).
+"""
+from array import array
+import numpy as np
+from .stream import iter_matches
+
+
+class MatchBatch:
+    """Flatten many MatchDto into contiguous numpy arrays
+
+    String values are integer encoded, use the vocabularies (e.g. `champions`) to decode them.
+
+    Vocabularies:
+        champions: character_id of each champion code
+        trait_keys: trait name of each trait code
+        patches: patch of each patch code
+        regions: region of each region code
+        queues: queue of each queue code
+
+    Match table (one row per match):
+        match_ids:    match_id
+        match_patch:  patch code
+        match_region: region code
+        match_queue:  queue code
+
+    Unit table (one row per unit):
+        unit_match:        match row
+        unit_participant:  participant row (counted across matches)
+        unit_character_id: champion code
+        unit_tier:         star
+        unit_rarity:       unit rarity
+        unit_placement:    placement of the unit's participant
+        unit_patch:        patch code
+        unit_items:        (units, max_items) item ids, padded with -1
+
+    Trait table (one row per trait):
+        trait_match:        match row
+        trait_key:          trait code
+        trait_style:        style (0 = No style, 1 = Bronze, 2 = Silver, 3 = Gold, 4 = Chromatic)
+        trait_num_units:    number of units with this trait
+        trait_tier_current: current active tier
+        trait_tier_total:   total tiers of the trait
+        trait_placement:    placement of the trait's participant
+    """
+    max_items = 3
+
+    def __init__(self, matches):
+        self.champions = []
+        self.trait_keys = []
+        self.patches = []
+        self.regions = []
+        self.queues = []
+        self.match_ids = []
+        self._champion_index = {}
+        self._trait_index = {}
+        self._patch_index = {}
+        self._region_index = {}
+        self._queue_index = {}
+        match_columns = {key: array('q') for key in ['patch', 'region', 'queue']}
+        participant_row = 0
+        # Build with array, then convert to numpy without copying
+        unit_columns = {
+            key: array('q') for key in ['match', 'participant', 'character_id', 'tier', 'rarity', 'placement', 'patch']
+        }
+        unit_items = array('q')
+        trait_columns = {
+            key: array('q') for key in ['match', 'key', 'style', 'num_units', 'tier_current', 'tier_total', 'placement']
+        }
+        padding = [-1] * self.max_items
+
+        for match_row, match in enumerate(matches):
+            self.match_ids.append(match.metadata.match_id)
+            patch = self._encode(self.patches, self._patch_index, match.info.patch)
+            match_columns['patch'].append(patch)
+            match_columns['region'].append(self._encode(self.regions, self._region_index, match.metadata.region))
+            match_columns['queue'].append(self._encode(self.queues, self._queue_index, match.info.queue))
+            for participant in match.info.participants:
+                placement = participant.placement
+                for unit in participant.units:
+                    if len(unit.items) > self.max_items:
+                        raise ValueError(f"{unit.character_id} has more than {self.max_items} items")
+                    unit_columns['match'].append(match_row)
+                    unit_columns['participant'].append(participant_row)
+                    unit_columns['character_id'].append(
+                        self._encode(self.champions, self._champion_index, unit.character_id))
+                    unit_columns['tier'].append(unit.tier)
+                    unit_columns['rarity'].append(unit.rarity)
+                    unit_columns['placement'].append(placement)
+                    unit_columns['patch'].append(patch)
+                    unit_items.extend(unit.items)
+                    unit_items.extend(padding[len(unit.items):])
+                for trait in participant.traits:
+                    trait_columns['match'].append(match_row)
+                    trait_columns['key'].append(self._encode(self.trait_keys, self._trait_index, trait.name))
+                    trait_columns['style'].append(trait.style)
+                    trait_columns['num_units'].append(trait.num_units)
+                    trait_columns['tier_current'].append(trait.tier_current)
+                    trait_columns['tier_total'].append(trait.tier_total)
+                    trait_columns['placement'].append(placement)
+                participant_row += 1
+        self.n_participants = participant_row
+
+        # Match table
+        self.match_patch = np.frombuffer(match_columns['patch'], dtype=np.int64)
+        self.match_region = np.frombuffer(match_columns['region'], dtype=np.int64)
+        self.match_queue = np.frombuffer(match_columns['queue'], dtype=np.int64)
+        # Unit table
+        self.unit_match = np.frombuffer(unit_columns['match'], dtype=np.int64)
+        self.unit_participant = np.frombuffer(unit_columns['participant'], dtype=np.int64)
+        self.unit_character_id = np.frombuffer(unit_columns['character_id'], dtype=np.int64)
+        self.unit_tier = np.frombuffer(unit_columns['tier'], dtype=np.int64)
+        self.unit_rarity = np.frombuffer(unit_columns['rarity'], dtype=np.int64)
+        self.unit_placement = np.frombuffer(unit_columns['placement'], dtype=np.int64)
+        self.unit_patch = np.frombuffer(unit_columns['patch'], dtype=np.int64)
+        self.unit_items = np.frombuffer(unit_items, dtype=np.int64).reshape(-1, self.max_items)
+        # Trait table
+        self.trait_match = np.frombuffer(trait_columns['match'], dtype=np.int64)
+        self.trait_key = np.frombuffer(trait_columns['key'], dtype=np.int64)
+        self.trait_style = np.frombuffer(trait_columns['style'], dtype=np.int64)
+        self.trait_num_units = np.frombuffer(trait_columns['num_units'], dtype=np.int64)
+        self.trait_tier_current = np.frombuffer(trait_columns['tier_current'], dtype=np.int64)
+        self.trait_tier_total = np.frombuffer(trait_columns['tier_total'], dtype=np.int64)
+        self.trait_placement = np.frombuffer(trait_columns['placement'], dtype=np.int64)
+
+    @classmethod
+    def from_source(cls, source) -> 'MatchBatch':
+        """Build from a path, directory or list of them, see tft_parse.stream"""
+        return cls(iter_matches(source))
+
+    @staticmethod
+    def _encode(vocab: list, index: dict, value) -> int:
+        code = index.get(value)
+        if code is None:
+            code = len(vocab)
+            index[value] = code
+            vocab.append(value)
+        return code
+
+    def code(self, vocab: str, value):
+        """Integer code of a value of a vocabulary, None if the value is not in the batch
+
+        Args:
+            vocab: 'champions', 'trait_keys', 'patches', 'regions' or 'queues'
+            value: e.g. 'TFT4_Aatrox' for 'champions'
+        """
+        indexes = {
+            'champions': self._champion_index,
+            'trait_keys': self._trait_index,
+            'patches': self._patch_index,
+            'regions': self._region_index,
+            'queues': self._queue_index,
+        }
+        if vocab not in indexes:
+            raise ValueError(f"{vocab} does not exist")
+        return indexes[vocab].get(value)
+
+    def __len__(self):
+        """Number of matches"""
+        return len(self.match_ids)
+
+    def _unit_mask(self, patch=None):
+        if patch is None:
+            return slice(None)
+        if patch not in self._patch_index:
+            return np.zeros(len(self.unit_patch), dtype=bool)
+        return self.unit_patch == self._patch_index[patch]
+
+    def champion_counts(self, patch: str = None) -> dict:
+        """Number of units per character_id"""
+        counts = np.bincount(self.unit_character_id[self._unit_mask(patch)], minlength=len(self.champions))
+        return {champion: int(count) for champion, count in zip(self.champions, counts) if count > 0}
+
+    def champion_placement(self, patch: str = None) -> dict:
+        """Average placement per character_id"""
+        mask = self._unit_mask(patch)
+        character_id = self.unit_character_id[mask]
+        counts = np.bincount(character_id, minlength=len(self.champions))
+        total = np.bincount(character_id, weights=self.unit_placement[mask], minlength=len(self.champions))
+        return {
+            champion: float(total[code] / counts[code])
+            for code, champion in enumerate(self.champions) if counts[code] > 0
+        }
+
+    def _items_flat(self, patch=None):
+        """Item ids and their unit row, padding removed"""
+        items = self.unit_items[self._unit_mask(patch)]
+        held = items >= 0
+        rows = np.nonzero(held)[0]
+        return items[held], rows
+
+    def item_counts(self, patch: str = None) -> dict:
+        """Number of times each item is held"""
+        items, _ = self._items_flat(patch)
+        counts = np.bincount(items)
+        return {int(item): int(counts[item]) for item in np.nonzero(counts)[0]}
+
+    def item_placement(self, patch: str = None) -> dict:
+        """Average placement of units holding each item"""
+        items, rows = self._items_flat(patch)
+        placement = self.unit_placement[self._unit_mask(patch)][rows]
+        counts = np.bincount(items)
+        total = np.bincount(items, weights=placement)
+        return {int(item): float(total[item] / counts[item]) for item in np.nonzero(counts)[0]}
+
+    def champion_item_counts(self, patch: str = None) -> dict:
+        """Number of times each item is held by each character_id
+
+        Return:
+            dict of character_id -> {item id: count}
+        """
+        items, rows = self._items_flat(patch)
+        character_id = self.unit_character_id[self._unit_mask(patch)][rows]
+        width = int(items.max()) + 1 if len(items) else 1
+        counts = np.bincount(character_id * width + items, minlength=len(self.champions) * width)
+        counts = counts.reshape(len(self.champions), width)
+        output = {}
+        for code, item in zip(*np.nonzero(counts)):
+            output.setdefault(self.champions[code], {})[int(item)] = int(counts[code, item])
+        return output
+
+    def trait_counts(self, min_style: int = 1) -> dict:
+        """Number of participants with each trait at `min_style` or above"""
+        counts = np.bincount(self.trait_key[self.trait_style >= min_style], minlength=len(self.trait_keys))
+        return {key: int(count) for key, count in zip(self.trait_keys, counts) if count > 0}
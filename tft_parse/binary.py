@@ -0,0 +1,277 @@
+"""Compact binary format for aggregated Champion / Item stats
+
+Layout (little endian on every host, every section 8 byte aligned):
+
+    header:  magic b'TFTS', uint16 version, uint16 kind, uint32 number of records, uint32 number of tables
+    strings: uint32 number of strings, uint32 offsets[n + 1], utf-8 bytes
+    ids:     int64[records], item id or string index of championId
+    counts:  int64[records], champion_occurrence (0 for items)
+    tables:  for each counter of `tables[kind]`: int64 offsets[records + 1], keys[], uint32 counts[]
+
+Item ids and tiers are stored as int32 keys, str keys (e.g. chosen) as int32 string index and item
+combinations as int64 packed with misc.item_comb_pack(). The first string is the set number encoded as json,
+so its type is kept (e.g. 4 or '4.5'). Every object must be from the same set.
+
+StatsView reads the counters straight from the buffer (e.g. a mmap) without copying them:
+
+    with open('champions.tfts', 'wb') as f:
+        f.write(dumps(champions))
+    with open_stats('champions.tfts') as view:
+        offsets, keys, counts = view.arrays('item')
+        champions = view.to_objects()
+
+Arrays are byte swapped when written and read on big endian hosts, where StatsView copies them.
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+from contextlib import suppress
+from .champion import Champion
+from .item import Item
+from .misc import item_comb_pack, item_comb_unpack
+
+version = 2
+magic = b'TFTS'
+header = struct.Struct('<4sHHII')
+little = sys.byteorder == 'little'
+
+CHAMPION = 1
+ITEM = 2
+# Key types
+INT = 0
+STR = 1
+COMB = 2
+key_formats = {INT: 'i', STR: 'i', COMB: 'q'}
+# Counter tables (attribute name, key type) per kind
+tables = {
+    CHAMPION: [
+        ('tier', INT), ('item', INT), ('item_1', INT), ('item_2', INT), ('item_3', INT),
+        ('item_comb', COMB), ('item_comb_1', COMB), ('item_comb_2', COMB), ('item_comb_3', COMB),
+        ('chosen', STR),
+    ],
+    ITEM: [('champion', STR), ('item_combination', COMB), ('item_other', INT)],
+}
+
+
+def _pad(size: int) -> bytes:
+    return b'\x00' * (-size % 8)
+
+
+def _bytes(values: array) -> bytes:
+    """Little endian bytes of an array"""
+    if not little:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _cast(view: memoryview, fmt: str):
+    """Little endian buffer as an array of fmt, a copy on big endian hosts"""
+    if little:
+        return view.cast(fmt)
+    values = array(fmt, bytes(view))
+    values.byteswap()
+    return values
+
+
+def _aligned(values: array) -> bytes:
+    data = _bytes(values)
+    return data + _pad(len(data))
+
+
+def dumps(objects) -> bytes:
+    """Serialize a list of Champion or a list of Item"""
+    objects = list(objects)
+    if all(isinstance(obj, Champion) for obj in objects):
+        kind = CHAMPION
+        tft_set_number = objects[0].tft_set_number if objects else ''
+    elif all(isinstance(obj, Item) for obj in objects):
+        kind = ITEM
+        tft_set_number = objects[0].tft_set_number if objects else ''
+    else:
+        raise ValueError("objects must be all Champion or all Item")
+    if len({str(obj.tft_set_number) for obj in objects}) > 1:
+        raise ValueError("objects must be from the same set")
+
+    strings = {json.dumps(tft_set_number): 0}
+
+    def string_index(value: str) -> int:
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    encoders = {INT: int, STR: string_index, COMB: item_comb_pack}
+    # Records
+    ids = array('q', [
+        string_index(obj.championId) if kind == CHAMPION else obj.item for obj in objects
+    ])
+    occurrence = array('q', [obj.champion_occurrence if kind == CHAMPION else 0 for obj in objects])
+    # Counter tables
+    sections = []
+    for name, key_type in tables[kind]:
+        offsets, keys, counts = array('q', [0]), array(key_formats[key_type]), array('I')
+        encode = encoders[key_type]
+        try:
+            for obj in objects:
+                for key, count in getattr(obj, name).items():
+                    keys.append(encode(key))
+                    counts.append(count)
+                offsets.append(len(keys))
+        except OverflowError:
+            raise ValueError(f"{name} has a key or count out of range")
+        sections += [_aligned(offsets), _aligned(keys), _aligned(counts)]
+
+    # String table
+    encoded = [string.encode() for string in strings]
+    string_offsets = array('I', [0])
+    for string in encoded:
+        string_offsets.append(string_offsets[-1] + len(string))
+    string_table = struct.pack('<I', len(encoded)) + _bytes(string_offsets) + b''.join(encoded)
+
+    output = [
+        header.pack(magic, version, kind, len(objects), len(tables[kind])),
+        string_table, _pad(len(string_table)),
+        _bytes(ids), _bytes(occurrence),
+    ] + sections
+    return b''.join(output)
+
+
+class StatsView:
+    """Read-only view over serialized stats, counters are not copied
+
+    close() (or a with block) releases the buffer, arrays from arrays() can not be used after that.
+    """
+
+    def __init__(self, buffer):
+        self._mmap = None  # Closed by close(), set by open_stats()
+        # Header checked before exporting the buffer, so a map of an incorrect file can be closed
+        file_magic, self.version, self.kind, self.n_records, n_tables = header.unpack_from(buffer, 0)
+        if file_magic != magic:
+            raise ValueError("Not a tft_parse stats file")
+        # Version 1 stored the set number as str
+        if self.version not in (1, version):
+            raise ValueError(f"Version {self.version} is not supported")
+        if self.kind not in tables or n_tables != len(tables[self.kind]):
+            raise ValueError(f"Kind {self.kind} is not supported")
+        self.buffer = memoryview(buffer)
+        position = header.size
+        # String table
+        n_strings, = struct.unpack_from('<I', self.buffer, position)
+        position += 4
+        string_offsets = _cast(self.buffer[position:position + 4 * (n_strings + 1)], 'I')
+        position += 4 * (n_strings + 1)
+        self.strings = [
+            bytes(self.buffer[position + string_offsets[i]:position + string_offsets[i + 1]]).decode()
+            for i in range(n_strings)
+        ]
+        position += string_offsets[-1]
+        position += -position % 8
+        self.tft_set_number = self.strings[0] if self.version == 1 else json.loads(self.strings[0])
+        # Records
+        self._ids = self._int64(position, self.n_records)
+        position += 8 * self.n_records
+        self.champion_occurrence = self._int64(position, self.n_records)
+        position += 8 * self.n_records
+        # Counter tables
+        self._tables = {}
+        for name, key_type in tables[self.kind]:
+            offsets = self._int64(position, self.n_records + 1)
+            position += 8 * (self.n_records + 1)
+            total = offsets[-1]
+            keys, position = self._array(position, total, key_formats[key_type])
+            counts, position = self._array(position, total, 'I')
+            self._tables[name] = (offsets, keys, counts, key_type)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """Release the buffer and close the memory map of open_stats()"""
+        views = [self._ids, self.champion_occurrence]
+        views += [array for offsets, keys, counts, _ in self._tables.values() for array in (offsets, keys, counts)]
+        for view in views:
+            # Arrays are copies on big endian hosts
+            if isinstance(view, memoryview):
+                view.release()
+        self.buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _int64(self, position: int, n: int):
+        return _cast(self.buffer[position:position + 8 * n], 'q')
+
+    def _array(self, position: int, n: int, fmt: str) -> tuple:
+        """Array at position and the next aligned position"""
+        size = struct.calcsize(fmt) * n
+        return _cast(self.buffer[position:position + size], fmt), position + size + (-size % 8)
+
+    def __len__(self):
+        return self.n_records
+
+    @property
+    def ids(self) -> list:
+        """championId or item id of each record"""
+        if self.kind == CHAMPION:
+            return [self.strings[i] for i in self._ids]
+        return list(self._ids)
+
+    def arrays(self, name: str) -> tuple:
+        """Raw (offsets, keys, counts) arrays of a counter table
+
+        Counters of record i are keys[offsets[i]:offsets[i + 1]], str keys are indexes of `strings`
+        """
+        offsets, keys, counts, _ = self._tables[name]
+        return offsets, keys, counts
+
+    def counter(self, index: int, name: str) -> dict:
+        """Decode one counter of one record"""
+        offsets, keys, counts, key_type = self._tables[name]
+        start, end = offsets[index], offsets[index + 1]
+        if key_type == STR:
+            decode = self.strings.__getitem__
+        elif key_type == COMB:
+            decode = item_comb_unpack
+        else:
+            decode = int
+        return {decode(key): count for key, count in zip(keys[start:end], counts[start:end])}
+
+    def to_objects(self) -> list:
+        """Decode to a list of Champion or Item"""
+        output = []
+        for index, id in enumerate(self.ids):
+            if self.kind == CHAMPION:
+                obj = Champion(id, self.tft_set_number)
+                obj.champion_occurrence = self.champion_occurrence[index]
+            else:
+                obj = Item(id, self.tft_set_number)
+            for name, _ in tables[self.kind]:
+                setattr(obj, name, self.counter(index, name))
+            output.append(obj)
+        return output
+
+
+def loads(buffer) -> list:
+    """Deserialize bytes from dumps() to a list of Champion or Item"""
+    with StatsView(buffer) as view:
+        return view.to_objects()
+
+
+def open_stats(path) -> StatsView:
+    """Memory map a file written with dumps(), close the StatsView to unmap it"""
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        view = StatsView(buffer)
+    except BaseException:
+        # Views of a truncated file may reference the map until they are collected
+        with suppress(BufferError):
+            buffer.close()
+        raise
+    view._mmap = buffer
+    return view
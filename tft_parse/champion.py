@@ -1,23 +1,35 @@
-import json
-import pkg_resources
-from pathlib import Path
+from copy import deepcopy
 from .tft_api_class import UnitDto
-from .misc import dict_add_count
+from .misc import dict_add_count, dict_merge_count, int_keys, item_comb_to_str, item_comb_from_str
+from .static_data import StaticData
 from . import current_tft_set
 
 
+def _tier_counter(table: str, tier: int):
+    """Property exposing one star level of a tier-indexed counter table (e.g. item_1 -> item_tier[1])"""
+    def getter(self):
+        return getattr(self, table)[tier]
+
+    def setter(self, value):
+        getattr(self, table)[tier] = value
+
+    return property(getter, setter)
+
+
 class Champion:
+    tiers = (1, 2, 3)  # Star levels
+    # Tier level counters, stored in item_tier / item_comb_tier
+    item_1 = _tier_counter('item_tier', 1)
+    item_2 = _tier_counter('item_tier', 2)
+    item_3 = _tier_counter('item_tier', 3)
+    item_comb_1 = _tier_counter('item_comb_tier', 1)
+    item_comb_2 = _tier_counter('item_comb_tier', 2)
+    item_comb_3 = _tier_counter('item_comb_tier', 3)
+
     def __init__(self, championId, tft_set_number: int = current_tft_set):
-        champion_json = Path(pkg_resources.resource_filename('tft_parse', f'data/{tft_set_number}/champions.json'))
-        with open(champion_json) as f:
-            champions = json.load(f)
-        # Get champion data
-        champion = [champion for champion in champions if champion.get('championId') == championId]
-        # Sanity check: champion
-        if len(champion) == 0:
-            raise ValueError(f"{championId} does not exist")
-        else:
-            self.champion = champion[0]
+        # Get champion data, raise ValueError if champion does not exist
+        self.champion = StaticData.get(tft_set_number).champion(championId)
+        self.tft_set_number = tft_set_number
         # Champion data
         self.championId = self.champion['championId']
         self.name = self.champion['name']
@@ -28,34 +40,71 @@ class Champion:
         self.tier = {}
         # Items
         self.item = {}  # Log item use
-        self.item_1 = {}  # Log item use at 1 tier
-        self.item_2 = {}  # Log item use at 2 tier
-        self.item_3 = {}  # Log item use at 3 tier
+        self.item_tier = [{} for _ in range(max(self.tiers) + 1)]  # Log item use indexed by tier
+        # Item combinations are keyed by sorted tuple of item ids, see misc.item_comb_key()
         self.item_comb = {}  # Log item combaination
-        self.item_comb_1 = {}  # Log item combination at 1 tier
-        self.item_comb_2 = {}  # Log item combination at 2 tier
-        self.item_comb_3 = {}  # Log item combination at 3 tier
+        self.item_comb_tier = [{} for _ in range(max(self.tiers) + 1)]  # Log item combination indexed by tier
         # Chosen
         self.chosen = {}
 
     def from_dict(self, data: dict) -> None:
-        """Parse data from previous data"""
+        """Parse data from previous data
+
+        Item id and tier keys turned into str by a json round trip are converted back to int.
+        """
         # Occurance
         self.champion_occurrence = data['champion_occurrence']
-        self.tier = data['tier']
+        self.tier = int_keys(data['tier'])
         # Item
-        self.item = data['item']
-        self.item_1 = data['item_1']
-        self.item_2 = data['item_2']
-        self.item_3 = data['item_3']
-        # Item combinations
-        self.item_comb = data['item_comb']
-        self.item_comb_1 = data['item_comb_1']
-        self.item_comb_2 = data['item_comb_2']
-        self.item_comb_3 = data['item_comb_3']
+        self.item = int_keys(data['item'])
+        self.item_1 = int_keys(data['item_1'])
+        self.item_2 = int_keys(data['item_2'])
+        self.item_3 = int_keys(data['item_3'])
+        # Item combinations, str keys from to_dict() are converted back to tuple
+        self.item_comb = self._comb_from_str(data['item_comb'])
+        self.item_comb_1 = self._comb_from_str(data['item_comb_1'])
+        self.item_comb_2 = self._comb_from_str(data['item_comb_2'])
+        self.item_comb_3 = self._comb_from_str(data['item_comb_3'])
         # Chosen
         self.chosen = data['chosen']
 
+    def merge(self, other: 'Champion') -> 'Champion':
+        """Add counts from another Champion of the same championId
+
+        Return:
+            self
+        """
+        if other.championId != self.championId:
+            raise ValueError(f"{other.championId} is not the same as {self.championId}")
+        # Occurance
+        self.champion_occurrence += other.champion_occurrence
+        self.tier = dict_merge_count(self.tier, other.tier)
+        # Item
+        self.item = dict_merge_count(self.item, other.item)
+        self.item_1 = dict_merge_count(self.item_1, other.item_1)
+        self.item_2 = dict_merge_count(self.item_2, other.item_2)
+        self.item_3 = dict_merge_count(self.item_3, other.item_3)
+        # Item combinations
+        self.item_comb = dict_merge_count(self.item_comb, other.item_comb)
+        self.item_comb_1 = dict_merge_count(self.item_comb_1, other.item_comb_1)
+        self.item_comb_2 = dict_merge_count(self.item_comb_2, other.item_comb_2)
+        self.item_comb_3 = dict_merge_count(self.item_comb_3, other.item_comb_3)
+        # Chosen
+        self.chosen = dict_merge_count(self.chosen, other.chosen)
+
+        return self
+
+    def __add__(self, other: 'Champion') -> 'Champion':
+        return deepcopy(self).merge(other)
+
+    @staticmethod
+    def _comb_to_str(item_comb: dict) -> dict:
+        return {item_comb_to_str(key): value for key, value in item_comb.items()}
+
+    @staticmethod
+    def _comb_from_str(item_comb: dict) -> dict:
+        return {item_comb_from_str(key): value for key, value in item_comb.items()}
+
     def to_dict(self):
         """Convert to dict
 
@@ -73,10 +122,10 @@ class Champion:
             'item_1': self.item_1,
             'item_2': self.item_2,
             'item_3': self.item_3,
-            'item_comb': self.item_comb,
-            'item_comb_1': self.item_comb_1,
-            'item_comb_2': self.item_comb_2,
-            'item_comb_3': self.item_comb_3,
+            'item_comb': self._comb_to_str(self.item_comb),
+            'item_comb_1': self._comb_to_str(self.item_comb_1),
+            'item_comb_2': self._comb_to_str(self.item_comb_2),
+            'item_comb_3': self._comb_to_str(self.item_comb_3),
             'chosen': self.chosen,
             'tier': self.tier
         }
@@ -87,22 +136,23 @@ class Champion:
         """Parse UnitDto"""
         if unit.character_id != self.championId:
             raise ValueError(f"{unit.character_id} is not the same as {self.championId}")
+        tier = unit.tier
+        if tier not in self.tiers:
+            raise ValueError(f"{tier} is not a valid tier")
         # ==== Item ==== #
-        # Get tier level item
-        item_indv_tier = self.__getattribute__(f"item_{unit.tier}")
-        item_comb_tier = self.__getattribute__(f"item_comb_{unit.tier}")
-
-        # Add item to dict
+        # Counters are updated in place, dict.get is used instead of dict_add_count() as this is the hot loop
+        item_all = self.item
+        item_indv_tier = self.item_tier[tier]
         # Inidividual items
         for item in unit.items:
-            self.item = dict_add_count(self.item, item)  # champion level
-            item_indv_tier = dict_add_count(item_indv_tier, item)  # tier level
-        # Write tier level back to class
-        self.__setattr__(f"item_{unit.tier}", item_indv_tier)
+            item_all[item] = item_all.get(item, 0) + 1  # champion level
+            item_indv_tier[item] = item_indv_tier.get(item, 0) + 1  # tier level
 
-        # Item combinations
-        self.item_comb = dict_add_count(self.item_comb, str(unit.items))  # champion level
-        self.__setattr__(f"item_{unit.tier}_comb", dict_add_count(item_comb_tier, str(unit.items)))  # tier level
+        # Item combinations, unit.items is already sorted
+        item_comb = tuple(unit.items)
+        item_comb_tier = self.item_comb_tier[tier]
+        self.item_comb[item_comb] = self.item_comb.get(item_comb, 0) + 1  # champion level
+        item_comb_tier[item_comb] = item_comb_tier.get(item_comb, 0) + 1  # tier level
 
         # ==== Chosen ==== #
         # If unit chosen add to dict
@@ -111,4 +161,4 @@ class Champion:
 
         # ==== Occurance ==== #
         self.champion_occurrence += 1
-        self.tier = dict_add_count(self.tier, unit.tier)
+        self.tier[tier] = self.tier.get(tier, 0) + 1
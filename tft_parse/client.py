@@ -0,0 +1,229 @@
+"""Async client for the Riot TFT match-v1 API
+
+Requests go through a small HTTP/1.1 keep-alive connection pool per routing region (AMERICAS, ASIA, EUROPE)
+and are scheduled by token buckets, one set of buckets per routing region. 429 responses pause the region
+for Retry-After seconds before retrying.
+
+Example:
+    async with TftClient(api_key) as client:
+        match_ids = await client.get_match_ids(puuid, 'AMERICAS')
+        matches = await client.get_matches(match_ids)
+"""
+import asyncio
+import ssl
+import time
+from urllib.parse import urlsplit, urlencode
+from .tft_api_class import MatchDto
+from .misc import route_region
+from . import decoder
+
+
+class APIError(ValueError):
+    """Non successful API response"""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"{status} response from {url}")
+        self.status = status
+        self.url = url
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests every `per` seconds"""
+
+    def __init__(self, rate: int, per: float = 1.0, clock=time.monotonic):
+        self.rate = rate
+        self.per = per
+        self.clock = clock
+        self.tokens = float(rate)
+        self.updated = clock()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+        self.updated = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = self.clock()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) * self.per / self.rate)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds`, e.g. from a Retry-After header"""
+        self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+
+class ConnectionPool:
+    """HTTP/1.1 keep-alive connections to one host"""
+
+    def __init__(self, url: str, size: int = 10, timeout: float = 10):
+        url = urlsplit(url)
+        self.host = url.hostname
+        self.use_ssl = url.scheme == 'https'
+        self.port = url.port or (443 if self.use_ssl else 80)
+        self.base_path = url.path.rstrip('/')
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle = []
+        self._semaphore = asyncio.Semaphore(size)
+
+    async def _connect(self):
+        self.connections_opened += 1
+        return await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=ssl.create_default_context() if self.use_ssl else None),
+            self.timeout
+        )
+
+    async def request(self, path: str, headers: dict) -> tuple:
+        """Send GET request
+
+        Return:
+            Tuple of (status, headers, body)
+        """
+        async with self._semaphore:
+            reused = bool(self._idle)
+            reader, writer = self._idle.pop() if reused else await self._connect()
+            try:
+                status, response_headers, body = await self._send_or_close(reader, writer, path, headers)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # Idle connection may have been closed by the server, retry once with a new one
+                if not reused:
+                    raise
+                reader, writer = await self._connect()
+                status, response_headers, body = await self._send_or_close(reader, writer, path, headers)
+
+            if response_headers.get('connection', '').lower() == 'close':
+                writer.close()
+            else:
+                self._idle.append((reader, writer))
+            return status, response_headers, body
+
+    async def _send_or_close(self, reader, writer, path: str, headers: dict) -> tuple:
+        """Send request, close the connection on any error"""
+        try:
+            return await asyncio.wait_for(self._send(reader, writer, path, headers), self.timeout)
+        except BaseException:
+            writer.close()
+            raise
+
+    async def _send(self, reader, writer, path: str, headers: dict) -> tuple:
+        lines = [f"GET {self.base_path}{path} HTTP/1.1", f"Host: {self.host}", "Connection: keep-alive"]
+        lines += [f"{key}: {value}" for key, value in headers.items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode())
+        await writer.drain()
+        # Status line and headers
+        status_line = await reader.readuntil(b'\r\n')
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                break
+            key, value = line.decode('latin-1').split(':', 1)
+            response_headers[key.strip().lower()] = value.strip()
+        # Body
+        if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = bytearray()
+            while True:
+                size = int((await reader.readuntil(b'\r\n')).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readuntil(b'\r\n')
+                    break
+                body += await reader.readexactly(size)
+                await reader.readexactly(2)
+            body = bytes(body)
+        else:
+            body = await reader.readexactly(int(response_headers.get('content-length', 0)))
+        return status, response_headers, body
+
+    def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle = []
+
+
+class TftClient:
+    """Async TFT match-v1 client
+
+    Args:
+        api_key: Riot API key
+        base_url: URL with `{routing}` placeholder for the routing region
+        limits: List of (requests, seconds) rate limits applied per routing region
+        pool_size: Max connections per routing region
+        max_retries: Max retries on 429 / 5xx responses
+        timeout: Connection and request timeout in seconds
+    """
+
+    def __init__(self, api_key: str, base_url: str = 'https://{routing}.api.riotgames.com',
+                 limits=((20, 1), (100, 120)), pool_size: int = 10, max_retries: int = 3, timeout: float = 10):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.limits = limits
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._pools = {}
+        self._buckets = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    def close(self):
+        for pool in self._pools.values():
+            pool.close()
+        self._pools = {}
+
+    def _pool(self, routing: str) -> ConnectionPool:
+        if routing not in self._pools:
+            url = self.base_url.format(routing=routing.lower())
+            self._pools[routing] = ConnectionPool(url, self.pool_size, self.timeout)
+            self._buckets[routing] = [TokenBucket(rate, per) for rate, per in self.limits]
+        return self._pools[routing]
+
+    async def request(self, routing: str, path: str):
+        """GET path from a routing region and decode json"""
+        routing = routing.upper()
+        pool = self._pool(routing)
+        buckets = self._buckets[routing]
+        for attempt in range(self.max_retries + 1):
+            for bucket in buckets:
+                await bucket.acquire()
+            status, headers, body = await pool.request(path, {'X-Riot-Token': self.api_key})
+            if status == 200:
+                return decoder.loads(body)
+            if attempt == self.max_retries or (status != 429 and status < 500):
+                raise APIError(status, path)
+            # Rate limited or server error: wait before retry
+            try:
+                retry_after = float(headers.get('retry-after', 2 ** attempt))
+            except ValueError:
+                # Retry-After as an HTTP-date
+                retry_after = 2 ** attempt
+            for bucket in buckets:
+                bucket.pause(retry_after)
+
+    async def get_match_ids(self, puuid: str, routing: str, count: int = 20) -> list:
+        """List of match ids of a player"""
+        query = urlencode({'count': count})
+        return await self.request(routing, f"/tft/match/v1/matches/by-puuid/{puuid}/ids?{query}")
+
+    async def get_match(self, match_id: str, **kwargs) -> MatchDto:
+        """Get match detail, kwargs are passed to MatchDto"""
+        routing = route_region(match_id.split('_')[0])
+        return MatchDto(await self.request(routing, f"/tft/match/v1/matches/{match_id}"), **kwargs)
+
+    async def get_matches(self, match_ids, **kwargs) -> list:
+        """Get match details concurrently, kwargs are passed to MatchDto"""
+        return await asyncio.gather(*[self.get_match(match_id, **kwargs) for match_id in match_ids])
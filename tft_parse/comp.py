@@ -0,0 +1,165 @@
+"""Group final boards into compositions (comps)
+
+Each board is encoded as a sparse set of features: active trait tiers (e.g. Cultist_3) and units
+(e.g. TFT4_Jax). Boards are clustered with MinHash signatures and locality sensitive hashing (LSH): boards
+sharing all MinHash values of any band end up in the same comp. Every step is vectorized with numpy and
+boards are hashed in chunks, so memory does not grow with the number of hashes times boards.
+
+Requires numpy (`pip install tft_parse[numpy]`).
+"""
+from array import array
+import numpy as np
+
+
+class CompAnalysis:
+    """Cluster boards into comps and report their placement
+
+    Args:
+        n_hashes: Number of MinHash values per board
+        bands: Number of LSH bands, must divide n_hashes. More bands merge less similar boards.
+        seed: Random seed of the hash functions
+        chunk_size: Number of boards hashed at once
+    """
+
+    def __init__(self, n_hashes: int = 32, bands: int = 4, seed: int = 0, chunk_size: int = 20000):
+        if n_hashes % bands != 0:
+            raise ValueError(f"{bands} bands does not divide {n_hashes} hashes")
+        self.n_hashes = n_hashes
+        self.bands = bands
+        self.chunk_size = chunk_size
+        random = np.random.RandomState(seed)
+        # Multiply-shift hash functions, ((a * x + b) mod 2^64) >> 32 with odd a
+        self._a = (random.randint(0, 2 ** 62, size=(n_hashes, 1)).astype(np.uint64) * 2 + 1)
+        self._b = random.randint(0, 2 ** 62, size=(n_hashes, 1)).astype(np.uint64)
+        # Odd 64 bit multipliers to hash each band into one value
+        self._band_multiplier = random.randint(0, 2 ** 62, size=n_hashes // bands).astype(np.uint64) * 2 + 1
+        # Boards in CSR format
+        self.features = []
+        self._feature_index = {}
+        self._indptr = array('q', [0])
+        self._indices = array('q')
+        self._placement = array('q')
+        self.labels = None
+
+    def __len__(self):
+        """Number of boards"""
+        return len(self._placement)
+
+    def add_board(self, features, placement: int) -> None:
+        """Add a board given its features (e.g. ['Cultist_3', 'TFT4_Jax'])"""
+        for feature in dict.fromkeys(features):
+            code = self._feature_index.get(feature)
+            if code is None:
+                code = len(self.features)
+                self._feature_index[feature] = code
+                self.features.append(feature)
+            self._indices.append(code)
+        self._indptr.append(len(self._indices))
+        self._placement.append(placement)
+        self.labels = None
+
+    def add_matches(self, matches) -> None:
+        """Add the final board of every participant of every MatchDto"""
+        for match in matches:
+            for participant in match.info.participants:
+                features = [trait.tier_name for trait in participant.traits if trait.tier_name is not None]
+                features += [unit.character_id for unit in participant.units]
+                self.add_board(features, participant.placement)
+
+    def _arrays(self):
+        return (
+            np.frombuffer(self._indptr, dtype=np.int64),
+            np.frombuffer(self._indices, dtype=np.int64),
+            np.frombuffer(self._placement, dtype=np.int64),
+        )
+
+    def signatures(self) -> np.ndarray:
+        """MinHash signature of every board, shape (boards, n_hashes)"""
+        indptr, indices, _ = self._arrays()
+        output = np.empty((len(self), self.n_hashes), dtype=np.uint32)
+        shift = np.uint64(32)
+        for start in range(0, len(self), self.chunk_size):
+            end = min(start + self.chunk_size, len(self))
+            chunk_indptr = indptr[start:end + 1]
+            # Hash every feature of the chunk, shape (n_hashes, features)
+            features = indices[chunk_indptr[0]:chunk_indptr[-1]].astype(np.uint64)
+            hashes = ((self._a * features + self._b) >> shift).astype(np.uint32)
+            non_empty = np.diff(chunk_indptr) > 0
+            starts = (chunk_indptr[:-1] - chunk_indptr[0])[non_empty]
+            # Empty boards keep the max value, so they are only similar to each other
+            chunk = np.full((end - start, self.n_hashes), np.iinfo(np.uint32).max, dtype=np.uint32)
+            if len(starts):
+                chunk[non_empty] = np.minimum.reduceat(hashes, starts, axis=1).T
+            output[start:end] = chunk
+        return output
+
+    def cluster(self) -> np.ndarray:
+        """Assign a comp to every board, comps are numbered by size (0 is the largest)"""
+        n = len(self)
+        signatures = self.signatures()
+        rows = self.n_hashes // self.bands
+        labels = np.arange(n, dtype=np.int64)
+        # Bucket boards per band
+        groups = []
+        for band in range(self.bands):
+            band_signature = signatures[:, band * rows:(band + 1) * rows].astype(np.uint64)
+            band_key = (band_signature * self._band_multiplier).sum(axis=1)
+            _, inverse = np.unique(band_key, return_inverse=True)
+            groups.append(inverse.reshape(-1))
+        # Connected components: propagate the smallest label through shared buckets until stable
+        while True:
+            previous = labels
+            for inverse in groups:
+                group_min = np.full(inverse.max() + 1 if n else 0, n, dtype=np.int64)
+                np.minimum.at(group_min, inverse, labels)
+                labels = np.minimum(labels, group_min[inverse])
+            # Pointer jumping
+            labels = labels[labels]
+            if np.array_equal(labels, previous):
+                break
+        # Number comps by size
+        _, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+        order = np.argsort(-counts, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        self.labels = rank[inverse.reshape(-1)]
+        return self.labels
+
+    def report(self, min_size: int = 1, min_frequency: float = 0.5) -> list:
+        """Placement stats per comp
+
+        Args:
+            min_size: Only comps with at least `min_size` boards
+            min_frequency: Features in at least this fraction of the comp's boards are listed
+
+        Return:
+            List of dicts ordered by comp size: comp, size, avg_placement, top4_rate, win_rate, features
+        """
+        labels = self.cluster() if self.labels is None else self.labels
+        indptr, indices, placement = self._arrays()
+        n_comps = int(labels.max()) + 1 if len(labels) else 0
+        size = np.bincount(labels, minlength=n_comps)
+        avg_placement = np.bincount(labels, weights=placement, minlength=n_comps) / np.maximum(size, 1)
+        top4_rate = np.bincount(labels, weights=placement <= 4, minlength=n_comps) / np.maximum(size, 1)
+        win_rate = np.bincount(labels, weights=placement == 1, minlength=n_comps) / np.maximum(size, 1)
+        # Feature frequency per comp
+        board = np.repeat(np.arange(len(labels)), np.diff(indptr))
+        pairs, pair_counts = np.unique(labels[board] * len(self.features) + indices, return_counts=True)
+        pair_comp = pairs // max(len(self.features), 1)
+        frequent = pair_counts >= min_frequency * size[pair_comp]
+        features = [[] for _ in range(n_comps)]
+        for comp, feature, count in zip(pair_comp[frequent], pairs[frequent] % max(len(self.features), 1),
+                                        pair_counts[frequent]):
+            features[comp].append((count, self.features[feature]))
+
+        return [
+            {
+                'comp': comp,
+                'size': int(size[comp]),
+                'avg_placement': float(avg_placement[comp]),
+                'top4_rate': float(top4_rate[comp]),
+                'win_rate': float(win_rate[comp]),
+                'features': [feature for _, feature in sorted(features[comp], key=lambda x: (-x[0], x[1]))],
+            }
+            for comp in range(n_comps) if size[comp] >= min_size
+        ]
@@ -0,0 +1,34 @@
+"""Pluggable json decoder
+
+Use the fastest installed json backend (orjson, then ujson), fall back to the standard library json.
+"""
+import json
+
+backends = {'json': json.loads}
+try:
+    import ujson
+    backends['ujson'] = ujson.loads
+except ImportError:  # pragma: no cover
+    pass
+try:
+    import orjson
+    backends['orjson'] = orjson.loads
+except ImportError:  # pragma: no cover
+    pass
+
+backend = next(name for name in ['orjson', 'ujson', 'json'] if name in backends)
+_loads = backends[backend]
+
+
+def loads(data):
+    """Decode json str or bytes with the current backend"""
+    return _loads(data)
+
+
+def set_backend(name: str) -> None:
+    """Set json backend, one of `backends`"""
+    global backend, _loads
+    if name not in backends:
+        raise ValueError(f"{name} is not installed")
+    backend = name
+    _loads = backends[name]
@@ -0,0 +1,150 @@
+"""Incremental Champion / Item aggregation with checkpoints
+
+The aggregator records every consumed match_id, the game_datetime window it covers and the last MatchStore
+rowid read. State is written atomically to a json checkpoint, so a restarted job only parses matches it has
+not seen before:
+
+    aggregator = IncrementalAggregator('checkpoint.json', champion_ids, item_ids)
+    aggregator.update_from_store(store)
+    aggregator.checkpoint()
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+from .champion import Champion
+from .item import Item
+from .stream import feed_match
+from .tft_api_class import MatchDto
+from . import current_tft_set
+
+
+class IncrementalAggregator:
+    """Aggregate Champion / Item stats across runs
+
+    Args:
+        path: Checkpoint file, loaded if it exists
+        champion_ids: championId to aggregate
+        item_ids: Item id to aggregate
+        tft_set_number: Set number for Champion / Item
+        retention: Only remember match_id of the last `retention` milliseconds (by game_datetime). Matches
+            older than that are considered consumed. None to remember every match_id.
+    """
+    version = 2
+
+    def __init__(self, path, champion_ids=(), item_ids=(), tft_set_number=current_tft_set, retention: int = None):
+        self.path = Path(path)
+        self.tft_set_number = tft_set_number
+        self.retention = retention
+        self.champions = {championId: Champion(championId, tft_set_number) for championId in champion_ids}
+        self.items = {id: Item(id, tft_set_number) for id in item_ids}
+        self.match_ids = {}  # match_id -> game_datetime
+        self.since = None  # Earliest game_datetime consumed
+        self.until = None  # Latest game_datetime consumed
+        self.rowid = 0  # Last MatchStore rowid read
+        if self.path.exists():
+            self.load()
+
+    def consume(self, match) -> bool:
+        """Parse a MatchDto if it has not been consumed
+
+        Return:
+            True if the match is new
+        """
+        match_id = match.metadata.match_id
+        game_datetime = match.info.game_datetime
+        if match_id in self.match_ids:
+            return False
+        if self.retention is not None and self.until is not None and game_datetime < self.until - self.retention:
+            return False
+        feed_match(match, self.champions, self.items)
+        # Record match
+        self.match_ids[match_id] = game_datetime
+        self.since = game_datetime if self.since is None else min(self.since, game_datetime)
+        self.until = game_datetime if self.until is None else max(self.until, game_datetime)
+        return True
+
+    def update(self, matches) -> int:
+        """Parse new MatchDto
+
+        Return:
+            Number of new matches
+        """
+        count = sum(self.consume(match) for match in matches)
+        self._prune()
+        return count
+
+    def update_from_store(self, store) -> int:
+        """Parse new matches from a MatchStore
+
+        Only rows inserted since the last call are read, and only those inside the retention window.
+
+        Return:
+            Number of new matches
+        """
+        since = None
+        if self.retention is not None and self.until is not None:
+            since = self.until - self.retention
+
+        def matches():
+            for rowid, data in store.iter_rows(after=self.rowid, since=since):
+                self.rowid = rowid
+                # Lazy, so participants of already consumed matches are never parsed
+                yield MatchDto(data, lazy=True)
+
+        return self.update(matches())
+
+    def _prune(self):
+        """Forget match_id outside of the retention window"""
+        if self.retention is None or self.until is None:
+            return
+        cutoff = self.until - self.retention
+        self.match_ids = {match_id: dt for match_id, dt in self.match_ids.items() if dt >= cutoff}
+
+    def to_dict(self) -> dict:
+        return {
+            'version': self.version,
+            'tft_set_number': self.tft_set_number,
+            'retention': self.retention,
+            'since': self.since,
+            'until': self.until,
+            'rowid': self.rowid,
+            'match_ids': self.match_ids,
+            'champions': {championId: champion.to_dict() for championId, champion in self.champions.items()},
+            'items': {str(id): item.to_dict() for id, item in self.items.items()},
+        }
+
+    def checkpoint(self) -> None:
+        """Write state to `path` atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.to_dict(), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self) -> None:
+        """Load state from `path`"""
+        with open(self.path) as f:
+            data = json.load(f)
+        # Version 1 has no rowid, the whole store is read once more
+        if data['version'] not in (1, self.version):
+            raise ValueError(f"Checkpoint version {data['version']} is not supported")
+        self.since = data['since']
+        self.until = data['until']
+        self.rowid = data.get('rowid', 0)
+        self.match_ids = data['match_ids']
+        for championId, champion in data['champions'].items():
+            if championId not in self.champions:
+                self.champions[championId] = Champion(championId, self.tft_set_number)
+            self.champions[championId].from_dict(champion)
+        for id, item in data['items'].items():
+            id = int(id)
+            if id not in self.items:
+                self.items[id] = Item(id, self.tft_set_number)
+            self.items[id].from_dict(item)
@@ -0,0 +1,120 @@
+"""Inverted indexes over the units of a MatchBatch
+
+Every value (patch, region, queue, champion, item, tier) has a posting list of sorted unit rows, match level
+values are listed for every unit of the match. A query intersects the posting lists starting from the
+shortest one with binary search, so its cost depends on the number of matching rows rather than the number
+of units.
+
+    index = MatchIndex.from_matches(matches)
+    rows = index.query(patch='11.3', region='KR', queue='Rank', champion='TFT4_Aatrox', item=16)
+    index.match_ids(rows)
+
+Requires numpy (`pip install tft_parse[numpy]`).
+"""
+import numpy as np
+from .batch import MatchBatch
+
+
+class PostingLists:
+    """Sorted row ids per integer code"""
+
+    def __init__(self, codes: np.ndarray, rows: np.ndarray, size: int):
+        order = np.argsort(codes, kind='stable')
+        self.rows = rows[order]
+        self.bounds = np.searchsorted(codes[order], np.arange(size + 1))
+
+    def get(self, code: int) -> np.ndarray:
+        if code is None or not 0 <= code < len(self.bounds) - 1:
+            return self.rows[:0]
+        return self.rows[self.bounds[code]:self.bounds[code + 1]]
+
+
+def intersect(rows: list) -> np.ndarray:
+    """Intersect sorted unique row arrays, from the shortest"""
+    rows = sorted(rows, key=len)
+    output = rows[0]
+    for other in rows[1:]:
+        if len(output) == 0 or len(other) == 0:
+            return output[:0]
+        position = np.searchsorted(other, output)
+        found = other[np.minimum(position, len(other) - 1)] == output
+        output = output[found]
+    return output
+
+
+class MatchIndex:
+    """Conjunctive queries over the units of a MatchBatch
+
+    Query results are unit rows of the batch, use `participants()` / `match_ids()` to map them back.
+    """
+
+    def __init__(self, batch: MatchBatch):
+        self.batch = batch
+        n_units = len(batch.unit_character_id)
+        unit_rows = np.arange(n_units, dtype=np.int64)
+        self._champion = PostingLists(batch.unit_character_id, unit_rows, len(batch.champions))
+        self._tier = PostingLists(batch.unit_tier, unit_rows, int(batch.unit_tier.max()) + 1 if n_units else 0)
+        # Match level values of each unit
+        self._patch = PostingLists(batch.unit_patch, unit_rows, len(batch.patches))
+        self._region = PostingLists(batch.match_region[batch.unit_match], unit_rows, len(batch.regions))
+        self._queue = PostingLists(batch.match_queue[batch.unit_match], unit_rows, len(batch.queues))
+        # Items, a unit holding the same item twice is listed once
+        held = batch.unit_items >= 0
+        item_rows = np.repeat(unit_rows, held.sum(axis=1))
+        items = batch.unit_items[held]
+        pairs = np.unique(items * max(n_units, 1) + item_rows)
+        self._item = PostingLists(
+            pairs // max(n_units, 1), pairs % max(n_units, 1), int(items.max()) + 1 if len(items) else 0)
+
+    @classmethod
+    def from_matches(cls, matches) -> 'MatchIndex':
+        """Build from an iterable of MatchDto"""
+        return cls(MatchBatch(matches))
+
+    def query(self, patch: str = None, region: str = None, queue: str = None, champion: str = None,
+              item=None, tier: int = None) -> np.ndarray:
+        """Unit rows matching every given filter
+
+        Args:
+            patch: e.g. '11.3'
+            region: e.g. 'KR'
+            queue: e.g. 'Rank'
+            champion: character_id
+            item: Item id or list of item ids, units must hold all of them
+            tier: Star level
+        """
+        batch = self.batch
+        postings = []
+        filters = [
+            (patch, 'patches', self._patch),
+            (region, 'regions', self._region),
+            (queue, 'queues', self._queue),
+            (champion, 'champions', self._champion),
+        ]
+        for value, vocab, posting_lists in filters:
+            if value is not None:
+                postings.append(posting_lists.get(batch.code(vocab, value)))
+        if tier is not None:
+            postings.append(self._tier.get(tier))
+        if item is not None:
+            # Single id, including numpy integers from MatchBatch.unit_items
+            items = [item] if np.ndim(item) == 0 else item
+            postings += [self._item.get(item) for item in items]
+        if postings:
+            rows = intersect(postings)
+        else:
+            rows = np.arange(len(batch.unit_character_id), dtype=np.int64)
+
+        return rows
+
+    def count(self, **filters) -> int:
+        """Number of units matching filters, see query()"""
+        return len(self.query(**filters))
+
+    def participants(self, rows: np.ndarray) -> np.ndarray:
+        """Unique participant rows of unit rows"""
+        return np.unique(self.batch.unit_participant[rows])
+
+    def match_ids(self, rows: np.ndarray) -> list:
+        """Unique match_id of unit rows"""
+        return [self.batch.match_ids[match] for match in np.unique(self.batch.unit_match[rows])]
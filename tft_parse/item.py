@@ -1,33 +1,50 @@
-import json
-import pkg_resources
-from pathlib import Path
+from copy import deepcopy
 from .tft_api_class import UnitDto
-from .misc import dict_add_count
+from .misc import dict_add_count, dict_merge_count, int_keys, item_comb_to_str, item_comb_from_str
+from .static_data import StaticData
 from . import current_tft_set
 
 
 class Item:
     def __init__(self, id: int, tft_set_number: int=current_tft_set):
         # Get item info
-        items_json = Path(pkg_resources.resource_filename('tft_parse', f'data/{tft_set_number}/items.json'))
-        with open(items_json, 'r') as f:
-            items = json.loads(f.read())
-        item = [item for item in items if item.get('id') == id]
-        if len(item) == 0:
-            raise ValueError(f"{id} does not exist")
-        else:
-            self.item = id
+        # Raise ValueError if item does not exist
+        item = StaticData.get(tft_set_number).item(id)
+        self.item = id
+        self.tft_set_number = tft_set_number
         # Setup values
-        self.name = item[0]['name']
-        self.description = item[0]['description']
+        self.name = item['name']
+        self.description = item['description']
         self.champion = {}
         self.item_other = {}
         self.item_combination = {}
 
     def from_dict(self, data: dict) -> None:
+        """Parse data from previous data
+
+        Item id keys turned into str by a json round trip are converted back to int.
+        """
         self.champion = data['champion']
-        self.item_combination = data['item_combination']
-        self.item_other = data['item_other']
+        # str keys from to_dict() are converted back to tuple
+        self.item_combination = {item_comb_from_str(key): value for key, value in data['item_combination'].items()}
+        self.item_other = int_keys(data['item_other'])
+
+    def merge(self, other: 'Item') -> 'Item':
+        """Add counts from another Item of the same id
+
+        Return:
+            self
+        """
+        if other.item != self.item:
+            raise ValueError(f"{other.item} is not the same as {self.item}")
+        self.champion = dict_merge_count(self.champion, other.champion)
+        self.item_combination = dict_merge_count(self.item_combination, other.item_combination)
+        self.item_other = dict_merge_count(self.item_other, other.item_other)
+
+        return self
+
+    def __add__(self, other: 'Item') -> 'Item':
+        return deepcopy(self).merge(other)
 
     def to_dict(self):
         output = {
@@ -35,7 +52,7 @@ class Item:
             'name': self.name,
             'description': self.description,
             'champion': self.champion,
-            'item_combination': self.item_combination,
+            'item_combination': {item_comb_to_str(key): value for key, value in self.item_combination.items()},
             'item_other': self.item_other,
         }
 
@@ -47,8 +64,8 @@ class Item:
         # to reduce duplication
         items = unit.items.copy()
         items.remove(self.item)
-        # Item combinations
-        self.item_combination = dict_add_count(self.item_combination, str(items))
+        # Item combinations, keyed by sorted tuple (unit.items is already sorted)
+        self.item_combination = dict_add_count(self.item_combination, tuple(items))
         # Item other
         for item in items:
             self.item_other = dict_add_count(self.item_other, item)
@@ -0,0 +1,209 @@
+"""Item co-occurrence and item x champion count matrices
+
+Items and champions of a set get small integer ids from StaticData. Each unit appends the flat matrix
+indexes it increments to a buffer in one pass, the buffer is added to the dense matrices with a single
+np.bincount when it is full or before reading. Memory depends on the number of items and champions, not on the
+number of matches. Champions and items not in the set data get a new column / row when first seen.
+
+    matrix = ItemMatrix('4.5')
+    matrix.update(stream.iter_matches('matches/'))
+    matrix.to_dict()[11]  # same as Item(11).to_dict()
+
+Requires numpy (`pip install tft_parse[numpy]`).
+"""
+from array import array
+import numpy as np
+from .item import Item
+from .static_data import StaticData
+from . import current_tft_set
+
+
+class ItemMatrix:
+    """Item stats of every item of a set
+
+    co_occurrence: (items, items), co_occurrence[i, j] is the number of other j held by units holding i
+    champion:      (items, champions), number of units of each champion holding i
+    combinations:  full item combination (sorted tuple of item ids) -> number of units
+
+    Items are counted once per unit, same as Item.parse_unit(). Matches of other sets are skipped. Champions
+    and items not in the set data are appended to `champion_ids` / `item_ids` when first seen, so they are
+    counted in `champion` and `item_other`, but only items of the set data are listed by to_items().
+    """
+
+    def __init__(self, tft_set_number=current_tft_set, buffer_size: int = 2 ** 20):
+        static_data = StaticData.get(tft_set_number)
+        self.tft_set_number = tft_set_number
+        self.buffer_size = buffer_size
+        self.item_ids = list(static_data.items)
+        self._n_set_items = len(self.item_ids)
+        self.champion_ids = list(static_data.champions)
+        self._item_index = {id: code for code, id in enumerate(self.item_ids)}
+        self._champion_index = {championId: code for code, championId in enumerate(self.champion_ids)}
+        self._co_occurrence = np.zeros((len(self.item_ids), len(self.item_ids)), dtype=np.int64)
+        self._champion = np.zeros((len(self.item_ids), len(self.champion_ids)), dtype=np.int64)
+        self.combinations = {}
+        self.matches = 0
+        # Flat indexes not yet added to the matrices
+        self._pairs = array('q')
+        self._holders = array('q')
+
+    def flush(self) -> None:
+        """Add buffered updates to the matrices"""
+        n_items, n_champions = self._champion.shape
+        if len(self._pairs):
+            pairs = np.frombuffer(self._pairs, dtype=np.int64)
+            self._co_occurrence += np.bincount(pairs, minlength=n_items * n_items).reshape(n_items, n_items)
+            self._pairs = array('q')
+        if len(self._holders):
+            holders = np.frombuffer(self._holders, dtype=np.int64)
+            self._champion += np.bincount(holders, minlength=n_items * n_champions).reshape(n_items, n_champions)
+            self._holders = array('q')
+
+    def _add_champion(self, championId: str) -> int:
+        """Append a champion column, return its code"""
+        # Buffered flat indexes depend on the matrix shape
+        self.flush()
+        self._champion = np.pad(self._champion, ((0, 0), (0, 1)))
+        self._champion_index[championId] = code = len(self.champion_ids)
+        self.champion_ids.append(championId)
+        return code
+
+    def _add_item(self, id: int) -> int:
+        """Append an item row / column, return its code"""
+        self.flush()
+        self._co_occurrence = np.pad(self._co_occurrence, ((0, 1), (0, 1)))
+        self._champion = np.pad(self._champion, ((0, 1), (0, 0)))
+        self._item_index[id] = code = len(self.item_ids)
+        self.item_ids.append(id)
+        return code
+
+    @property
+    def co_occurrence(self) -> np.ndarray:
+        self.flush()
+        return self._co_occurrence
+
+    @property
+    def champion(self) -> np.ndarray:
+        self.flush()
+        return self._champion
+
+    def parse_unit(self, unit) -> None:
+        """Parse UnitDto"""
+        if not unit.items:
+            return
+        champion = self._champion_index.get(unit.character_id)
+        if champion is None:
+            champion = self._add_champion(unit.character_id)
+        item_index = self._item_index
+        codes = [item_index[id] if id in item_index else self._add_item(id) for id in unit.items]
+        combination = tuple(unit.items)
+        self.combinations[combination] = self.combinations.get(combination, 0) + 1
+        n_items, n_champions = self._champion.shape
+        pairs = self._pairs
+        # unit.items is sorted so the same item is always next to each other
+        previous = None
+        for position, code in enumerate(codes):
+            if code == previous:
+                continue
+            previous = code
+            self._holders.append(code * n_champions + champion)
+            row = code * n_items
+            for other_position, other in enumerate(codes):
+                if other_position != position:
+                    pairs.append(row + other)
+        if len(pairs) >= self.buffer_size:
+            self.flush()
+
+    def parse_match(self, match) -> bool:
+        """Parse every unit of a MatchDto
+
+        Return:
+            False if the match is from another set
+        """
+        if str(match.info.tft_set_number) != str(self.tft_set_number):
+            return False
+        for participant in match.info.participants:
+            for unit in participant.units:
+                self.parse_unit(unit)
+        self.matches += 1
+        return True
+
+    def update(self, matches) -> int:
+        """Parse every MatchDto of an iterable
+
+        Return:
+            Number of matches parsed
+        """
+        return sum(self.parse_match(match) for match in matches)
+
+    def merge(self, other: 'ItemMatrix') -> 'ItemMatrix':
+        """Add counts from another ItemMatrix of the same set
+
+        Return:
+            self
+        """
+        if str(other.tft_set_number) != str(self.tft_set_number):
+            raise ValueError(f"Set {other.tft_set_number} is not the same as {self.tft_set_number}")
+        self.flush()
+        # Champions / items outside of the set data may be in a different order
+        for championId in other.champion_ids:
+            if championId not in self._champion_index:
+                self._add_champion(championId)
+        for id in other.item_ids:
+            if id not in self._item_index:
+                self._add_item(id)
+        items = np.array([self._item_index[id] for id in other.item_ids], dtype=np.int64)
+        champions = np.array([self._champion_index[championId] for championId in other.champion_ids], dtype=np.int64)
+        self._co_occurrence[np.ix_(items, items)] += other.co_occurrence
+        self._champion[np.ix_(items, champions)] += other.champion
+        for combination, count in other.combinations.items():
+            self.combinations[combination] = self.combinations.get(combination, 0) + count
+        self.matches += other.matches
+
+        return self
+
+    def item_combinations(self) -> dict:
+        """Item.item_combination of every item of the set data, derived from the full combinations
+
+        Return:
+            dict of item id -> dict of item combination without the item -> count
+        """
+        output = {id: {} for id in self.item_ids[:self._n_set_items]}
+        for combination, count in self.combinations.items():
+            previous = None
+            for position, id in enumerate(combination):
+                if id == previous or id not in output:
+                    continue
+                previous = id
+                others = combination[:position] + combination[position + 1:]
+                output[id][others] = output[id].get(others, 0) + count
+        return output
+
+    def to_items(self, min_occurrence: int = 0) -> dict:
+        """Item of every item of the set data held at least `min_occurrence` times
+
+        Return:
+            dict of item id -> Item
+        """
+        co_occurrence = self.co_occurrence
+        champion = self.champion
+        occurrence = champion.sum(axis=1)
+        item_combinations = self.item_combinations()
+        output = {}
+        for code, id in enumerate(self.item_ids[:self._n_set_items]):
+            if occurrence[code] < min_occurrence:
+                continue
+            item = Item(id, self.tft_set_number)
+            item.champion = {
+                self.champion_ids[other]: int(champion[code, other]) for other in np.flatnonzero(champion[code])
+            }
+            item.item_other = {
+                self.item_ids[other]: int(co_occurrence[code, other]) for other in np.flatnonzero(co_occurrence[code])
+            }
+            item.item_combination = item_combinations[id]
+            output[id] = item
+        return output
+
+    def to_dict(self, min_occurrence: int = 0) -> dict:
+        """Item.to_dict() of every item held at least `min_occurrence` times"""
+        return {id: item.to_dict() for id, item in self.to_items(min_occurrence).items()}
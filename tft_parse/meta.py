@@ -0,0 +1,112 @@
+"""Champion and Item stats of a whole set in one pass
+
+Every Champion and Item of the set is created up front from StaticData, then each unit of each match is
+routed to its champion and to every item it holds in a single traversal:
+
+    meta = MetaAggregator('4.5')
+    meta.update(stream.iter_matches('matches/'))
+    output = meta.to_dict()
+    output['champions']['TFT4_Aatrox'], output['items'][11]
+"""
+from copy import deepcopy
+from .champion import Champion
+from .item import Item
+from .static_data import StaticData
+from . import current_tft_set
+
+
+class MetaAggregator:
+    """Champion / Item stats for every champion and item of a set
+
+    Matches of other sets are skipped, as are units of champions / items not in the set data.
+    """
+
+    def __init__(self, tft_set_number=current_tft_set):
+        static_data = StaticData.get(tft_set_number)
+        self.tft_set_number = tft_set_number
+        self.champions = {championId: Champion(championId, tft_set_number) for championId in static_data.champions}
+        self.items = {id: Item(id, tft_set_number) for id in static_data.items}
+        self.matches = 0
+
+    def parse_match(self, match) -> bool:
+        """Parse every unit of a MatchDto
+
+        Return:
+            False if the match is from another set
+        """
+        if str(match.info.tft_set_number) != str(self.tft_set_number):
+            return False
+        champions = self.champions
+        items = self.items
+        for participant in match.info.participants:
+            for unit in participant.units:
+                character_id = unit.character_id
+                champion = champions.get(character_id)
+                if champion is not None:
+                    champion.parse_unit(unit)
+                # Same counters as Item.parse_unit(), each item is counted once per unit. unit.items is sorted
+                # so removing the first occurrence of an item is the same as list.remove()
+                unit_items = unit.items
+                previous = None
+                for position, id in enumerate(unit_items):
+                    if id == previous:
+                        continue
+                    previous = id
+                    item = items.get(id)
+                    if item is None:
+                        continue
+                    others = unit_items[:position] + unit_items[position + 1:]
+                    item_combination = tuple(others)
+                    item.item_combination[item_combination] = item.item_combination.get(item_combination, 0) + 1
+                    item_other = item.item_other
+                    for other in others:
+                        item_other[other] = item_other.get(other, 0) + 1
+                    item.champion[character_id] = item.champion.get(character_id, 0) + 1
+        self.matches += 1
+        return True
+
+    def update(self, matches) -> int:
+        """Parse every MatchDto of an iterable
+
+        Return:
+            Number of matches parsed
+        """
+        return sum(self.parse_match(match) for match in matches)
+
+    def merge(self, other: 'MetaAggregator') -> 'MetaAggregator':
+        """Add counts from another MetaAggregator of the same set
+
+        Return:
+            self
+        """
+        if str(other.tft_set_number) != str(self.tft_set_number):
+            raise ValueError(f"Set {other.tft_set_number} is not the same as {self.tft_set_number}")
+        for championId, champion in other.champions.items():
+            self.champions[championId].merge(champion)
+        for id, item in other.items.items():
+            self.items[id].merge(item)
+        self.matches += other.matches
+
+        return self
+
+    def __add__(self, other: 'MetaAggregator') -> 'MetaAggregator':
+        return deepcopy(self).merge(other)
+
+    def to_dict(self, min_occurrence: int = 0) -> dict:
+        """to_dict() of every Champion and Item
+
+        Args:
+            min_occurrence: Only champions seen at least this many times and items held at least this many times
+        """
+        return {
+            'tft_set_number': self.tft_set_number,
+            'matches': self.matches,
+            'champions': {
+                championId: champion.to_dict() for championId, champion in self.champions.items()
+                if champion.champion_occurrence >= min_occurrence
+            },
+            'items': {
+                id: item.to_dict() for id, item in self.items.items()
+                if sum(item.champion.values()) >= min_occurrence
+            },
+        }
@@ -9,15 +9,74 @@ def dict_add_count(dt: dict, key):
     return dt
 
 
+def dict_merge_count(dt: dict, other: dict):
+    """Static method to add counts of another dict to a dict"""
+    for key, value in other.items():
+        if dt.get(key) is None:
+            dt[key] = value
+        else:
+            dt[key] += value
+
+    return dt
+
+
+def int_keys(dt: dict) -> dict:
+    """Convert int-like str keys back to int, e.g. after a json round trip"""
+    return {int(key) if isinstance(key, str) and key.lstrip('-').isdigit() else key: value for key, value in dt.items()}
+
+
+def item_comb_key(items) -> tuple:
+    """Canonical key of an item combination: sorted tuple of item ids"""
+    return tuple(sorted(items))
+
+
+def item_comb_to_str(key: tuple) -> str:
+    """Convert item combination key to str (e.g. (11, 23) -> '[11, 23]')"""
+    return str(list(key))
+
+
+def item_comb_from_str(key) -> tuple:
+    """Convert str from item_comb_to_str() back to item combination key"""
+    if isinstance(key, tuple):
+        return key
+    key = key.strip('[]')
+    if key == '':
+        return ()
+    return item_comb_key(int(item) for item in key.split(','))
+
+
+def item_comb_pack(key: tuple) -> int:
+    """Pack item combination key of up to 3 items into one int, each item id + 1 uses 21 bits"""
+    if len(key) > 3:
+        raise ValueError(f"{key} has more than 3 items")
+    output = 0
+    for item in key:
+        if not 0 <= item < 2 ** 21 - 1:
+            raise ValueError(f"{item} can not be packed")
+        output = (output << 21) | (item + 1)
+    return output
+
+
+def item_comb_unpack(key: int) -> tuple:
+    """Convert int from item_comb_pack() back to item combination key"""
+    output = []
+    while key:
+        output.append((key & (2 ** 21 - 1)) - 1)
+        key >>= 21
+    return tuple(reversed(output))
+
+
+route_regions = {
+    'NA1': 'AMERICAS', 'BR1': 'AMERICAS', 'LA1': 'AMERICAS', 'LA2': 'AMERICAS', 'OC1': 'AMERICAS',
+    'KR': 'ASIA', 'JP1': 'ASIA',
+    'EUN1': 'EUROPE', 'EUW1': 'EUROPE', 'TR1': 'EUROPE', 'RU': 'EUROPE',
+}
+
+
 def route_region(region: str):
-    region = region.upper()
-    if region in ['NA1', 'BR1', 'LA1', 'LA2', 'OC1']:
-        return 'AMERICAS'
-    elif region in ['KR', 'JP1']:
-        return 'ASIA'
-    elif region in ['EUN1', 'EUW1', 'TR1', 'RU']:
-        return 'EUROPE'
-    else:
+    try:
+        return route_regions[region.upper()]
+    except KeyError:
         raise ValueError(f"{region} is not defined")
 
 
@@ -0,0 +1,249 @@
+"""Parse many matches with a thread or process pool
+
+Records (raw match dicts, or json str / bytes decoded with tft_parse.decoder) are sent to workers in chunks.
+At most `2 * workers` chunks are in flight, so results are streamed and memory does not depend on the input
+size.
+
+parse_many() yields MatchDto. Process workers send each chunk back as flat lists of slot values (pack()), the
+raw dicts are dropped. The parent still builds every DTO, which costs about as much as parsing, so it stops
+scaling after a few workers:
+
+    for match in MatchDto.parse_many(stream.iter_records('matches/'), workers=4):
+        ...
+
+reduce_many() keeps the reduction in the workers and only sends accumulators back, use it to aggregate:
+
+    meta = reduce_many(stream.iter_records('matches/'), partial(MetaAggregator, '4.5'), workers=32)
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .tft_api_class import MatchDto, MetadataDto, InfoDto, ParticipantDto, TraitDto, UnitDto
+from .static_data import StaticData
+from .stream import batched
+from . import decoder
+
+backends = ('process', 'thread', 'serial')
+
+
+# Number of values of each row of pack()
+MATCH_SIZE = 12
+PARTICIPANT_SIZE = 10
+TRAIT_SIZE = 7
+UNIT_SIZE = 5
+
+
+def pack(matches: list) -> tuple:
+    """Columnar form of parsed MatchDto, flat lists of slot values without the raw dicts
+
+    Return:
+        Tuple of (match values, participants per match, participant values, traits per participant, trait
+        values, units per participant, unit values), `*_SIZE` values per row
+    """
+    match_values, n_participants, participant_values = [], [], []
+    n_traits, trait_values, n_units, unit_values = [], [], [], []
+    for match in matches:
+        metadata, info = match.metadata, match.info
+        match_values += (
+            metadata.data_version, metadata.match_id, metadata.participants, metadata.region, metadata.route_region,
+            info.game_datetime, info.game_length, info.game_version, info.queue_id, info.patch, info.queue,
+            info.tft_set_number,
+        )
+        n_participants.append(len(info.participants))
+        for participant in info.participants:
+            participant_values += (
+                participant.companion, participant.gold_left, participant.last_round, participant.level,
+                participant.placement, participant.players_eliminated, participant.puuid,
+                participant.time_eliminated, participant.total_damage_to_players, participant.tft_set_number,
+            )
+            n_traits.append(len(participant.traits))
+            for trait in participant.traits:
+                trait_values += (trait.name, trait.num_units, trait.style, trait.tier_current, trait.tier_total,
+                                 trait.set_number, trait.tier_name)
+            n_units.append(len(participant.units))
+            for unit in participant.units:
+                unit_values += (unit.items, unit.character_id, unit.chosen, unit.rarity, unit.tier)
+    return match_values, n_participants, participant_values, n_traits, trait_values, n_units, unit_values
+
+
+def _rows(values: list, size: int):
+    """Rows of `size` values of a flat list"""
+    return (values[position:position + size] for position in range(0, len(values), size))
+
+
+def _split(objects: list, counts: list) -> list:
+    """Split objects into consecutive lists of counts[i] objects"""
+    output = []
+    start = 0
+    for count in counts:
+        output.append(objects[start:start + count])
+        start += count
+    return output
+
+
+def unpack(packed: tuple) -> list:
+    """Rebuild the list of MatchDto from pack() without parsing them again, raw data is not kept"""
+    match_values, n_participants, participant_values, n_traits, trait_values, n_units, unit_values = packed
+    new = object.__new__
+    traits = []
+    for values in _rows(trait_values, TRAIT_SIZE):
+        trait = new(TraitDto)
+        trait.name, trait.num_units, trait.style, trait.tier_current, trait.tier_total, trait.set_number, \
+            trait.tier_name = values
+        traits.append(trait)
+    units = []
+    for values in _rows(unit_values, UNIT_SIZE):
+        unit = new(UnitDto)
+        unit.items, unit.character_id, unit.chosen, unit.rarity, unit.tier = values
+        units.append(unit)
+    participants = []
+    for values, participant_traits, participant_units in zip(
+            _rows(participant_values, PARTICIPANT_SIZE), _split(traits, n_traits), _split(units, n_units)):
+        participant = new(ParticipantDto)
+        participant.companion, participant.gold_left, participant.last_round, participant.level, \
+            participant.placement, participant.players_eliminated, participant.puuid, participant.time_eliminated, \
+            participant.total_damage_to_players, participant.tft_set_number = values
+        participant.data = participant._raw_traits = participant._raw_units = None
+        participant._traits = participant_traits
+        participant._units = participant_units
+        participants.append(participant)
+    matches = []
+    for values, match_participants in zip(_rows(match_values, MATCH_SIZE), _split(participants, n_participants)):
+        match = new(MatchDto)
+        match.data = None
+        match.metadata = metadata = new(MetadataDto)
+        match.info = info = new(InfoDto)
+        metadata.data_version, metadata.match_id, metadata.participants, metadata.region, metadata.route_region, \
+            info.game_datetime, info.game_length, info.game_version, info.queue_id, info.patch, info.queue, \
+            info.tft_set_number = values
+        info._participants = match_participants
+        info._raw_participants = None
+        info._keep_data = info._lazy = False
+        matches.append(match)
+    return matches
+
+
+def _parse(record, kwargs: dict) -> MatchDto:
+    if isinstance(record, memoryview):
+        # Not accepted by every json backend
+        record = bytes(record)
+    if isinstance(record, (str, bytes, bytearray)):
+        record = decoder.loads(record)
+    return MatchDto(record, **kwargs)
+
+
+def _parse_chunk(records: list, kwargs: dict) -> list:
+    return [_parse(record, kwargs) for record in records]
+
+
+def _pack_chunk(records: list, kwargs: dict) -> tuple:
+    return pack(_parse_chunk(records, kwargs))
+
+
+def _reduce_chunk(records: list, factory, kwargs: dict):
+    accumulator = factory()
+    accumulator.update(_parse(record, kwargs) for record in records)
+    return accumulator
+
+
+def _init_worker(backend: str):
+    # Workers must decode with the same backend as the parent
+    decoder.set_backend(backend)
+    StaticData.preload()
+
+
+def _executor(backend: str, workers: int):
+    if backend not in backends:
+        raise ValueError(f"{backend} is not one of {backends}")
+    if backend == 'process':
+        return ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(decoder.backend,))
+    StaticData.preload()
+    return ThreadPoolExecutor(workers)
+
+
+def _map_chunks(executor, function, records, workers: int, chunksize: int, ordered: bool, *args):
+    """Yield function(chunk, *args) of every chunk of records"""
+    chunks = batched(records, chunksize)
+    pending = deque()
+    while True:
+        # Keep workers busy with a bounded number of chunks in flight
+        for chunk in chunks:
+            pending.append(executor.submit(function, chunk, *args))
+            if len(pending) >= 2 * workers:
+                break
+        if not pending:
+            return
+        if ordered:
+            futures = [pending.popleft()]
+        else:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            futures = [future for future in pending if future in done]
+            for future in futures:
+                pending.remove(future)
+        for future in futures:
+            yield future.result()
+
+
+def parse_many(records, workers: int = None, backend: str = 'process', chunksize: int = 256,
+               ordered: bool = True, **kwargs):
+    """Yield MatchDto parsed from records
+
+    Args:
+        records: Iterable of raw match dicts or json str / bytes / bytearray / memoryview
+        workers: Number of workers, default to number of CPUs
+        backend: 'process', 'thread' or 'serial'
+        chunksize: Number of records sent to a worker at once
+        ordered: Yield in the order of records, otherwise as soon as chunks are parsed
+        kwargs: Passed to MatchDto, e.g. keep_data=False. `lazy` only applies to the serial backend, raw data
+            is never kept by the process backend.
+    """
+    if backend == 'serial':
+        StaticData.preload()
+        for record in records:
+            yield _parse(record, kwargs)
+        return
+
+    workers = workers or os.cpu_count()
+    executor = _executor(backend, workers)
+    if backend == 'process':
+        function = _pack_chunk
+        kwargs = dict(kwargs, keep_data=False, lazy=False)
+    else:
+        function = _parse_chunk
+        kwargs = dict(kwargs, lazy=False)
+    with executor:
+        for result in _map_chunks(executor, function, records, workers, chunksize, ordered, kwargs):
+            yield from unpack(result) if backend == 'process' else result
+
+
+def reduce_many(records, factory, workers: int = None, backend: str = 'process', chunksize: int = 1024, **kwargs):
+    """Parse records and add them to accumulators in the workers
+
+    Each chunk is added with `update(matches)` to a new `factory()` accumulator (e.g. MetaAggregator,
+    ItemMatrix, TraitStats), only accumulators are sent back and merged with `merge()`:
+
+        meta = reduce_many(stream.iter_records('matches/'), partial(MetaAggregator, '4.5'), workers=32)
+
+    Args:
+        records: Iterable of raw match dicts or json str / bytes / bytearray / memoryview
+        factory: Picklable callable returning an empty accumulator
+        workers: Number of workers, default to number of CPUs
+        backend: 'process', 'thread' or 'serial'
+        chunksize: Number of records sent to a worker at once
+        kwargs: Passed to MatchDto, default to keep_data=False
+
+    Return:
+        Accumulator of every record
+    """
+    kwargs = dict({'keep_data': False}, **kwargs)
+    output = factory()
+    if backend == 'serial':
+        StaticData.preload()
+        output.update(_parse(record, kwargs) for record in records)
+        return output
+
+    workers = workers or os.cpu_count()
+    with _executor(backend, workers) as executor:
+        for accumulator in _map_chunks(executor, _reduce_chunk, records, workers, chunksize, False, factory, kwargs):
+            output.merge(accumulator)
+    return output
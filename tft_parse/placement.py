@@ -0,0 +1,181 @@
+"""Placement weighted statistics for champions and items
+
+Every unit updates count, placement sum, placement sum of squares, top 4 and win counts of its champion,
+items, items on champion and champion star level in one pass. Average placement, rates and confidence
+intervals are computed with numpy when finalized.
+
+Requires numpy (`pip install tft_parse[numpy]`).
+"""
+from array import array
+import math
+import numpy as np
+
+
+def z_score(confidence: float) -> float:
+    """Two sided standard normal quantile of a confidence level, e.g. 1.96 for 0.95
+
+    Solve erf(z / sqrt(2)) = confidence by bisection, statistics.NormalDist needs Python 3.8.
+    """
+    if not 0 <= confidence < 1:
+        raise ValueError(f"{confidence} is not a valid confidence")
+    low, high = 0.0, 10.0
+    for _ in range(64):
+        middle = (low + high) / 2
+        if math.erf(middle / math.sqrt(2)) < confidence:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+class PlacementAccumulator:
+    """Placement counters for any hashable key"""
+
+    def __init__(self):
+        self.keys = []
+        self.index = {}
+        self.count = array('q')
+        self.placement_sum = array('q')
+        self.placement_sumsq = array('q')
+        self.top4 = array('q')
+        self.win = array('q')
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _row(self, key) -> int:
+        row = self.index.get(key)
+        if row is None:
+            row = len(self.keys)
+            self.index[key] = row
+            self.keys.append(key)
+            for column in [self.count, self.placement_sum, self.placement_sumsq, self.top4, self.win]:
+                column.append(0)
+        return row
+
+    def add(self, key, placement: int, n: int = 1) -> None:
+        """Add `n` observations with the same placement"""
+        row = self._row(key)
+        self.count[row] += n
+        self.placement_sum[row] += placement * n
+        self.placement_sumsq[row] += placement * placement * n
+        if placement <= 4:
+            self.top4[row] += n
+            if placement == 1:
+                self.win[row] += n
+
+    def merge(self, other: 'PlacementAccumulator') -> 'PlacementAccumulator':
+        """Add counters from another accumulator
+
+        Return:
+            self
+        """
+        for key, other_row in other.index.items():
+            row = self._row(key)
+            self.count[row] += other.count[other_row]
+            self.placement_sum[row] += other.placement_sum[other_row]
+            self.placement_sumsq[row] += other.placement_sumsq[other_row]
+            self.top4[row] += other.top4[other_row]
+            self.win[row] += other.win[other_row]
+        return self
+
+    def finalize(self, confidence: float = 0.95) -> dict:
+        """Compute stats of every key
+
+        Return:
+            dict of keys (list) and numpy arrays: count, avg_placement, std, ci_low, ci_high, top4_rate, win_rate
+        """
+        count = np.frombuffer(self.count, dtype=np.int64).astype(np.float64)
+        total = np.frombuffer(self.placement_sum, dtype=np.int64)
+        total_sq = np.frombuffer(self.placement_sumsq, dtype=np.int64)
+        safe_count = np.maximum(count, 1)
+        avg = total / safe_count
+        # Sample standard deviation
+        variance = (total_sq - count * avg ** 2) / np.maximum(count - 1, 1)
+        std = np.sqrt(np.maximum(variance, 0))
+        z = z_score(confidence)
+        margin = z * std / np.sqrt(safe_count)
+        return {
+            'keys': list(self.keys),
+            'count': count.astype(np.int64),
+            'avg_placement': avg,
+            'std': std,
+            'ci_low': avg - margin,
+            'ci_high': avg + margin,
+            'top4_rate': np.frombuffer(self.top4, dtype=np.int64) / safe_count,
+            'win_rate': np.frombuffer(self.win, dtype=np.int64) / safe_count,
+        }
+
+    def to_dict(self, confidence: float = 0.95) -> dict:
+        """Finalized stats per key"""
+        stats = self.finalize(confidence)
+        keys = stats.pop('keys')
+        return {
+            key: {name: values[row].item() for name, values in stats.items()}
+            for row, key in enumerate(keys)
+        }
+
+
+class PlacementStats:
+    """Placement stats per champion, item, item on champion and champion star level
+
+    Keys:
+        champion:      character_id
+        item:          item id, counted once per unit holding it
+        champion_item: (character_id, item id)
+        champion_tier: (character_id, tier)
+    """
+    categories = ('champion', 'item', 'champion_item', 'champion_tier')
+
+    def __init__(self):
+        self.champion = PlacementAccumulator()
+        self.item = PlacementAccumulator()
+        self.champion_item = PlacementAccumulator()
+        self.champion_tier = PlacementAccumulator()
+        self.matches = 0
+
+    def parse_participant(self, participant) -> None:
+        """Parse every unit of a ParticipantDto"""
+        placement = participant.placement
+        for unit in participant.units:
+            character_id = unit.character_id
+            self.champion.add(character_id, placement)
+            self.champion_tier.add((character_id, unit.tier), placement)
+            for item in set(unit.items):
+                self.item.add(item, placement)
+                self.champion_item.add((character_id, item), placement)
+
+    def update(self, matches) -> int:
+        """Parse every participant of every MatchDto
+
+        Return:
+            Number of matches parsed
+        """
+        count = 0
+        for match in matches:
+            for participant in match.info.participants:
+                self.parse_participant(participant)
+            count += 1
+        self.matches += count
+        return count
+
+    def merge(self, other: 'PlacementStats') -> 'PlacementStats':
+        """Add counters from another PlacementStats
+
+        Return:
+            self
+        """
+        for category in self.categories:
+            getattr(self, category).merge(getattr(other, category))
+        self.matches += other.matches
+        return self
+
+    def finalize(self, category: str, confidence: float = 0.95) -> dict:
+        """Stats arrays of one category, see PlacementAccumulator.finalize()"""
+        if category not in self.categories:
+            raise ValueError(f"{category} is not one of {self.categories}")
+        return getattr(self, category).finalize(confidence)
+
+    def to_dict(self, confidence: float = 0.95) -> dict:
+        """Finalized stats of every category"""
+        return {category: getattr(self, category).to_dict(confidence) for category in self.categories}
@@ -0,0 +1,134 @@
+"""Rolling champion / item / trait counters over game_datetime windows
+
+Matches are counted into fixed size time buckets (hourly by default) kept in a ring buffer. When a newer
+bucket starts, buckets older than the buffer are evicted, so memory depends on the number of buckets and not
+on the number of matches. Windowed queries sum the buckets covering the window:
+
+    rolling = RollingStats(bucket_size=HOUR, n_buckets=7 * 24)
+    rolling.update(matches)
+    rolling.window(DAY)['champions']     # last 24 hours
+    rolling.window(7 * DAY)['champions']  # last 7 days
+"""
+from .misc import dict_merge_count
+
+HOUR = 3600 * 1000  # game_datetime is in milliseconds
+DAY = 24 * HOUR
+
+
+class Bucket:
+    """Counters of matches with game_datetime in [start, start + bucket_size)"""
+    __slots__ = ('index', 'matches', 'champions', 'items', 'traits')
+
+    def __init__(self, index: int):
+        self.index = index
+        self.matches = 0
+        self.champions = {}  # character_id -> number of units
+        self.items = {}  # item id -> number of units holding it
+        self.traits = {}  # tier name (e.g. Cultist_3) -> number of participants
+
+    def parse_match(self, match) -> None:
+        champions = self.champions
+        items = self.items
+        traits = self.traits
+        for participant in match.info.participants:
+            for trait in participant.traits:
+                tier_name = trait.tier_name
+                if tier_name is not None:
+                    traits[tier_name] = traits.get(tier_name, 0) + 1
+            for unit in participant.units:
+                champions[unit.character_id] = champions.get(unit.character_id, 0) + 1
+                # Each item is only counted once per unit
+                for item in set(unit.items):
+                    items[item] = items.get(item, 0) + 1
+        self.matches += 1
+
+
+class RollingStats:
+    """Time bucketed counters of the last `n_buckets * bucket_size` milliseconds
+
+    Args:
+        bucket_size: Bucket length in milliseconds
+        n_buckets: Number of buckets kept
+    """
+
+    def __init__(self, bucket_size: int = HOUR, n_buckets: int = 7 * 24):
+        if bucket_size <= 0 or n_buckets <= 0:
+            raise ValueError("bucket_size and n_buckets must be positive")
+        self.bucket_size = bucket_size
+        self.n_buckets = n_buckets
+        self.buckets = [None] * n_buckets
+        self.latest = None  # Index of the latest bucket
+        self.dropped = 0  # Matches older than the ring buffer
+
+    def _index(self, game_datetime: int) -> int:
+        return game_datetime // self.bucket_size
+
+    def _advance(self, index: int) -> None:
+        """Make `index` the latest bucket, evicting buckets that fall out of the ring buffer"""
+        if self.latest is not None and index - self.latest < self.n_buckets:
+            for evicted in range(self.latest + 1, index + 1):
+                self.buckets[evicted % self.n_buckets] = None
+        else:
+            self.buckets = [None] * self.n_buckets
+        self.latest = index
+
+    def add(self, match) -> bool:
+        """Count a MatchDto into the bucket of its game_datetime
+
+        Return:
+            False if the match is older than the ring buffer
+        """
+        index = self._index(match.info.game_datetime)
+        if self.latest is None or index > self.latest:
+            self._advance(index)
+        elif index <= self.latest - self.n_buckets:
+            self.dropped += 1
+            return False
+        slot = index % self.n_buckets
+        bucket = self.buckets[slot]
+        if bucket is None:
+            bucket = self.buckets[slot] = Bucket(index)
+        bucket.parse_match(match)
+        return True
+
+    def update(self, matches) -> int:
+        """Count every MatchDto of an iterable
+
+        Return:
+            Number of matches counted
+        """
+        return sum(self.add(match) for match in matches)
+
+    def window(self, duration: int, until: int = None) -> dict:
+        """Sum of the buckets covering the last `duration` milliseconds
+
+        Args:
+            duration: Window length in milliseconds, rounded up to whole buckets
+            until: game_datetime the window ends at (inclusive), default to the latest bucket
+
+        Return:
+            dict of since, until (milliseconds, until exclusive), matches, champions, items and traits counters.
+            until is clamped to the end of the latest bucket, no match has been counted after it.
+        """
+        n = -(-duration // self.bucket_size)
+        if not 0 < n <= self.n_buckets:
+            raise ValueError(f"{duration} is not within the {self.n_buckets * self.bucket_size} ms kept")
+        last = self._index(until) if until is not None else self.latest
+        output = {'since': None, 'until': None, 'matches': 0, 'champions': {}, 'items': {}, 'traits': {}}
+        if self.latest is None:
+            return output
+        first = last - n + 1
+        if first <= self.latest - self.n_buckets:
+            raise ValueError(f"Window starting at {first * self.bucket_size} has been evicted")
+        last = min(last, self.latest)
+        first = min(first, last + 1)
+        output['since'] = first * self.bucket_size
+        output['until'] = (last + 1) * self.bucket_size
+        for bucket in self.buckets:
+            if bucket is None or not first <= bucket.index <= last:
+                continue
+            output['matches'] += bucket.matches
+            dict_merge_count(output['champions'], bucket.champions)
+            dict_merge_count(output['items'], bucket.items)
+            dict_merge_count(output['traits'], bucket.traits)
+        return output
@@ -0,0 +1,136 @@
+import json
+import re
+import pkg_resources
+from functools import lru_cache
+from pathlib import Path
+from . import current_tft_set
+
+style_map = {0: 'none', 1: 'bronze', 2: 'silver', 3: 'gold', 4: 'chromatic'}
+# Mid-set updates the API still reports with the set number of the base set:
+# reported set number -> list of (first patch, set), latest first
+set_patches = {
+    '4': [((11, 2), '4.5')],
+}
+_patch_regex = re.compile(r'\d+')
+
+
+@lru_cache(maxsize=1024)
+def patch_version(patch: str) -> tuple:
+    """Parse patch to a comparable tuple (e.g. '11.10' -> (11, 10))"""
+    version = tuple(int(number) for number in _patch_regex.findall(patch))
+    if not version:
+        raise ValueError(f"Unable to parse patch {patch}")
+    return version
+
+
+@lru_cache(maxsize=1024)
+def resolve_set(tft_set_number, patch: str):
+    """Set of a match given the set number reported by the API and its patch (e.g. 4 on '11.2' -> '4.5')"""
+    version = patch_version(patch)
+    for first_patch, set_name in set_patches.get(str(tft_set_number), []):
+        if version >= first_patch:
+            return set_name
+    return tft_set_number
+
+
+class StaticData:
+    """Static data (champions, items and traits) for one TFT set
+
+    Files under `data/{set}` are read once per set and kept in a process-wide registry, use
+    `StaticData.get()` rather than creating the class directly.
+
+    champions: championId -> champion info
+    items:     item id -> item info
+    traits:    trait key -> trait info
+    trait_tiers: (trait key, style) -> tier name (e.g. Cultist_3)
+    """
+    _registry = {}
+
+    def __init__(self, tft_set_number=current_tft_set):
+        self.tft_set_number = str(tft_set_number)
+        # Get data path
+        data_path = Path(pkg_resources.resource_filename('tft_parse', f'data/{self.tft_set_number}'))
+        if not data_path.is_dir():
+            raise ValueError(f"Set {tft_set_number} does not exist")
+        # Load files
+        self.champion_list = self._load(data_path.joinpath('champions.json'))
+        self.item_list = self._load(data_path.joinpath('items.json'))
+        self.trait_list = self._load(data_path.joinpath('traits.json'))
+        # Build indexes
+        self.champions = {champion['championId']: champion for champion in self.champion_list}
+        self.items = {item['id']: item for item in self.item_list}
+        self.traits = {trait['key']: trait for trait in self.trait_list}
+        self.trait_tiers = self._build_trait_tiers(self.trait_list)
+
+    @staticmethod
+    def _load(path: Path):
+        with open(path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def _build_trait_tiers(trait_list: list) -> dict:
+        """Map every (trait key, style) to its tier name, same naming as Trait.get_trait_style()"""
+        output = {}
+        for trait in trait_list:
+            trait_sets = {trait_set['style']: trait_set for trait_set in trait['sets']}
+            for style, style_name in style_map.items():
+                if style == 0:
+                    output[(trait['key'], style)] = None
+                elif style_name in trait_sets:
+                    output[(trait['key'], style)] = f"{trait['key']}_{trait_sets[style_name]['min']}"
+                else:
+                    output[(trait['key'], style)] = f"{trait['key']}_{style_name}"
+        return output
+
+    @staticmethod
+    def available_sets() -> list:
+        """Sets with static data under `data/`"""
+        data_path = Path(pkg_resources.resource_filename('tft_parse', 'data'))
+        return sorted(path.name for path in data_path.iterdir() if path.joinpath('champions.json').is_file())
+
+    @classmethod
+    def preload(cls) -> dict:
+        """Load every available set into the registry, e.g. before parsing matches from several sets
+
+        Return:
+            dict of set -> StaticData
+        """
+        return {tft_set_number: cls.get(tft_set_number) for tft_set_number in cls.available_sets()}
+
+    @classmethod
+    def get(cls, tft_set_number=current_tft_set):
+        """Return the registered StaticData for a set, loading it on first use"""
+        key = str(tft_set_number)
+        static_data = cls._registry.get(key)
+        if static_data is None:
+            static_data = cls(key)
+            cls._registry[key] = static_data
+        return static_data
+
+    def champion(self, championId: str) -> dict:
+        """Get champion info"""
+        try:
+            return self.champions[championId]
+        except KeyError:
+            raise ValueError(f"{championId} does not exist")
+
+    def item(self, id: int) -> dict:
+        """Get item info"""
+        try:
+            return self.items[id]
+        except KeyError:
+            raise ValueError(f"{id} does not exist")
+
+    def trait(self, key: str) -> dict:
+        """Get trait info"""
+        try:
+            return self.traits[key]
+        except KeyError:
+            raise ValueError(f"{key} does not exist")
+
+    def trait_tier(self, key: str, style: int):
+        """Get trait tier name (e.g. Cultist_3), None if trait is not active"""
+        try:
+            return self.trait_tiers[(key, style)]
+        except KeyError:
+            raise ValueError(f"{key} with style {style} does not exist")
@@ -0,0 +1,132 @@
+"""On-disk match store keyed by match_id
+
+Raw match json is stored zlib compressed in SQLite. Known match_id are also kept in memory so checking if a
+match has been seen before does not hit the database, e.g. to skip matches already crawled from another
+participant's history:
+
+    with MatchStore('matches.db') as store:
+        new_ids = [match_id for match_id in match_ids if match_id not in store]
+        ...
+        store.add_many(matches)
+        for match in store.iter_matches():
+            ...
+"""
+import json
+import sqlite3
+import zlib
+from .tft_api_class import MatchDto
+from . import decoder
+
+
+class MatchStore:
+    """SQLite store of raw matches, one row per match_id"""
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS matches ("
+            "match_id TEXT PRIMARY KEY, game_datetime INTEGER NOT NULL, data BLOB NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS matches_game_datetime ON matches (game_datetime)")
+        self.connection.commit()
+        self._ids = {row[0] for row in self.connection.execute("SELECT match_id FROM matches")}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def __contains__(self, match_id: str) -> bool:
+        return match_id in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    @staticmethod
+    def _raw(match) -> dict:
+        if isinstance(match, MatchDto):
+            if match.data is None:
+                raise ValueError("Raw data is not kept, parse with keep_data=True")
+            return match.data
+        return match
+
+    def _insert(self, match, pending: set) -> bool:
+        """Insert a match in the current transaction, new match_id are added to `pending`"""
+        match = self._raw(match)
+        match_id = match['metadata']['match_id']
+        if match_id in self._ids or match_id in pending:
+            return False
+        data = zlib.compress(json.dumps(match, separators=(',', ':')).encode())
+        self.connection.execute(
+            "INSERT INTO matches (match_id, game_datetime, data) VALUES (?, ?, ?)",
+            (match_id, match['info']['game_datetime'], data)
+        )
+        pending.add(match_id)
+        return True
+
+    def add(self, match) -> bool:
+        """Add a raw match dict or MatchDto
+
+        Return:
+            False if the match_id is already stored
+        """
+        pending = set()
+        with self.connection:
+            output = self._insert(match, pending)
+        # Only known once committed, a failed transaction is rolled back
+        self._ids.update(pending)
+        return output
+
+    def add_many(self, matches) -> int:
+        """Add raw match dicts or MatchDto in one transaction
+
+        Return:
+            Number of new matches
+        """
+        pending = set()
+        with self.connection:
+            output = sum(self._insert(match, pending) for match in matches)
+        self._ids.update(pending)
+        return output
+
+    def get(self, match_id: str) -> dict:
+        """Get raw match dict"""
+        row = self.connection.execute("SELECT data FROM matches WHERE match_id = ?", (match_id,)).fetchone()
+        if row is None:
+            raise ValueError(f"{match_id} does not exist")
+        return decoder.loads(zlib.decompress(row[0]))
+
+    def iter_raw(self, since: int = None, until: int = None):
+        """Yield raw match dicts ordered by game_datetime
+
+        Args:
+            since: Only matches with game_datetime >= since (milliseconds)
+            until: Only matches with game_datetime < until (milliseconds)
+        """
+        query = "SELECT data FROM matches WHERE game_datetime >= ? AND game_datetime < ? ORDER BY game_datetime"
+        since = -2 ** 63 if since is None else since
+        until = 2 ** 63 - 1 if until is None else until
+        for row in self.connection.execute(query, (since, until)):
+            yield decoder.loads(zlib.decompress(row[0]))
+
+    def iter_rows(self, after: int = 0, since: int = None):
+        """Yield (rowid, raw match dict) in insertion order
+
+        Args:
+            after: Only matches inserted after this rowid, e.g. the last rowid seen by a previous run
+            since: Only matches with game_datetime >= since (milliseconds)
+        """
+        query = "SELECT rowid, data FROM matches WHERE rowid > ? AND game_datetime >= ? ORDER BY rowid"
+        since = -2 ** 63 if since is None else since
+        for rowid, data in self.connection.execute(query, (after, since)):
+            yield rowid, decoder.loads(zlib.decompress(data))
+
+    def iter_matches(self, since: int = None, until: int = None, **kwargs):
+        """Yield MatchDto ordered by game_datetime, kwargs are passed to MatchDto"""
+        for match in self.iter_raw(since, until):
+            yield MatchDto(match, **kwargs)
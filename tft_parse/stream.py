@@ -0,0 +1,168 @@
+"""Stream matches from files, directories or stdin
+
+Matches are read lazily so memory use does not depend on the input size. Supported inputs:
+
+    *.jsonl / *.ndjson: one match per line
+    *.json:             one match per file
+    *.gz:               gzip'd version of any of the above
+    '-':                newline-delimited matches from stdin
+
+Json is decoded with tft_parse.decoder.
+"""
+import gzip
+import sys
+from itertools import islice
+from pathlib import Path
+from .tft_api_class import MatchDto
+from .static_data import StaticData
+from . import decoder
+
+line_suffixes = ['.jsonl', '.ndjson']
+file_suffixes = ['.json']
+
+
+def _suffix(path: Path) -> str:
+    """File suffix ignoring .gz (e.g. matches.jsonl.gz -> .jsonl)"""
+    if path.suffix == '.gz':
+        return Path(path.stem).suffix
+    return path.suffix
+
+
+def _open(path: Path):
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def iter_files(source):
+    """Yield match files from a path, directory or list of them
+
+    Directories are walked recursively in sorted order, files with unsupported suffixes are ignored.
+    """
+    if isinstance(source, (str, Path)):
+        source = [source]
+    for path in source:
+        if str(path) == '-':
+            yield '-'
+            continue
+        path = Path(path)
+        if path.is_dir():
+            for file in sorted(path.rglob('*')):
+                if file.is_file() and _suffix(file) in line_suffixes + file_suffixes:
+                    yield file
+        elif path.is_file():
+            yield path
+        else:
+            raise ValueError(f"{path} does not exist")
+
+
+def iter_records(source):
+    """Yield raw match dicts from a path, directory, list of them or '-' for stdin"""
+    for path in iter_files(source):
+        # stdin
+        if path == '-':
+            yield from _iter_lines(sys.stdin.buffer)
+            continue
+        with _open(path) as f:
+            if _suffix(path) in file_suffixes:
+                yield decoder.loads(f.read())
+            else:
+                yield from _iter_lines(f)
+
+
+def iter_range(path, start: int = 0, end: int = None):
+    """Yield raw match dicts of the lines starting in [start, end) bytes of a plain (not gzip'd) jsonl file
+
+    Ranges from split_lines() cover every line of the file exactly once.
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            if end is not None and position >= end:
+                return
+            position += len(line)
+            if line.strip():
+                yield decoder.loads(line)
+
+
+def split_lines(path, pieces: int) -> list:
+    """Split a plain jsonl file into at most `pieces` (start, end) byte ranges aligned to line starts"""
+    size = Path(path).stat().st_size
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for piece in range(1, pieces):
+            f.seek(size * piece // pieces)
+            # Move to the start of the next line
+            f.readline()
+            position = f.tell()
+            if bounds[-1] < position < size:
+                bounds.append(position)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _iter_lines(f):
+    for line in f:
+        if line.strip():
+            yield decoder.loads(line)
+
+
+def iter_matches(source):
+    """Yield MatchDto from a path, directory, list of them or '-' for stdin"""
+    # Matches may come from several sets
+    StaticData.preload()
+    for record in iter_records(source):
+        yield MatchDto(record)
+
+
+def batched(iterable, size: int):
+    """Yield lists of at most `size` elements"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def feed(matches, champions=(), items=()) -> int:
+    """Parse every unit of every match into Champion and Item aggregators
+
+    Units of champions / items not passed in are ignored.
+
+    Args:
+        matches: Iterable of MatchDto, e.g. iter_matches()
+        champions: Iterable of Champion
+        items: Iterable of Item
+
+    Return:
+        Number of matches parsed
+    """
+    champions = {champion.championId: champion for champion in champions}
+    items = {item.item: item for item in items}
+    count = 0
+    for match in matches:
+        feed_match(match, champions, items)
+        count += 1
+
+    return count
+
+
+def feed_match(match: MatchDto, champions: dict, items: dict) -> None:
+    """Parse every unit of a match into Champion and Item aggregators
+
+    Args:
+        match: MatchDto
+        champions: dict of championId -> Champion
+        items: dict of item id -> Item
+    """
+    for unit in match.info.players_units():
+        champion = champions.get(unit.character_id)
+        if champion is not None:
+            champion.parse_unit(unit)
+        # Each item is only counted once per unit
+        for item_id in set(unit.items):
+            item = items.get(item_id)
+            if item is not None:
+                item.parse_unit(unit)
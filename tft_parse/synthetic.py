@@ -0,0 +1,132 @@
+"""Deterministic synthetic matches built from the set data
+
+Matches have the same shape as the Riot API's MatchDto: 8 participants with units drawn from the set's
+champions, 0 to 3 items each, one chosen unit and traits with num_units / style / tier computed from the
+units. The same seed always gives the same matches, e.g. for tests and benchmarks:
+
+    for data in generate_matches(1000, '4.5', seed=0):
+        match = MatchDto(data)
+"""
+import random
+from .misc import regions
+from .static_data import StaticData, style_map
+from . import current_tft_set
+
+# Patch played for each set
+set_patch = {'4': '10.20', '4.5': '11.2'}
+queue_ids = [1090, 1100]
+start_datetime = 1602503833015  # game_datetime of the first match, milliseconds
+# Value and cumulative weight of number of items per unit, unit star level and participant level
+_n_items, _n_items_weights = (0, 1, 2, 3), (4, 6, 8, 11)
+_tiers, _tiers_weights = (1, 2, 3), (5, 9, 10)
+_levels, _levels_weights = (5, 6, 7, 8, 9), (1, 3, 7, 12, 14)
+_style_ids = {style_name: style for style, style_name in style_map.items()}
+
+
+class MatchGenerator:
+    """Generate raw match dicts of a set
+
+    Args:
+        tft_set_number: Set of the static data, must be in `set_patch`
+        seed: Random seed, match `i` only depends on the seed and `i`
+    """
+
+    def __init__(self, tft_set_number=current_tft_set, seed: int = 0):
+        key = str(tft_set_number)
+        if key not in set_patch:
+            raise ValueError(f"Set {tft_set_number} does not exist")
+        static_data = StaticData.get(key)
+        self.seed = seed
+        self.tft_set_number = int(float(key))  # API reports mid-set updates with the base set number
+        self.patch = set_patch[key]
+        # Champions sold in the shop, e.g. not the training dummy
+        self.champions = [champion for champion in static_data.champion_list if champion['traits']]
+        self.traits = static_data.traits
+        # Completed items, components (id < 10) are rarely kept on units
+        self.items = [item['id'] for item in static_data.item_list if 10 <= item['id'] < 100]
+        self.components = [item['id'] for item in static_data.item_list if item['id'] < 10]
+
+    def _trait(self, key: str, num_units: int) -> dict:
+        """TraitDto of a trait with num_units units"""
+        sets = self.traits[key]['sets'] if key in self.traits else []
+        tier_current = sum(num_units >= trait_set['min'] for trait_set in sets)
+        style = _style_ids[sets[tier_current - 1]['style']] if tier_current else 0
+        return {
+            'name': key,
+            'num_units': num_units,
+            'style': style,
+            'tier_current': tier_current,
+            'tier_total': len(sets),
+        }
+
+    def _unit(self, rng: random.Random, champion: dict) -> dict:
+        n_items = rng.choices(_n_items, cum_weights=_n_items_weights)[0]
+        items = [rng.choice(self.items if rng.random() < 0.9 else self.components) for _ in range(n_items)]
+        return {
+            'character_id': champion['championId'],
+            'items': items,
+            'name': '',
+            'rarity': champion['cost'] - 1,
+            'tier': rng.choices(_tiers, cum_weights=_tiers_weights)[0],
+        }
+
+    def _participant(self, rng: random.Random, placement: int) -> dict:
+        level = rng.choices(_levels, cum_weights=_levels_weights)[0]
+        board = rng.sample(self.champions, level)
+        units = [self._unit(rng, champion) for champion in board]
+        # One chosen unit, adding one to one of its traits
+        trait_units = {}
+        for champion in board:
+            for key in champion['traits']:
+                trait_units[key] = trait_units.get(key, 0) + 1
+        chosen = rng.randrange(level)
+        chosen_trait = rng.choice(board[chosen]['traits'])
+        units[chosen]['chosen'] = chosen_trait
+        trait_units[chosen_trait] += 1
+        return {
+            'companion': {'content_ID': f'{rng.getrandbits(128):032x}', 'skin_ID': rng.randrange(1, 10),
+                          'species': 'PetAoShin'},
+            'gold_left': rng.randrange(0, 60),
+            'last_round': 40 - 2 * placement + rng.randrange(0, 3),
+            'level': level,
+            'placement': placement,
+            'players_eliminated': rng.randrange(0, 3) if placement <= 4 else 0,
+            'puuid': f'{rng.getrandbits(312):078x}',
+            'time_eliminated': 2200.0 - 150 * placement + rng.random() * 60,
+            'total_damage_to_players': rng.randrange(0, 200),
+            'traits': [self._trait(key, num_units) for key, num_units in sorted(trait_units.items())],
+            'units': units,
+        }
+
+    def match(self, index: int) -> dict:
+        """Raw match dict of match `index`"""
+        rng = random.Random(self.seed * 1000003 + index)
+        participants = [self._participant(rng, placement) for placement in range(1, 9)]
+        rng.shuffle(participants)
+        region = regions[index % len(regions)]
+        return {
+            'metadata': {
+                'data_version': '5',
+                'match_id': f'{region}_{index}',
+                'participants': [participant['puuid'] for participant in participants],
+            },
+            'info': {
+                'game_datetime': start_datetime + index * 1000,
+                'game_length': 2000.0 + rng.random() * 400,
+                'game_version': f'Version {self.patch}.338.336 (Oct 01 2020/06:14:57) [PUBLIC] '
+                                f'<Releases/{self.patch}>',
+                'participants': participants,
+                'queue_id': rng.choice(queue_ids),
+                'tft_set_number': self.tft_set_number,
+            },
+        }
+
+    def matches(self, n: int, start: int = 0):
+        """Yield raw match dicts of matches start to start + n"""
+        for index in range(start, start + n):
+            yield self.match(index)
+
+
+def generate_matches(n: int, tft_set_number=current_tft_set, seed: int = 0):
+    """Yield `n` raw match dicts, see MatchGenerator"""
+    return MatchGenerator(tft_set_number, seed).matches(n)
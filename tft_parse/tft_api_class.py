@@ -1,19 +1,71 @@
 import re
+import gzip
 from datetime import datetime
+from functools import lru_cache
 from itertools import chain
+from pathlib import Path
 from .misc import route_region
-from .trait import Traits
+from . import decoder
+from .static_data import StaticData, resolve_set
 from . import current_tft_set
 
+region_regex = re.compile(r'(.*?)_')
+patch_regex = re.compile(r'<Releases/(.*?)>')
+queues = {
+    1090: 'Normal',
+    1100: 'Rank',
+    1111: 'Test',
+    1110: 'Tutorial'
+}
+
+
+@lru_cache(maxsize=256)
+def parse_patch(game_version: str) -> str:
+    """Get patch number from game_version, cached as game_version repeats across matches"""
+    match = patch_regex.search(game_version)
+    if match is None:
+        raise ValueError(f"Unable to regex match {game_version}")
+    return match.group(1)
+
 
 class MatchDto:
+    """MatchDto
+
+    All DTO classes use __slots__ to keep memory low when parsing many matches. Pass `keep_data=False`
+    to drop the reference to the raw match dict after parsing.
 
-    def __init__(self, match: dict):
-        self.data = match
+    Pass `lazy=True` to only parse metadata and match info up front, participants and their units / traits
+    are parsed when first accessed.
+    """
+    __slots__ = ('data', 'metadata', 'info')
+
+    def __init__(self, match: dict, keep_data: bool = True, lazy: bool = False):
+        self.data = match if keep_data else None
         self.metadata = MetadataDto(match['metadata'])
-        self.info = InfoDto(match['info'])
+        self.info = InfoDto(match['info'], keep_data, lazy)
+
+    @classmethod
+    def from_bytes(cls, raw, **kwargs) -> 'MatchDto':
+        """Parse json str / bytes with tft_parse.decoder, kwargs are passed to MatchDto"""
+        return cls(decoder.loads(raw), **kwargs)
+
+    @classmethod
+    def from_file(cls, path, **kwargs) -> 'MatchDto':
+        """Parse a json (or gzip'd json) file containing one match, kwargs are passed to MatchDto"""
+        path = Path(path)
+        with (gzip.open(path, 'rb') if path.suffix == '.gz' else open(path, 'rb')) as f:
+            return cls.from_bytes(f.read(), **kwargs)
+
+    @staticmethod
+    def parse_many(records, workers: int = None, backend: str = 'process', chunksize: int = 256,
+                   ordered: bool = True, **kwargs):
+        """Yield MatchDto parsed from raw match dicts or json str / bytes with a pool, see tft_parse.parallel"""
+        from .parallel import parse_many
+        return parse_many(records, workers, backend, chunksize, ordered, **kwargs)
 
     def to_dict(self):
+        if self.data is None:
+            raise ValueError("Raw data is not kept, parse with keep_data=True")
         data = self.data
         # Add other data
         data['region'] = self.metadata.region
@@ -25,6 +77,7 @@ class MatchDto:
 
 
 class MetadataDto:
+    __slots__ = ('data_version', 'match_id', 'participants', 'region', 'route_region')
 
     def __init__(self, data: dict):
         self.data_version = data['data_version']
@@ -35,11 +88,10 @@ class MetadataDto:
 
     def get_region(self):
         """Get region from match_id"""
-        region_regex = re.findall(r'(.*?)_', self.match_id)
-        if len(region_regex) > 0:
-            return region_regex[0]
-        else:
+        match = region_regex.match(self.match_id)
+        if match is None:
             raise ValueError(f"Unable to regex match {self.match_id}")
+        return match.group(1)
 
     def get_route_region(self):
         """Get routing region from match_id"""
@@ -47,8 +99,10 @@ class MetadataDto:
 
 
 class InfoDto:
+    __slots__ = ('game_datetime', 'game_length', 'game_version', 'queue_id', 'patch', 'queue', 'tft_set_number',
+                 '_participants', '_raw_participants', '_keep_data', '_lazy')
 
-    def __init__(self, data: dict):
+    def __init__(self, data: dict, keep_data: bool = True, lazy: bool = False):
         self.game_datetime = data['game_datetime']
         self.game_length = data['game_length']
         self.game_version = data['game_version']
@@ -57,35 +111,38 @@ class InfoDto:
         self.patch = self.get_patch()
         self.queue = self.get_queue()
         self.tft_set_number = self.check_set_number(data['tft_set_number'], self.patch)
-        self.participants = [ParticipantDto(participant, self.tft_set_number) for participant in data['participants']]
+        # Participants, parsed on first access if lazy
+        self._participants = None
+        self._raw_participants = data['participants']
+        self._keep_data = keep_data
+        self._lazy = lazy
+        if not lazy:
+            self._participants = self.participants
+
+    @property
+    def participants(self):
+        """List of ParticipantDto"""
+        if self._participants is None:
+            self._participants = [
+                ParticipantDto(participant, self.tft_set_number, self._keep_data, self._lazy)
+                for participant in self._raw_participants
+            ]
+            self._raw_participants = None
+        return self._participants
 
     @staticmethod
     def check_set_number(set_number, patch):
-        """Update set number to 4.5"""
+        """Update set number of mid-set updates (e.g. 4 -> 4.5), see static_data.set_patches"""
         # Set number for patch 4.5 is still 4, so need to manually override
-        if set_number == 4 and patch >= '11.2':
-            return '4.5'
-        else:
-            return set_number
+        return resolve_set(set_number, patch)
 
     def get_patch(self):
         """Get patch number"""
-        patch_regex = re.findall(r'<Releases/(.*?)>', self.game_version)
-        if len(patch_regex) > 0:
-            return patch_regex[0]
-        else:
-            raise ValueError(f"Unable to regex match {self.game_version}")
+        return parse_patch(self.game_version)
 
     def get_queue(self):
         """Parse game's type"""
-        queue_id = int(self.queue_id)
-        queue_dict = {
-            1090: 'Normal',
-            1100: 'Rank',
-            1111: 'Test',
-            1110: 'Tutorial'
-        }
-        return queue_dict[queue_id]
+        return queues[int(self.queue_id)]
 
     def get_game_date(self):
         """Get game's datetime"""
@@ -141,17 +198,20 @@ class InfoDto:
         for participant in self.participants:
             part_traits = []
             for trait in participant.traits:
-                if trait.trait_tier() is not None:
-                    part_traits.append(trait.trait_tier())
+                if trait.tier_name is not None:
+                    part_traits.append(trait.tier_name)
             output[participant.puuid] = part_traits
 
         return output
 
 
 class ParticipantDto:
+    __slots__ = ('data', 'companion', 'gold_left', 'last_round', 'level', 'placement', 'players_eliminated', 'puuid',
+                 'time_eliminated', 'total_damage_to_players', 'tft_set_number', '_traits', '_units', '_raw_traits',
+                 '_raw_units')
 
-    def __init__(self, data: dict, tft_set_number: int = current_tft_set):
-        self.data = data
+    def __init__(self, data: dict, tft_set_number: int = current_tft_set, keep_data: bool = True, lazy: bool = False):
+        self.data = data if keep_data else None
         self.companion = data['companion']
         self.gold_left = data["gold_left"]
         self.last_round = data["last_round"]
@@ -161,8 +221,31 @@ class ParticipantDto:
         self.puuid = data["puuid"]
         self.time_eliminated = data["time_eliminated"]
         self.total_damage_to_players = data["total_damage_to_players"]
-        self.traits = [TraitDto(trait, tft_set_number) for trait in data['traits']]
-        self.units = [UnitDto(unit) for unit in data['units']]
+        self.tft_set_number = tft_set_number
+        # Traits and units, parsed on first access if lazy
+        self._traits = None
+        self._units = None
+        self._raw_traits = data['traits']
+        self._raw_units = data['units']
+        if not lazy:
+            self._traits = self.traits
+            self._units = self.units
+
+    @property
+    def traits(self):
+        """List of TraitDto"""
+        if self._traits is None:
+            self._traits = [TraitDto(trait, self.tft_set_number) for trait in self._raw_traits]
+            self._raw_traits = None
+        return self._traits
+
+    @property
+    def units(self):
+        """List of UnitDto"""
+        if self._units is None:
+            self._units = [UnitDto(unit) for unit in self._raw_units]
+            self._raw_units = None
+        return self._units
 
 
 class TraitDto:
@@ -174,6 +257,7 @@ class TraitDto:
     tier_current: Current active tier for the trait.
     tier_total:	  Total tiers for the trait.
     """
+    __slots__ = ('name', 'num_units', 'style', 'tier_current', 'tier_total', 'set_number', 'tier_name')
 
     def __init__(self, data: dict, tft_set_number: int = current_tft_set):
         self.name = data["name"]
@@ -186,7 +270,7 @@ class TraitDto:
 
     def trait_tier(self):
         """Trait level"""
-        return Traits(self.set_number).get_trait_style(self.name, self.style)
+        return StaticData.get(self.set_number).trait_tier(self.name, self.style)
 
 
 class UnitDto:
@@ -195,6 +279,7 @@ class UnitDto:
     tier: star
     rarity: unit rarity
     """
+    __slots__ = ('items', 'character_id', 'chosen', 'rarity', 'tier')
 
     def __init__(self, data: dict):
         self.items = sorted(data['items'])
@@ -1,17 +1,12 @@
-import json
-import pkg_resources
-from pathlib import Path
+from .static_data import StaticData, style_map
 from . import current_tft_set
 
 
 class Traits:
     def __init__(self, tft_set_number: int = current_tft_set):
-        # Get data path
-        data_path = Path(pkg_resources.resource_filename('tft_parse', f'data/{tft_set_number}'))
-        # Open trait files
-        with open(data_path.joinpath('traits.json')) as f:
-            self.data = json.load(f)
-        self.style_map = {0: 'none', 1: 'bronze', 2: 'silver', 3: 'gold', 4: 'chromatic'}
+        # Get trait data
+        self.data = StaticData.get(tft_set_number).trait_list
+        self.style_map = style_map
         # Loop each trait and append to class
         for trait_info in self.data:
             self.__setattr__(trait_info['key'], Trait(trait_info))
@@ -35,7 +30,6 @@ class Trait:
         """Return str like Cultist"""
         if style == 0:
             return None
-        style_map = {0: 'none', 1: 'bronze', 2: 'silver', 3: 'gold', 4: 'chromatic'}
         style_name = style_map[style]
         try:
             style_min = self.__getattribute__(style_name)['min']
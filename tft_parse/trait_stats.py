@@ -0,0 +1,194 @@
+"""Trait activation statistics
+
+Every (trait, tier_current) pair of a set gets an integer tier id from StaticData, tier 0 being an inactive
+trait. Counters are numpy arrays indexed by tier id and are updated in bulk from a MatchBatch:
+
+    stats = TraitStats('4.5')
+    stats.update(matches)
+    stats.to_dict()['Cultist']['tiers'][2]  # Cultist_6: count, frequency, avg_placement, num_units, ...
+
+Requires numpy (`pip install tft_parse[numpy]`).
+"""
+import numpy as np
+from .batch import MatchBatch
+from .static_data import StaticData
+from .stream import batched
+from . import current_tft_set
+
+
+class TraitStats:
+    """Activation frequency, placement and num_units distribution per trait tier
+
+    Tier ids:
+        trait_keys:  trait key of each trait code
+        tier_keys:   (trait key, tier_current) of each tier id
+        tier_names:  tier name of each tier id (e.g. Cultist_6), None for tier 0
+        tier_offset: first tier id of each trait code, tier id = tier_offset[trait code] + tier_current
+        tier_total:  number of tiers of each trait code
+
+    Counters (indexed by tier id):
+        count:         number of participants
+        placement_sum: sum of placements
+        top4:          number of top 4 placements
+        win:           number of wins
+        num_units:     (tier ids, units) number of participants with the trait at each number of units
+
+    Traits not in the set data are skipped, traits with a tier_current out of range are skipped and counted in
+    `invalid`.
+    """
+
+    def __init__(self, tft_set_number=current_tft_set):
+        static_data = StaticData.get(tft_set_number)
+        self.tft_set_number = tft_set_number
+        self.trait_keys = [trait['key'] for trait in static_data.trait_list]
+        self.tier_keys = []
+        self.tier_names = []
+        tier_offset = []
+        tier_total = []
+        for trait in static_data.trait_list:
+            tier_offset.append(len(self.tier_keys))
+            tier_total.append(len(trait['sets']))
+            self.tier_keys.append((trait['key'], 0))
+            self.tier_names.append(None)
+            for tier, trait_set in enumerate(trait['sets'], 1):
+                self.tier_keys.append((trait['key'], tier))
+                self.tier_names.append(f"{trait['key']}_{trait_set['min']}")
+        self.tier_offset = np.array(tier_offset, dtype=np.int64)
+        self.tier_total = np.array(tier_total, dtype=np.int64)
+        self._trait_index = {key: code for code, key in enumerate(self.trait_keys)}
+        n = len(self.tier_keys)
+        self.count = np.zeros(n, dtype=np.int64)
+        self.placement_sum = np.zeros(n, dtype=np.int64)
+        self.top4 = np.zeros(n, dtype=np.int64)
+        self.win = np.zeros(n, dtype=np.int64)
+        self.num_units = np.zeros((n, 1), dtype=np.int64)
+        self.matches = 0
+        self.participants = 0
+        self.invalid = 0
+
+    def tier_id(self, key: str, tier: int) -> int:
+        """Tier id of a trait at tier_current"""
+        code = self._trait_index.get(key)
+        if code is None:
+            raise ValueError(f"{key} does not exist")
+        if not 0 <= tier <= self.tier_total[code]:
+            raise ValueError(f"{tier} is not a valid tier of {key}")
+        return int(self.tier_offset[code] + tier)
+
+    def _resize_num_units(self, size: int) -> None:
+        if size > self.num_units.shape[1]:
+            self.num_units = np.pad(self.num_units, ((0, 0), (0, size - self.num_units.shape[1])))
+
+    def update_batch(self, batch: MatchBatch) -> int:
+        """Add every trait of a MatchBatch, matches must be from this set
+
+        Traits not in the set data or with an invalid tier_current are skipped.
+
+        Return:
+            Number of traits counted
+        """
+        # Batch trait code -> trait code of the set
+        lookup = np.array([self._trait_index.get(key, -1) for key in batch.trait_keys], dtype=np.int64)
+        code = lookup[batch.trait_key] if len(lookup) else batch.trait_key
+        known = code >= 0
+        tier = batch.trait_tier_current
+        valid = np.zeros(len(known), dtype=bool)
+        valid[known] = (tier[known] >= 0) & (tier[known] <= self.tier_total[code[known]])
+        self.invalid += int(known.sum() - valid.sum())
+        tier_id = self.tier_offset[code[valid]] + tier[valid]
+        placement = batch.trait_placement[valid]
+        num_units = batch.trait_num_units[valid]
+
+        n = len(self.tier_keys)
+        self.count += np.bincount(tier_id, minlength=n)
+        self.placement_sum += np.bincount(tier_id, weights=placement, minlength=n).astype(np.int64)
+        self.top4 += np.bincount(tier_id[placement <= 4], minlength=n)
+        self.win += np.bincount(tier_id[placement == 1], minlength=n)
+        if len(num_units):
+            self._resize_num_units(int(num_units.max()) + 1)
+            width = self.num_units.shape[1]
+            self.num_units += np.bincount(tier_id * width + num_units, minlength=n * width).reshape(n, width)
+        self.matches += len(batch.match_ids)
+        self.participants += batch.n_participants
+        return len(tier_id)
+
+    def update(self, matches, batch_size: int = 10000) -> int:
+        """Add every trait of an iterable of MatchDto, matches of other sets are skipped
+
+        Args:
+            matches: Iterable of MatchDto, read `batch_size` matches at a time
+            batch_size: Number of matches per MatchBatch
+
+        Return:
+            Number of matches counted
+        """
+        count = 0
+        tft_set_number = str(self.tft_set_number)
+        for chunk in batched(matches, batch_size):
+            chunk = [match for match in chunk if str(match.info.tft_set_number) == tft_set_number]
+            if chunk:
+                self.update_batch(MatchBatch(chunk))
+                count += len(chunk)
+        return count
+
+    def merge(self, other: 'TraitStats') -> 'TraitStats':
+        """Add counters from another TraitStats of the same set
+
+        Return:
+            self
+        """
+        if str(other.tft_set_number) != str(self.tft_set_number):
+            raise ValueError(f"Set {other.tft_set_number} is not the same as {self.tft_set_number}")
+        self.count += other.count
+        self.placement_sum += other.placement_sum
+        self.top4 += other.top4
+        self.win += other.win
+        self._resize_num_units(other.num_units.shape[1])
+        self.num_units[:, :other.num_units.shape[1]] += other.num_units
+        self.matches += other.matches
+        self.participants += other.participants
+        self.invalid += other.invalid
+
+        return self
+
+    def frequency(self) -> np.ndarray:
+        """Fraction of participants with each tier id"""
+        return self.count / max(self.participants, 1)
+
+    def avg_placement(self) -> np.ndarray:
+        """Average placement of each tier id, nan if never seen"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.placement_sum / self.count
+
+    def to_dict(self) -> dict:
+        """Stats of every trait tier
+
+        Return:
+            dict of trait key -> {'tier_total', 'tiers': {tier_current -> stats}}, only tiers seen are listed
+        """
+        safe_count = np.maximum(self.count, 1)
+        frequency = self.frequency()
+        avg_placement = self.placement_sum / safe_count
+        top4_rate = self.top4 / safe_count
+        win_rate = self.win / safe_count
+        output = {}
+        for code, key in enumerate(self.trait_keys):
+            tiers = {}
+            for tier in range(self.tier_total[code] + 1):
+                tier_id = self.tier_offset[code] + tier
+                if self.count[tier_id] == 0:
+                    continue
+                tiers[tier] = {
+                    'name': self.tier_names[tier_id],
+                    'count': int(self.count[tier_id]),
+                    'frequency': float(frequency[tier_id]),
+                    'avg_placement': float(avg_placement[tier_id]),
+                    'top4_rate': float(top4_rate[tier_id]),
+                    'win_rate': float(win_rate[tier_id]),
+                    'num_units': {
+                        int(units): int(self.num_units[tier_id, units])
+                        for units in np.flatnonzero(self.num_units[tier_id])
+                    },
+                }
+            output[key] = {'tier_total': int(self.tier_total[code]), 'tiers': tiers}
+        return output